@@ -0,0 +1 @@
+"""Performance benchmarks for floyd (run as `python -m benchmarks.<name>`)."""
@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from floyd.adapters.outbound.ai.ai_adapter import AIAdapter
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.ai.claude_session_adapter import ClaudeSessionAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.refinement import Refinement
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+
+FAKES = Path(__file__).resolve().parent / "fakes"
+
+
+def _context(diff_kilobytes: int) -> GitContext:
+    files = []
+    for index in range(max(diff_kilobytes // 4, 1)):
+        lines = "".join(f"+    value_{line} = compute({line})\n" for line in range(100))
+        files.append(
+            f"diff --git a/src/module_{index}.py b/src/module_{index}.py\n"
+            f"--- a/src/module_{index}.py\n+++ b/src/module_{index}.py\n"
+            f"@@ -1,0 +1,100 @@\n{lines}"
+        )
+    return GitContext(
+        current_branch=Branch(name="feature/session"),
+        target_branch=Branch(name="main"),
+        commits="abc1234 add session support",
+        diff="".join(files),
+        diff_stat=f" {len(files)} files changed",
+    )
+
+
+def _run(adapter: AIAdapter, context: GitContext, refinements: int, full_refine: bool) -> float:
+    config = AIConfig(provider=ProviderType.CLAUDE, full_refine=full_refine)
+    start = time.perf_counter()
+    pr = adapter.generate_pr(context, config, on_partial=lambda _: None)
+    feedback: tuple[str, ...] = ()
+    for round_ in range(refinements):
+        feedback = (*feedback, f"mention change {round_}")
+        refinement = Refinement(title=pr.title, body=pr.body, feedback=feedback)
+        pr = adapter.generate_pr(context, config, refinement, on_partial=lambda _: None)
+    return time.perf_counter() - start
+
+
+def _sent(log: Path) -> tuple[int, int]:
+    entries = [json.loads(line) for line in log.read_text().splitlines()]
+    return len({entry["pid"] for entry in entries}), sum(entry["chars"] for entry in entries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Full vs delta refinement prompts, and one `claude` process per call vs one session per workflow."
+    )
+    parser.add_argument("--refinements", type=int, default=5)
+    parser.add_argument("--kilobytes", type=int, default=256, help="size of the synthetic diff")
+    parser.add_argument("--startup", type=float, default=0.4, help="simulated CLI start-up in seconds")
+    args = parser.parse_args()
+
+    context = _context(args.kilobytes)
+    workdir = Path(tempfile.mkdtemp(prefix="floyd-session-"))
+    os.environ["PATH"] = f"{FAKES}{os.pathsep}{os.environ['PATH']}"
+    os.environ["FAKE_CLAUDE_STARTUP"] = str(args.startup)
+
+    print(f"1 draft + {args.refinements} refinements, {len(context.diff) // 1024} KB diff, {args.startup}s CLI start-up")
+    runs: list[tuple[str, type[AIAdapter], bool]] = [
+        ("full", ClaudeAdapter, True),
+        ("delta", ClaudeAdapter, False),
+        ("session", ClaudeSessionAdapter, False),
+    ]
+    for label, adapter_class, full_refine in runs:
+        log = workdir / f"{label}.jsonl"
+        os.environ["FAKE_CLAUDE_LOG"] = str(log)
+
+        adapter = adapter_class(Terminal())
+        elapsed = _run(adapter, context, args.refinements, full_refine)
+        if isinstance(adapter, ClaudeSessionAdapter):
+            adapter.close()
+
+        processes, chars = _sent(log)
+        print(f"  {label:<9} {elapsed:6.2f} s   processes {processes:>3}   prompt chars sent {chars:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import random
+import time
+
+from floyd.adapters.outbound.ai.diff_budget import CHARS_PER_TOKEN, allocate_diff, parse_diff
+
+
+def _file_diff(path: str, hunks: int, lines: int, rng: random.Random) -> str:
+    parts = [
+        f"diff --git a/{path} b/{path}\n",
+        "index 3b18e51..a9c2f4d 100644\n",
+        f"--- a/{path}\n",
+        f"+++ b/{path}\n",
+    ]
+    for hunk in range(hunks):
+        start = hunk * (lines + 10) + 1
+        parts.append(f"@@ -{start},{lines} +{start},{lines} @@ def section_{hunk}():\n")
+        for line in range(lines):
+            if rng.random() < 0.2:
+                parts.append(f"-    value_{hunk}_{line} = compute({line})\n")
+                parts.append(f"+    value_{hunk}_{line} = compute({line}, cache=True)\n")
+            else:
+                parts.append(f"     value_{hunk}_{line} = {line}\n")
+    return "".join(parts)
+
+
+def synthetic_diff(megabytes: float, files: int = 200, seed: int = 7) -> str:
+    """A branch diff dominated by one vendored file, like a dependency bump."""
+    rng = random.Random(seed)
+    parts = [
+        _file_diff(f"src/app/module_{index}.py", hunks=rng.randint(1, 6), lines=12, rng=rng)
+        for index in range(files)
+    ]
+    remaining = int(megabytes * 1024 * 1024) - sum(len(part) for part in parts)
+    vendored = _file_diff("vendor/bundle.js", hunks=max(remaining // 2200, 1), lines=40, rng=rng)
+
+    # git lists paths alphabetically, so the vendored file lands in the middle.
+    middle = files // 2
+    return "".join([*parts[:middle], vendored, *parts[middle:]])
+
+
+def _truncate(diff: str, limit: int) -> str:
+    return diff[:limit] + "\n\n[... DIFF TRUNCATED ...]"
+
+
+def _coverage(text: str) -> tuple[int, int]:
+    files = parse_diff(text)
+    with_hunks = sum(1 for file_diff in files if file_diff.hunks)
+    return len(files), with_hunks
+
+
+def _best_of(runs: int, action) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Blind truncation vs the per-file diff budget allocator.")
+    parser.add_argument("--megabytes", type=float, nargs="+", default=[1.0, 4.0, 16.0])
+    parser.add_argument("--files", type=int, default=200, help="source files next to the vendored one")
+    parser.add_argument("--limit", type=int, default=50000, help="diff_limit in characters")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    tokens = args.limit // CHARS_PER_TOKEN
+    print(f"diff_limit: {args.limit} chars (~{tokens} tokens)")
+    print(f"{'diff':>8} {'files':>6} | {'strategy':<10} {'time':>9} {'output':>9} {'files seen':>10} {'with hunks':>10}")
+
+    for megabytes in args.megabytes:
+        diff = synthetic_diff(megabytes, files=args.files)
+        total_files, _ = _coverage(diff)
+
+        for label, action in (
+            ("truncate", lambda: _truncate(diff, args.limit)),
+            ("allocate", lambda: allocate_diff(diff, tokens)),
+        ):
+            elapsed = _best_of(args.runs, action)
+            output = action()
+            seen, with_hunks = _coverage(output)
+            print(
+                f"{len(diff) / 1024 / 1024:6.1f}MB {total_files:>6} | {label:<10} "
+                f"{elapsed * 1000:7.1f}ms {len(output):>9} {seen:>10} {with_hunks:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
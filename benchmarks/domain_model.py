@@ -0,0 +1,122 @@
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from pydantic import BaseModel, Field, field_validator
+
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.value_objects.branch import Branch
+
+
+# The previous pydantic models, kept here for comparison only.
+class PydanticBranch(BaseModel):
+    name: str
+
+    model_config = {"frozen": True}
+
+    @field_validator("name")
+    @classmethod
+    def validate_name(cls, v: str) -> str:
+        if not v or not v.strip():
+            raise ValueError("Branch name cannot be empty")
+        v = v.strip()
+        if v.startswith("-") or ".." in v or v.endswith(".lock"):
+            raise ValueError("Invalid branch name")
+        return v
+
+
+class PydanticGitContext(BaseModel):
+    current_branch: PydanticBranch
+    target_branch: PydanticBranch
+    commits: str = Field(default="")
+    diff: str = Field(default="")
+    diff_stat: str = Field(default="")
+
+
+class PydanticPullRequest(BaseModel):
+    title: str = Field(..., min_length=1, max_length=256)
+    body: str = Field(default="")
+    head_branch: str = Field(..., min_length=1)
+
+    @field_validator("title", "head_branch")
+    @classmethod
+    def validate_stripped(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("cannot be empty")
+        return v
+
+    @field_validator("body")
+    @classmethod
+    def validate_body(cls, v: str) -> str:
+        return v.strip()
+
+
+def _best_of(runs: int, action: Callable[[], Any]) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _allocated(count: int, factory: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pydantic models vs slotted frozen dataclasses.")
+    parser.add_argument("--megabytes", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print("GitContext construction (best of runs)")
+    for megabytes in args.megabytes:
+        diff = "+ changed line\n" * (megabytes * 1024 * 1024 // 15)
+        old = _best_of(
+            args.runs,
+            lambda: PydanticGitContext(
+                current_branch=PydanticBranch(name="feature"),
+                target_branch=PydanticBranch(name="main"),
+                diff=diff,
+                diff_stat=diff[:4096],
+            ),
+        )
+        new = _best_of(
+            args.runs,
+            lambda: GitContext(
+                current_branch=Branch(name="feature"),
+                target_branch=Branch(name="main"),
+                diff=diff,
+                diff_stat=diff[:4096],
+            ),
+        )
+        print(f"  {megabytes:>4} MB diff   pydantic {old * 1e6:9.1f} us   dataclass {new * 1e6:9.1f} us")
+
+    count = args.objects
+    print(f"\n{count} PullRequest drafts")
+    old = _best_of(3, lambda: [PydanticPullRequest(title=f" t{i} ", body="b", head_branch="f") for i in range(count)])
+    new = _best_of(3, lambda: [PullRequest(title=f" t{i} ", body="b", head_branch="f") for i in range(count)])
+    print(f"  construction   pydantic {old * 1000:9.1f} ms   dataclass {new * 1000:9.1f} ms")
+
+    old_bytes = _allocated(count, lambda i: PydanticPullRequest(title=f"t{i}", head_branch="f"))
+    new_bytes = _allocated(count, lambda i: PullRequest(title=f"t{i}", head_branch="f"))
+    print(f"  bytes/object   pydantic {old_bytes:9.1f}      dataclass {new_bytes:9.1f}")
+
+    old_bytes = _allocated(count, lambda i: PydanticBranch(name=f"b{i}"))
+    new_bytes = _allocated(count, lambda i: Branch(name=f"b{i}"))
+    print(f"  Branch bytes   pydantic {old_bytes:9.1f}      dataclass {new_bytes:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
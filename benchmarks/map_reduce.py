@@ -0,0 +1,140 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.diff_budget import synthetic_diff
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.exceptions.domain_exception import DomainException
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+
+FAKES = Path(__file__).resolve().parent / "fakes"
+
+
+def _context(megabytes: float, files: int) -> GitContext:
+    diff = synthetic_diff(megabytes, files=files)
+    return GitContext(
+        current_branch=Branch(name="feature/map-reduce"),
+        target_branch=Branch(name="main"),
+        commits="abc1234 bump the vendored bundle",
+        diff=diff,
+        diff_stat=f" {diff.count('diff --git ')} files changed",
+    )
+
+
+def _entries(log: Path) -> list[dict[str, object]]:
+    if not log.exists():
+        return []
+    return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+def _peak(entries: list[dict[str, object]]) -> int:
+    # The most summary calls that were running at the same moment.
+    events = sorted(
+        (time_, step)
+        for entry in entries
+        if entry["mode"] == "summary-end"
+        for time_, step in ((entry["start"], 1), (entry["end"], -1))
+    )
+    peak = running = 0
+    for _, step in events:
+        running += step
+        peak = max(peak, running)
+    return peak
+
+
+def _fake_processes() -> int:
+    result = subprocess.run(["ps", "-eo", "args"], capture_output=True, text=True)
+    return sum(1 for line in result.stdout.splitlines() if str(FAKES / "claude") in line)
+
+
+def _run(context: GitContext, config: AIConfig, log: Path) -> tuple[float, str]:
+    os.environ["FAKE_CLAUDE_LOG"] = str(log)
+    adapter = ClaudeAdapter(Terminal())
+
+    start = time.perf_counter()
+    pr = adapter.generate_pr(context, config)
+    elapsed = time.perf_counter() - start
+
+    stats = adapter.last_generation_stats()
+    assert stats.map_parts > 1, "the diff was not split"
+    return elapsed, pr.body
+
+
+def _check_coverage(context: GitContext, body: str) -> int:
+    files = set(re.findall(r"^diff --git a/(\S+)", context.diff, re.MULTILINE))
+    missing = [name for name in files if f"- {name}" not in body]
+    assert not missing, f"{len(missing)} file(s) missing from the draft, e.g. {missing[0]}"
+    return len(files)
+
+
+def _check_failure(context: GitContext, config: AIConfig, log: Path) -> float:
+    os.environ["FAKE_CLAUDE_FAIL_PART"] = "2"
+    try:
+        start = time.perf_counter()
+        try:
+            _run(context, config, log)
+        except DomainException:
+            pass
+        else:
+            raise AssertionError("a failing summary did not fail the generation")
+        elapsed = time.perf_counter() - start
+    finally:
+        del os.environ["FAKE_CLAUDE_FAIL_PART"]
+
+    assert _fake_processes() == 0, "summary processes outlived the failure"
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Map-reduce generation over a fake `claude`: sequential vs parallel summaries."
+    )
+    parser.add_argument("--megabytes", type=float, default=2.0, help="size of the synthetic diff")
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="characters per summary prompt")
+    parser.add_argument("--jobs", type=int, default=4)
+    parser.add_argument("--startup", type=float, default=1.0, help="simulated provider latency in seconds")
+    args = parser.parse_args()
+
+    context = _context(args.megabytes, args.files)
+    workdir = Path(tempfile.mkdtemp(prefix="floyd-map-reduce-"))
+    os.environ["PATH"] = f"{FAKES}{os.pathsep}{os.environ['PATH']}"
+    os.environ["FAKE_CLAUDE_STARTUP"] = str(args.startup)
+
+    print(
+        f"{len(context.diff) / (1024 * 1024):.1f} MB diff, chunks of {args.chunk_size:,} chars, "
+        f"{args.startup}s per CLI call"
+    )
+    for jobs in dict.fromkeys((1, args.jobs)):
+        config = AIConfig(
+            provider=ProviderType.CLAUDE,
+            map_reduce=True,
+            chunk_size=args.chunk_size,
+            map_jobs=jobs,
+        )
+        log = workdir / f"jobs{jobs}.jsonl"
+
+        elapsed, body = _run(context, config, log)
+        entries = _entries(log)
+        calls = sum(1 for entry in entries if entry["mode"] == "summary")
+        peak = _peak(entries)
+        assert peak <= jobs, f"{peak} summaries ran at once with {jobs} job(s)"
+        files = _check_coverage(context, body)
+
+        failed = _check_failure(context, config, workdir / f"failing-{log.name}")
+        print(
+            f"  jobs {jobs:<3} {elapsed:6.2f} s   summaries {calls:>3}   peak {peak}   "
+            f"files covered {files}   failure surfaced in {failed:.2f} s"
+        )
+
+if __name__ == "__main__":
+    main()
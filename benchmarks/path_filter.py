@@ -0,0 +1,60 @@
+import argparse
+import random
+import time
+
+from benchmarks.diff_budget import synthetic_diff
+from floyd.adapters.outbound.git.diff_stat import format_stat, parse_patch_stat
+from floyd.adapters.outbound.git.git_cli_adapter import DIFF_EXCLUDES
+from floyd.adapters.outbound.git.path_classifier import DiffPathFilter, PathClassifier
+
+RULES = (*DIFF_EXCLUDES, "vendor/", "**/migrations/**", "*.pb.go", "*_pb2.py", "__snapshots__/")
+EXTENSIONS = ("py", "go", "pb.go", "_pb2.py", "js", "min.js", "snap", "lock")
+
+
+def _paths(count: int, rng: random.Random) -> list[str]:
+    paths = []
+    for index in range(count):
+        directory = rng.choice(("src/app", "vendor/lib", "db/migrations", "web/__snapshots__", "api/gen"))
+        paths.append(f"{directory}/pkg_{index % 500}/file_{index}.{rng.choice(EXTENSIONS)}")
+    return paths
+
+
+def _chunks(text: str, size: int = 65536):
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cost of classifying paths and filtering a streamed diff.")
+    parser.add_argument("--paths", type=int, default=50_000)
+    parser.add_argument("--megabytes", type=float, default=8.0, help="size of the synthetic diff")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    paths = _paths(args.paths, rng)
+
+    start = time.perf_counter()
+    classifier = PathClassifier(RULES)
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    omitted = sum(1 for path in paths if classifier.classify(path))
+    elapsed = time.perf_counter() - start
+    print(
+        f"{len(paths):,} paths, {len(RULES)} rules: compiled in {compiled * 1000:.2f} ms, "
+        f"classified in {elapsed * 1000:.1f} ms ({elapsed / len(paths) * 1e6:.2f} us/path), {omitted:,} omitted"
+    )
+
+    diff = synthetic_diff(args.megabytes)
+    start = time.perf_counter()
+    body = "".join(DiffPathFilter(PathClassifier(RULES)).filter(_chunks(diff)))
+    elapsed = time.perf_counter() - start
+    stat = format_stat(parse_patch_stat(body))
+    print(
+        f"{len(diff) / (1024 * 1024):.1f} MB diff filtered in {elapsed * 1000:.1f} ms: "
+        f"body {len(body) / 1024:.1f} KB, stat still lists {len(stat.splitlines()) - 1} files"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import time
+from pathlib import Path
+
+from floyd.adapters.outbound.ai import prompt_template
+from floyd.adapters.outbound.ai.prompt_template import load_template
+
+TEMPLATE = Path(prompt_template.__file__).parent / "prompt.txt"
+
+
+def _replace_chain(values: dict[str, str]) -> str:
+    # The previous implementation: re-read the file and copy the prompt once per placeholder.
+    with open(TEMPLATE, "r", encoding="utf-8") as f:
+        prompt = f.read()
+
+    for name in ("current_branch", "target_branch", "commits", "diff_stat", "instructions", "feedback", "diff"):
+        prompt = prompt.replace("{{" + name + "}}", values[name])
+    return prompt
+
+
+def _precompiled(values: dict[str, str]) -> str:
+    return load_template("prompt.txt").render(values)
+
+
+def _values(diff_bytes: int) -> dict[str, str]:
+    line = "+    value = compute(value, cache=True)  # synthetic diff line\n"
+    return {
+        "current_branch": "feature/benchmark",
+        "target_branch": "main",
+        "commits": "".join(f"abc{index:04d} change {index}\n" for index in range(50)),
+        "diff_stat": "".join(f" src/module_{index}.py | 4 ++--\n" for index in range(200)),
+        "instructions": "\nUSER-SPECIFIC INSTRUCTIONS:\n- Focus on business impact",
+        "feedback": "\nUSER FEEDBACK:\nmention the migration",
+        "diff": line * max(diff_bytes // len(line), 1),
+    }
+
+
+def _best_of(runs: int, action, values: dict[str, str]) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        action(values)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="str.replace chain vs the precompiled prompt template.")
+    parser.add_argument("--kilobytes", type=int, nargs="+", default=[4, 256, 4096, 16384])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'diff':>10} | {'replace chain':>14} {'precompiled':>12} {'speedup':>8}")
+    for kilobytes in args.kilobytes:
+        values = _values(kilobytes * 1024)
+        assert _replace_chain(values) == _precompiled(values)
+
+        chain = _best_of(args.runs, _replace_chain, values)
+        compiled = _best_of(args.runs, _precompiled, values)
+        print(f"{kilobytes:>8}KB | {chain * 1000:11.3f} ms {compiled * 1000:9.3f} ms {chain / compiled:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
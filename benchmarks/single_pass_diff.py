@@ -0,0 +1,44 @@
+import argparse
+import os
+import shutil
+import time
+
+from benchmarks.synthetic_repo import create_repo
+from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+
+
+def _best_of(runs: int, adapter: GitCLIAdapter) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        adapter.get_diff_with_stat("main")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Two git diff calls vs one diff with an in-process stat.")
+    parser.add_argument("--files", type=int, default=3000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    repo = create_repo(files=args.files)
+    cwd = os.getcwd()
+    try:
+        os.chdir(repo)
+        terminal = Terminal()
+        two_pass = _best_of(args.runs, GitCLIAdapter(terminal, single_pass_diff=False))
+        single_pass = _best_of(args.runs, GitCLIAdapter(terminal, single_pass_diff=True))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(repo, ignore_errors=True)
+
+    print(f"changed files: {args.files}")
+    print(f"diff + diff --stat:   {two_pass * 1000:8.1f} ms")
+    print(f"diff + python stat:   {single_pass * 1000:8.1f} ms")
+    print(f"saving:               {(1 - single_pass / two_pass) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
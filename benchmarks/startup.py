@@ -0,0 +1,100 @@
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must stay out of the early-exit paths.
+HEAVY_MODULES = ("rich", "questionary", "prompt_toolkit", "pydantic", "importlib.metadata")
+
+SCENARIOS = {
+    "no args": [],
+    "bad mode": ["bogus"],
+    "bad option": ["pr", "main", "--bogus"],
+    "not a git repo": ["pr", "main"],
+}
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": str(ROOT), "NO_COLOR": "1"}
+
+
+def _import_times(args: list[str], cwd: Path) -> dict[str, int]:
+    """Self time in microseconds of every module imported by the command."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=cwd,
+        env=_env(),
+        capture_output=True,
+        text=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _wall_time(args: list[str], cwd: Path, runs: int) -> float:
+    samples: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, env=_env(), capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Startup cost of the floyd entry point on early-exit paths.")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--threshold-ms",
+        type=float,
+        default=25.0,
+        help="fail when floyd's own import time on any path exceeds this",
+    )
+    args = parser.parse_args()
+
+    outside_repo = Path(tempfile.mkdtemp(prefix="floyd-startup-"))
+    failures: list[str] = []
+    try:
+        baseline = _import_times(["-c", "pass"], outside_repo)
+        interpreter = _wall_time(["-c", "pass"], outside_repo, args.runs)
+        print(f"bare interpreter: {interpreter * 1000:6.1f} ms")
+
+        for label, floyd_args in SCENARIOS.items():
+            command = ["-m", "floyd", *floyd_args]
+            times = _import_times(command, outside_repo)
+            extra = {name: us for name, us in times.items() if name not in baseline}
+            import_ms = sum(extra.values()) / 1000
+            wall = _wall_time(command, outside_repo, args.runs)
+            heavy = sorted(name for name in extra if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES)
+
+            print(
+                f"{label:<16} wall {wall * 1000:6.1f} ms  (+{(wall - interpreter) * 1000:5.1f} ms)  "
+                f"imports {import_ms:6.1f} ms  modules {len(extra)}"
+            )
+
+            if import_ms > args.threshold_ms:
+                failures.append(f"{label}: imports took {import_ms:.1f} ms (threshold {args.threshold_ms} ms)")
+            if heavy:
+                failures.append(f"{label}: imported {', '.join(heavy[:5])}")
+    finally:
+        shutil.rmtree(outside_repo, ignore_errors=True)
+
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+from benchmarks.synthetic_repo import create_vendored_repo
+
+_PROBE = """
+import json, resource, sys, time
+from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+
+adapter = GitCLIAdapter(Terminal(), diff_limit=int(sys.argv[1]))
+start = time.perf_counter()
+diff, stat = adapter.get_diff_with_stat("main")
+elapsed = time.perf_counter() - start
+try:
+    # ru_maxrss survives exec on Linux and would include the parent's peak.
+    with open("/proc/self/status") as status:
+        peak = next(int(line.split()[1]) for line in status if line.startswith("VmHWM:"))
+except OSError:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"elapsed": elapsed, "peak_kb": peak, "chars": len(diff), "stat_files": stat.count("|")}))
+"""
+
+
+def _probe(repo: str, diff_limit: int) -> dict[str, float]:
+    env = {**os.environ, "PYTHONPATH": os.getcwd()}
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE, str(diff_limit)],
+        cwd=repo,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Buffered vs budget-bounded streaming git diff.")
+    parser.add_argument("--megabytes", type=int, default=64, help="size of the vendored file")
+    parser.add_argument("--limit", type=int, default=50000, help="diff_limit in characters")
+    args = parser.parse_args()
+
+    repo = create_vendored_repo(args.megabytes)
+    try:
+        rows = [("buffered", _probe(str(repo), -1)), ("streamed", _probe(str(repo), args.limit))]
+    finally:
+        shutil.rmtree(repo, ignore_errors=True)
+
+    print(f"vendored file: {args.megabytes} MB, diff_limit: {args.limit}")
+    for label, row in rows:
+        print(
+            f"{label:<9} {row['elapsed'] * 1000:8.1f} ms  peak RSS {row['peak_kb'] / 1024:7.1f} MB  "
+            f"diff {row['chars']:>10} chars  stat files {row['stat_files']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from benchmarks.synthetic_repo import create_repo_with_origin
+from floyd.adapters.inbound.cli import ui
+from floyd.adapters.inbound.cli.cli_adapter import CLIAdapter
+from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
+from floyd.application.dto.refinement import Refinement
+from floyd.application.services.tracing import Span, Tracer, trace_span, tracing_scope
+from floyd.container import Container, create_container
+
+FAKES = Path(__file__).resolve().parent / "fakes"
+PROVIDERS = ("claude", "gemini", "copilot")
+# Wall-time changes smaller than this are noise, whatever the tolerance says.
+NOISE_FLOOR = 0.05
+
+Row = dict[str, float]
+
+
+class _MemorySpan(Span):
+    __slots__ = ()
+
+    def __enter__(self) -> "Span":
+        super().__enter__()
+        self._tracer._enter(self)  # type: ignore[attr-defined]
+        return self
+
+    def __exit__(self, kind: type[BaseException] | None, error: object, traceback: object) -> None:
+        self._tracer._exit(self)  # type: ignore[attr-defined]
+        super().__exit__(kind, error, traceback)
+
+
+class MemoryTracer(Tracer):
+    """A tracer that also records the peak traced memory of every span.
+
+    tracemalloc has one peak for the whole process, so whenever a span
+    starts or ends the peak reached so far is credited to every span still
+    open, on any thread, and then reset.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._open: dict[int, tuple[Span, int]] = {}
+
+    def span(self, name: str, category: str, **args: Any) -> Span:
+        return _MemorySpan(self, name, category, args)
+
+    def _fold(self) -> None:
+        _, peak = tracemalloc.get_traced_memory()
+        for key, (span, best) in self._open.items():
+            self._open[key] = (span, max(best, peak))
+        tracemalloc.reset_peak()
+
+    def _enter(self, span: Span) -> None:
+        with self._lock:
+            self._fold()
+            self._open[id(span)] = (span, tracemalloc.get_traced_memory()[0])
+
+    def _exit(self, span: Span) -> None:
+        with self._lock:
+            self._fold()
+            _, peak = self._open.pop(id(span))
+        span.args["peak_bytes"] = peak
+
+
+def _config(workdir: Path, provider: str) -> TomlConfigAdapter:
+    path = workdir / f"{provider}.toml"
+    path.write_text(f'[ai]\nprovider = "{provider}"\n\n[cache]\nenabled = false\n')
+    return TomlConfigAdapter(path)
+
+
+def _container(repo: Path, config: TomlConfigAdapter) -> Container:
+    # A new container per run, as a fresh `floyd` process would build.
+    return create_container(use_cache=False, cwd=repo, config=config)
+
+
+def _service_scenario(repo: Path, config: TomlConfigAdapter) -> None:
+    with _container(repo, config) as container:
+        service = container.pr_generation_service
+
+        preparation = service.prepare_pr("main", fresh=True)
+        draft = preparation.draft or service.generate_pr_draft(preparation.context)
+        refinement = Refinement(title=draft.title, body=draft.body, feedback=("Make it shorter.",))
+        pr = service.generate_pr_draft(preparation.context, refinement)
+        service.create_pr(pr, "main")
+
+    with _container(repo, config) as container:
+        with trace_span("get_staged_diff"):
+            diff = container.git_repository.get_staged_diff()
+        container.pr_generation_service.generate_commit(diff)
+
+
+@contextlib.contextmanager
+def _answers(actions: list[str], feedback: str = "Make it shorter.") -> Iterator[None]:
+    """Answers the CLI's prompts from a script, in order, and hides its output."""
+    replies = iter(actions)
+    patched = {
+        "get_action_choice": lambda: next(replies),
+        "get_commit_action_choice": lambda: next(replies),
+        "get_refinement_feedback": lambda: feedback,
+    }
+    original = {name: getattr(ui, name) for name in patched}
+
+    for name, reply in patched.items():
+        setattr(ui, name, reply)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            yield
+    finally:
+        for name, function in original.items():
+            setattr(ui, name, function)
+
+
+def _cli_scenario(repo: Path, config: TomlConfigAdapter) -> None:
+    container = _container(repo, config)
+    cli = CLIAdapter(
+        pr_generation_service=container.pr_generation_service,
+        git_repository=container.git_repository,
+        config=container.config,
+    )
+
+    # Refine the PR once and open it; cancel the commit so the index stays staged.
+    with _answers(["refine", "create"]), trace_span("floyd pr"):
+        assert cli.run(["pr", "main", "--fresh"]) == 0, "floyd pr failed"
+    with _answers(["cancel"]), trace_span("floyd commit"):
+        assert cli.run(["commit"]) == 0, "floyd commit failed"
+
+
+SCENARIOS: dict[str, Callable[[Path, TomlConfigAdapter], None]] = {
+    "service": _service_scenario,
+    "cli": _cli_scenario,
+}
+
+
+def _measure(tracer: Tracer) -> dict[str, Row]:
+    """Wall time, subprocesses and peak memory per phase of one traced run."""
+    spans = sorted(tracer.spans, key=lambda span: span.start)
+    processes = [span for span in spans if span.category == "process"]
+    rows: dict[str, Row] = {}
+
+    for span in spans:
+        if span.category != "phase" or span.end is None:
+            continue
+        end = span.end
+        inside = sum(
+            1 for process in processes if span.start <= process.start and (process.end or 0) <= end
+        )
+        row = rows.setdefault(span.name, {"wall": 0.0, "processes": 0, "peak_bytes": 0})
+        row["wall"] += span.duration
+        row["processes"] += inside
+        row["peak_bytes"] = max(row["peak_bytes"], span.args.get("peak_bytes", 0))
+
+    return rows
+
+
+def _run(scenario: str, repo: Path, config: TomlConfigAdapter, tracer: Tracer) -> dict[str, Row]:
+    with tracing_scope(tracer), trace_span("total"):
+        SCENARIOS[scenario](repo, config)
+    return _measure(tracer)
+
+
+def run_suite(args: argparse.Namespace) -> dict[str, Row]:
+    repo = create_repo_with_origin(args.files, args.commits, args.diff_kb * 1024)
+    workdir = repo.parent
+    cwd = os.getcwd()
+    os.chdir(repo)
+
+    results: dict[str, Row] = {}
+    try:
+        for provider in args.providers:
+            config = _config(workdir, provider)
+            for scenario in args.scenarios:
+                # The first run imports and warms up; it is not counted.
+                _run(scenario, repo, config, Tracer())
+                runs = [_run(scenario, repo, config, Tracer()) for _ in range(args.repeat)]
+
+                tracemalloc.start()
+                try:
+                    memory = _run(scenario, repo, config, MemoryTracer())
+                finally:
+                    tracemalloc.stop()
+
+                for phase in runs[0]:
+                    results[f"{provider} {scenario} {phase}"] = {
+                        "wall": statistics.median(run[phase]["wall"] for run in runs),
+                        "processes": max(run[phase]["processes"] for run in runs),
+                        "peak_bytes": memory[phase]["peak_bytes"],
+                    }
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return results
+
+
+def _compare(results: dict[str, Row], baseline: dict[str, Row], tolerance: float) -> list[str]:
+    regressions = []
+    for key, row in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+
+        slower = row["wall"] > base["wall"] * (1 + tolerance) and row["wall"] - base["wall"] > NOISE_FLOOR
+        heavier = row["peak_bytes"] > base["peak_bytes"] * (1 + tolerance)
+        if slower or heavier or row["processes"] > base["processes"]:
+            regressions.append(key)
+    return regressions
+
+
+def _change(value: float, base: float) -> str:
+    return f"{(value - base) / base * 100:+6.1f}%" if base else "     n/a"
+
+
+def _report(results: dict[str, Row], baseline: dict[str, Row] | None, regressions: list[str]) -> None:
+    width = max(len(key) for key in results)
+    header = f"{'phase':<{width}}  {'wall':>9}  {'procs':>5}  {'peak':>9}"
+    print(header + ("   vs baseline: wall  procs     peak" if baseline else ""))
+
+    for key, row in results.items():
+        line = (
+            f"{key:<{width}}  {row['wall']:8.3f}s  {int(row['processes']):>5}  "
+            f"{row['peak_bytes'] / (1024 * 1024):7.2f}MB"
+        )
+        base = baseline.get(key) if baseline else None
+        if base:
+            line += (
+                f"   {_change(row['wall'], base['wall'])}  {int(row['processes'] - base['processes']):+5d}"
+                f"  {_change(row['peak_bytes'], base['peak_bytes'])}"
+            )
+            if key in regressions:
+                line += "  REGRESSION"
+        elif baseline is not None:
+            line += "   (not in baseline)"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "End-to-end benchmark of the PR and commit workflows over a synthetic repository, "
+            "with stub gh and AI CLIs, compared against a saved baseline."
+        )
+    )
+    parser.add_argument("--files", type=int, default=500, help="files in the repository")
+    parser.add_argument("--commits", type=int, default=20, help="commits on the feature branch")
+    parser.add_argument("--diff-kb", type=int, default=256, help="approximate size of the branch diff")
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds each AI CLI call takes")
+    parser.add_argument("--gh-latency", type=float, default=0.1, help="seconds each gh call takes")
+    parser.add_argument("--providers", type=lambda value: value.split(","), default=list(PROVIDERS))
+    parser.add_argument(
+        "--scenarios", type=lambda value: value.split(","), default=list(SCENARIOS)
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per scenario; the median is kept")
+    parser.add_argument("--baseline", type=Path, help="compare against this saved result")
+    parser.add_argument("--save", type=Path, help="write the results here, to use as a baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="relative slowdown or growth that fails the run"
+    )
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.providers) - set(PROVIDERS)) + sorted(set(args.scenarios) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown provider or scenario: {', '.join(unknown)}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    settings = {
+        "files": args.files,
+        "commits": args.commits,
+        "diff_kb": args.diff_kb,
+        "latency": args.latency,
+        "gh_latency": args.gh_latency,
+    }
+    os.environ["PATH"] = f"{FAKES}{os.pathsep}{os.environ['PATH']}"
+    for provider in PROVIDERS:
+        os.environ[f"FAKE_{provider.upper()}_STARTUP"] = str(args.latency)
+    os.environ["FAKE_GH_STARTUP"] = str(args.gh_latency)
+
+    baseline = None
+    if args.baseline:
+        saved = json.loads(args.baseline.read_text())
+        if saved["settings"] != settings:
+            print(f"warning: the baseline was recorded with {saved['settings']}", file=sys.stderr)
+        baseline = saved["results"]
+
+    start = time.perf_counter()
+    results = run_suite(args)
+    regressions = _compare(results, baseline, args.tolerance) if baseline else []
+
+    print(
+        f"{args.files} files, {args.commits} commits, ~{args.diff_kb} KB diff, "
+        f"AI {args.latency}s, gh {args.gh_latency}s, median of {args.repeat} "
+        f"({time.perf_counter() - start:.1f}s in all)"
+    )
+    _report(results, baseline, regressions)
+
+    if args.save:
+        args.save.write_text(json.dumps({"settings": settings, "results": results}, indent=2) + "\n")
+        print(f"results saved to {args.save}")
+
+    if regressions:
+        print(f"{len(regressions)} phase(s) regressed beyond {args.tolerance:.0%}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
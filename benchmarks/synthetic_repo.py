@@ -0,0 +1,123 @@
+import subprocess
+import tempfile
+from pathlib import Path
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def create_repo(files: int = 2000, lines: int = 40, base_branch: str = "main") -> Path:
+    repo = Path(tempfile.mkdtemp(prefix="floyd-bench-"))
+
+    _git(repo, "init", "-q", "-b", base_branch)
+    _git(repo, "config", "user.email", "bench@floyd.local")
+    _git(repo, "config", "user.name", "floyd-bench")
+
+    for index in range(files):
+        path = repo / "src" / f"pkg{index % 50}" / f"module_{index}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(f"value_{index}_{line} = {line}\n" for line in range(lines))
+        )
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "update-ref", f"refs/remotes/origin/{base_branch}", "HEAD")
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    for index in range(files):
+        path = repo / "src" / f"pkg{index % 50}" / f"module_{index}.py"
+        path.write_text(
+            "".join(
+                f"value_{index}_{line} = {line * 2}\n" if line % 3 == 0 else f"value_{index}_{line} = {line}\n"
+                for line in range(lines)
+            )
+        )
+    (repo / "poetry.lock").write_text("lock\n" * 1000)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "feature")
+
+    return repo
+
+
+def create_vendored_repo(megabytes: int = 64, base_branch: str = "main") -> Path:
+    """A branch that rewrites one large vendored file, like a dependency bump."""
+    repo = Path(tempfile.mkdtemp(prefix="floyd-bench-"))
+
+    _git(repo, "init", "-q", "-b", base_branch)
+    _git(repo, "config", "user.email", "bench@floyd.local")
+    _git(repo, "config", "user.name", "floyd-bench")
+
+    line_count = megabytes * 1024 * 1024 // 48
+    bundle = repo / "vendor" / "bundle.js"
+    bundle.parent.mkdir(parents=True)
+    (repo / "src").mkdir()
+    bundle.write_text("".join(f"export const value_{line:08d} = {line:012d};\n" for line in range(line_count)))
+    (repo / "src" / "app.py").write_text("VERSION = 1\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "update-ref", f"refs/remotes/origin/{base_branch}", "HEAD")
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    bundle.write_text("".join(f"export const value_{line:08d} = {line * 3:012d};\n" for line in range(line_count)))
+    (repo / "src" / "app.py").write_text("VERSION = 2\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "bump vendored bundle")
+
+    return repo
+
+
+def create_repo_with_origin(
+    files: int = 500,
+    commits: int = 20,
+    diff_bytes: int = 256 * 1024,
+    staged_files: int = 10,
+    base_branch: str = "main",
+) -> Path:
+    """A clone of a bare `origin` with a pushed `feature` branch and staged changes.
+
+    The branch changes the files over `commits` commits, adding about
+    `diff_bytes` of diff against `base_branch`; `staged_files` files are
+    left modified in the index for a commit message.
+    """
+    root = Path(tempfile.mkdtemp(prefix="floyd-bench-"))
+    origin = root / "origin.git"
+    repo = root / "work"
+    origin.mkdir()
+    repo.mkdir()
+
+    _git(origin, "init", "-q", "--bare", "-b", base_branch)
+    _git(repo, "init", "-q", "-b", base_branch)
+    _git(repo, "config", "user.email", "bench@floyd.local")
+    _git(repo, "config", "user.name", "floyd-bench")
+    _git(repo, "remote", "add", "origin", str(origin))
+
+    paths = [repo / "src" / f"pkg{index % 50}" / f"module_{index}.py" for index in range(files)]
+    for index, path in enumerate(paths):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("".join(f"value_{index}_{line} = {line}\n" for line in range(20)))
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    _git(repo, "push", "-q", "origin", base_branch)
+
+    _git(repo, "checkout", "-q", "-b", "feature")
+    commits = max(1, commits)
+    # Each added line is about 40 bytes of diff; the commits share the files.
+    lines_per_commit = max(1, diff_bytes // 40 // commits)
+    per_commit = max(1, min(files, lines_per_commit) // commits or 1)
+    for number in range(commits):
+        touched = [paths[(number * per_commit + offset) % files] for offset in range(per_commit)]
+        for offset, path in enumerate(touched):
+            count = lines_per_commit // len(touched) + (offset < lines_per_commit % len(touched))
+            with path.open("a") as file:
+                file.write("".join(f"added_{number}_{line} = {line * 7:010d}\n" for line in range(count)))
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", f"feature change {number + 1}")
+    _git(repo, "push", "-q", "-u", "origin", "feature")
+
+    for path in paths[:staged_files]:
+        with path.open("a") as file:
+            file.write("staged_value = 1\n")
+    _git(repo, "add", "-A")
+
+    return repo
@@ -0,0 +1,66 @@
+import argparse
+import contextvars
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.services.tracing import Tracer, trace_span, tracing_scope
+
+
+def _span_cost(count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        with trace_span("noop", "task") as span:
+            if span:
+                span.set(value=1)
+    return (time.perf_counter() - start) / count
+
+
+def _run_cost(terminal: Terminal, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        terminal.run(["true"])
+    return (time.perf_counter() - start) / count
+
+
+def _overlapping(terminal: Terminal, count: int) -> None:
+    with ThreadPoolExecutor(count) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, terminal.run, ["sleep", "0.1"])
+            for _ in range(count)
+        ]
+        for future in futures:
+            future.result()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="What tracing costs, off and on.")
+    parser.add_argument("--spans", type=int, default=1_000_000)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+
+    terminal = Terminal()
+    off = _span_cost(args.spans)
+    run_off = _run_cost(terminal, args.runs)
+
+    tracer = Tracer()
+    with tracing_scope(tracer):
+        on = _span_cost(args.spans // 10)
+        run_on = _run_cost(terminal, args.runs)
+        _overlapping(terminal, 4)
+
+    print(f"span, tracing off: {off * 1e9:7.1f} ns   on: {on * 1e9:7.1f} ns")
+    print(f"Terminal.run(true), off: {run_off * 1000:.3f} ms   on: {run_on * 1000:.3f} ms")
+
+    trace = json.loads(json.dumps(tracer.chrome_trace()))
+    tracks = {event["tid"] for event in trace["traceEvents"] if event["name"] == "sleep"}
+    assert len(tracks) == 4, "concurrent subprocesses share a track"
+    rows = {(row.category, row.name): row for row in tracer.summary()}
+    assert rows[("process", "true")].calls == args.runs
+    assert rows[("process", "sleep")].calls == 4
+    print(f"{len(trace['traceEvents']):,} trace events; overlapping subprocesses kept on their own tracks")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,9 +8,20 @@ Hexagonal Architecture Layers:
 - adapters: Infrastructure implementations (CLI, AI providers, git, etc.)
 """
 
-from importlib.metadata import version, PackageNotFoundError
+from typing import Any
 
-try:
-    __version__ = version("floyd")
-except PackageNotFoundError:
-    __version__ = "0.2.0"
+
+def __getattr__(name: str) -> Any:
+    # importlib.metadata is slow to import, so only resolve the version on demand.
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib.metadata import version, PackageNotFoundError
+
+    try:
+        value = version("floyd")
+    except PackageNotFoundError:
+        value = "0.2.0"
+
+    globals()["__version__"] = value
+    return value
@@ -1,5 +1,17 @@
 """Inbound adapters (primary/driving adapters)."""
 
-from floyd.adapters.inbound.cli.cli_adapter import CLIAdapter
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.inbound.cli.cli_adapter import CLIAdapter
 
 __all__ = ["CLIAdapter"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CLIAdapter": "floyd.adapters.inbound.cli.cli_adapter",
+    },
+)
@@ -1,5 +1,19 @@
 """CLI adapter package."""
 
-from floyd.adapters.inbound.cli.cli_adapter import CLIAdapter
+from typing import TYPE_CHECKING
 
-__all__ = ["CLIAdapter"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.inbound.cli.batch_cli_adapter import BatchCLIAdapter
+    from floyd.adapters.inbound.cli.cli_adapter import CLIAdapter
+
+__all__ = ["BatchCLIAdapter", "CLIAdapter"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchCLIAdapter": "floyd.adapters.inbound.cli.batch_cli_adapter",
+        "CLIAdapter": "floyd.adapters.inbound.cli.cli_adapter",
+    },
+)
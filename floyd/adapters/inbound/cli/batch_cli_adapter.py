@@ -0,0 +1,46 @@
+import sys
+from collections import Counter
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from floyd.application.dto.batch_item import BatchItem, BatchResult
+    from floyd.application.ports.inbound.batch_pr_port import BatchPRPort
+
+
+class BatchCLIAdapter:
+    """Runs a batch without prompts and writes one JSON line per item.
+
+    Results are written as each item finishes; the summary goes to stderr so
+    stdout stays machine-readable.
+    """
+
+    def __init__(
+        self,
+        batch_service: "BatchPRPort",
+        output: TextIO | None = None,
+        errors: TextIO | None = None,
+    ) -> None:
+        self._batch_service = batch_service
+        self._output = output or sys.stdout
+        self._errors = errors or sys.stderr
+
+    def run(self, items: list["BatchItem"]) -> int:
+        from floyd.application.dto.batch_item import BatchStatus
+
+        try:
+            results = self._batch_service.run(items, on_result=self._write)
+        except KeyboardInterrupt:
+            from floyd.adapters.outbound.utils.terminal import Terminal
+
+            Terminal.kill_all()
+            print("Batch cancelled by user.", file=self._errors)
+            return 130
+
+        counts = Counter(result.status.value for result in results)
+        summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+        print(f"Processed {len(results)} item(s): {summary}.", file=self._errors)
+
+        return 1 if counts[BatchStatus.FAILED.value] else 0
+
+    def _write(self, result: "BatchResult") -> None:
+        print(result.model_dump_json(), file=self._output, flush=True)
@@ -1,9 +1,8 @@
+import os
 import sys
+from typing import TYPE_CHECKING, Callable
 
 from floyd.adapters.inbound.cli import ui
-from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
-from floyd.application.ports.outbound.config_port import ConfigPort
-from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
 from floyd.domain.exceptions.domain_exception import DomainException
 from floyd.domain.exceptions.git.invalid_branch_exception import InvalidBranchException
 from floyd.domain.exceptions.git.branch_not_found_exception import (
@@ -14,21 +13,153 @@ from floyd.domain.exceptions.pr.pr_already_exist_exception import (
 )
 from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
 
+if TYPE_CHECKING:
+    from floyd.application.dto.refinement import Refinement
+    from floyd.application.dto.task_progress import TaskProgress
+    from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
+    from floyd.application.ports.outbound.config_port import ConfigPort
+    from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
+    from floyd.domain.entities.pull_request import PullRequest
+
+OPTIONS = {"--fresh", "--no-cache", "--profile"}
+BATCH_OPTIONS = {"--dry-run", "--jobs"}
+DAEMON_OPTIONS = {"--idle"}
+MODES = {"pr", "commit", "batch", "daemon"}
+MODE_OPTIONS = {
+    "batch": OPTIONS | BATCH_OPTIONS,
+    "daemon": DAEMON_OPTIONS,
+}
+DAEMON_ACTIONS = ("start", "stop", "status", "serve")
+DEFAULT_BATCH_JOBS = 4
+DEFAULT_DAEMON_IDLE = 900.0
+
+
+def parse_args(argv: list[str]) -> tuple[list[str], dict[str, str]]:
+    options: dict[str, str] = {}
+    for arg in argv:
+        if arg.startswith("--"):
+            name, _, value = arg.partition("=")
+            options[name.lower()] = value
+
+    args = [arg for arg in argv if not arg.startswith("--")]
+    return args, options
+
+
+def check_usage(args: list[str], options: dict[str, str]) -> bool:
+    if len(args) < 1:
+        ui.show_warning(
+            "Usage: floyd <pr|commit|batch|daemon> [target-branch] [--fresh] [--no-cache] "
+            "[--profile[=trace.json]]"
+        )
+        return False
+
+    mode = args[0].lower()
+    allowed = MODE_OPTIONS.get(mode, OPTIONS)
+
+    unknown = sorted(options.keys() - allowed)
+    if unknown:
+        ui.show_error(f"Unknown option: {unknown[0]}. Available: {', '.join(sorted(allowed))}.")
+        return False
+
+    if mode not in MODES:
+        ui.show_error(f"Unknown mode: {mode}. Use 'pr', 'commit', 'batch' or 'daemon'.")
+        return False
+
+    if mode == "pr" and len(args) < 2:
+        ui.show_warning(
+            "Usage: floyd pr <target-branch> [--fresh] [--no-cache] [--profile[=trace.json]]"
+        )
+        return False
+
+    if mode == "batch":
+        if len(args) < 2:
+            ui.show_warning(
+                "Usage: floyd batch <manifest.toml> [--dry-run] [--jobs=N] [--fresh] [--no-cache] "
+                "[--profile[=trace.json]]"
+            )
+            return False
+
+        jobs = options.get("--jobs")
+        if jobs is not None and (not jobs.isdigit() or int(jobs) < 1):
+            ui.show_error("--jobs must be a positive integer, e.g. --jobs=4.")
+            return False
+
+    if mode == "daemon":
+        if len(args) < 2 or args[1].lower() not in DAEMON_ACTIONS:
+            ui.show_warning(f"Usage: floyd daemon <{'|'.join(DAEMON_ACTIONS)}> [--idle=SECONDS]")
+            return False
+
+        idle = options.get("--idle")
+        if idle is not None and (not idle.isdigit() or int(idle) < 1):
+            ui.show_error("--idle must be a positive number of seconds, e.g. --idle=600.")
+            return False
+
+    return True
+
+
+def run_batch(manifest: str, options: dict[str, str]) -> int:
+    from pathlib import Path
+
+    from floyd.adapters.inbound.cli.batch_cli_adapter import BatchCLIAdapter
+    from floyd.adapters.outbound.config.batch_manifest import load_batch_manifest
+    from floyd.container import create_batch_service
+
+    batch = load_batch_manifest(Path(manifest))
+    jobs = int(options["--jobs"]) if options.get("--jobs") else batch.jobs or DEFAULT_BATCH_JOBS
+
+    service = create_batch_service(
+        jobs=jobs,
+        dry_run="--dry-run" in options,
+        fresh="--fresh" in options,
+        use_cache="--no-cache" not in options,
+    )
+    return BatchCLIAdapter(service).run(batch.items)
+
+
+def run_daemon(action: str, options: dict[str, str]) -> int:
+    from floyd.adapters.inbound.daemon import control
+
+    idle = float(options["--idle"]) if options.get("--idle") else DEFAULT_DAEMON_IDLE
+
+    if action == "serve":
+        control.serve(idle)
+        return 0
+
+    if action == "start":
+        ui.show_success(f"floyd daemon running ({control.start(idle)}).")
+        return 0
+
+    if action == "stop":
+        if control.stop():
+            ui.show_success("floyd daemon stopped.")
+        else:
+            ui.show_info("floyd daemon is not running.")
+        return 0
+
+    status = control.status()
+    if status is None:
+        ui.show_info("floyd daemon is not running.")
+        return 1
+
+    ui.show_info(f"floyd daemon running ({status}).")
+    return 0
+
 
 class CLIAdapter:
     def __init__(
         self,
-        pr_generation_service: PRGenerationPort,
-        git_repository: GitRepositoryPort,
-        config: ConfigPort,
+        pr_generation_service: "PRGenerationPort",
+        git_repository: "GitRepositoryPort",
+        config: "ConfigPort",
     ) -> None:
         self._pr_service = pr_generation_service
         self._git_repository = git_repository
         self._config = config
 
     def run(self, args: list[str]) -> int:
-        if len(args) < 1:
-            ui.show_warning("Usage: floyd <pr|commit> [target-branch]")
+        args, options = parse_args(args)
+
+        if not check_usage(args, options):
             return 1
 
         if not self._git_repository.is_git_repo():
@@ -38,40 +169,52 @@ class CLIAdapter:
         ui.show_icon()
 
         ai_config = self._config.get_ai_config()
-        ui.show_config(ai_config.provider.value, ai_config.model)
+        ui.show_config(
+            ai_config.provider.value,
+            ai_config.model,
+            [provider.value for provider in ai_config.race],
+        )
 
         mode = args[0].lower()
 
         try:
             if mode == "pr":
-                if len(args) < 2:
-                    ui.show_warning("Usage: floyd pr <target-branch>")
-                    return 1
                 ui.show_custom_instructions("PR", bool(ai_config.pr_instructions))
-                return self._run_pr_workflow(args[1])
-            elif mode == "commit":
-                ui.show_custom_instructions("Commit", bool(ai_config.commit_instructions))
-                return self._run_commit_workflow()
-            else:
-                ui.show_error(f"Unknown mode: {mode}. Use 'pr' or 'commit'.")
-                return 1
+                return self._run_pr_workflow(args[1], fresh="--fresh" in options)
+
+            ui.show_custom_instructions("Commit", bool(ai_config.commit_instructions))
+            return self._run_commit_workflow()
         except KeyboardInterrupt:
+            from floyd.adapters.outbound.utils.terminal import Terminal
+
+            # Children run in their own process groups, out of reach of the
+            # terminal's Ctrl-C, so they are stopped here.
+            Terminal.kill_all()
             print("")
             ui.show_warning("Operation cancelled by user.")
             return 0
+        finally:
+            self._pr_service.close()
 
-    def _run_pr_workflow(self, target_branch: str) -> int:
-        current_branch = self._git_repository.get_current_branch()
+    def _run_pr_workflow(self, target_branch: str, fresh: bool = False) -> int:
+        from floyd.application.dto.task_progress import TaskState
 
-        with ui.show_loading("Initializing workflow...") as status:
-            try:
-                status.update("[gray]Checking remote branches (network)...[/gray]")
-                self._pr_service.validate_can_create_pr(current_branch, target_branch)
+        # The speculative draft streams into the same preview as any other.
+        with ui.show_live_draft("Initializing workflow...") as live:
+            running: dict[str, str] = {}
 
-                status.update(
-                    f"[gray]Fetching git diff against '{target_branch}'...[/gray]"
-                )
-                context = self._pr_service.get_git_context(target_branch)
+            def on_progress(progress: "TaskProgress") -> None:
+                if progress.state is TaskState.RUNNING:
+                    running[progress.name] = progress.label
+                else:
+                    running.pop(progress.name, None)
+                    ui.show_task_progress(progress)
+
+                if running:
+                    live.update(f"{', '.join(running.values())}...")
+
+            try:
+                preparation = self._pr_service.prepare_pr(target_branch, fresh, on_progress, live)
             except InvalidBranchException as e:
                 ui.show_warning(e.message)
                 return 1
@@ -85,27 +228,35 @@ class CLIAdapter:
                     f"An open PR already exists for '{e.head_branch}' -> '{e.base_branch}'"
                 )
                 return 1
+            except PRGenerationException as e:
+                ui.show_error(f"Failed to generate PR: {e.message}")
+                return 1
+
+        context = preparation.context
 
         if not context.has_changes():
             ui.show_warning("No changes found to create a PR.")
             return 1
 
         ui.show_info("Branch diff fetched successfully.")
+        ui.show_timings(self._pr_service.get_context_timings())
 
-        feedback: str | None = None
+        refinement: "Refinement | None" = None
+        pr: "PullRequest | None" = preparation.draft
 
         while True:
-            with ui.show_loading("Generating PR draft..."):
-                try:
-                    pr = self._pr_service.generate_pr_draft(context, feedback)
-                    ui.show_info("PR draft created successfully.")
-                except PRGenerationException as e:
-                    ui.show_error(f"Failed to generate PR: {e.message}")
-                    return 1
-                except DomainException as e:
-                    ui.show_error(e.message)
-                    return 1
+            if pr is None:
+                with ui.show_live_draft("Generating PR draft...") as on_partial:
+                    try:
+                        pr = self._pr_service.generate_pr_draft(context, refinement, on_partial)
+                    except PRGenerationException as e:
+                        ui.show_error(f"Failed to generate PR: {e.message}")
+                        return 1
+                    except DomainException as e:
+                        ui.show_error(e.message)
+                        return 1
 
+            ui.show_generation_stats("PR draft", self._pr_service.last_generation_stats())
             ui.display_draft(pr)
             choice = ui.get_action_choice()
 
@@ -126,6 +277,8 @@ class CLIAdapter:
 
             elif choice == "refine":
                 feedback = ui.get_refinement_feedback()
+                refinement = _refine(refinement, pr.title, pr.body, feedback)
+                pr = None
                 ui.show_info("Regenerating with your feedback...")
                 continue
 
@@ -136,19 +289,24 @@ class CLIAdapter:
         return 0
 
     def _run_commit_workflow(self) -> int:
-        diff = self._git_repository.get_staged_diff()
+        from floyd.application.services.deadline import deadline_scope
+
+        timeouts = self._config.get_timeout_config()
+
+        with deadline_scope(timeouts):
+            diff = self._git_repository.get_staged_diff()
 
         if not diff or not diff.strip():
             ui.show_warning("No staged changes found. Use 'git add' to stage files first.")
             return 1
 
         ui.show_info("Staged changes detected.")
-        feedback: str | None = None
+        refinement: "Refinement | None" = None
 
         while True:
-            with ui.show_loading("Generating commit message..."):
+            with ui.show_live_draft("Generating commit message...") as on_partial:
                 try:
-                    commit_draft = self._pr_service.generate_commit(diff, feedback)
+                    commit_draft = self._pr_service.generate_commit(diff, refinement, on_partial)
                 except PRGenerationException as e:
                     ui.show_error(f"Failed to generate commit: {e.message}")
                     return 1
@@ -156,16 +314,18 @@ class CLIAdapter:
                     ui.show_error(e.message)
                     return 1
 
+            ui.show_generation_stats("Commit message", self._pr_service.last_generation_stats())
             ui.display_commit_draft(commit_draft)
             choice = ui.get_commit_action_choice()
 
             if choice == "create":
-                with ui.show_loading("Committing changes..."):
+                with ui.show_loading("Committing changes..."), deadline_scope(timeouts):
                     self._git_repository.commit(commit_draft)
                     ui.show_success("Changes committed successfully.")
                 break
             elif choice == "refine":
                 feedback = ui.get_refinement_feedback()
+                refinement = _refine(refinement, commit_draft.title, commit_draft.body, feedback)
                 ui.show_info("Regenerating with your feedback...")
                 continue
             else:
@@ -175,19 +335,119 @@ class CLIAdapter:
         return 0
 
 
-def main() -> None:
+def _refine(
+    previous: "Refinement | None", title: str, body: str, feedback: str
+) -> "Refinement":
+    from floyd.application.dto.refinement import Refinement
+
+    # Every round keeps the feedback given before it.
+    history = previous.feedback if previous else ()
+    return Refinement(title=title, body=body, feedback=(*history, feedback))
+
+
+def _create_cli(use_cache: bool, use_daemon: bool = True) -> CLIAdapter:
+    # A running daemon already holds a validated, warm container; use it
+    # unless told not to.
+    if use_daemon and not os.environ.get("FLOYD_NO_DAEMON"):
+        from pathlib import Path
+
+        from floyd.adapters.inbound.daemon.client import (
+            RemoteConfig,
+            RemoteGitRepository,
+            RemotePRGenerationService,
+            connect_daemon,
+        )
+
+        client = connect_daemon(Path.cwd().resolve(), use_cache)
+        if client:
+            return CLIAdapter(
+                pr_generation_service=RemotePRGenerationService(client),
+                git_repository=RemoteGitRepository(client),
+                config=RemoteConfig(client),
+            )
+
     from floyd.container import create_container
 
+    container = create_container(use_cache=use_cache)
+
+    return CLIAdapter(
+        pr_generation_service=container.pr_generation_service,
+        git_repository=container.git_repository,
+        config=container.config,
+    )
+
+
+def _profiled(mode: str, run: Callable[[], int], trace_path: str) -> int:
+    """Runs `run` with tracing on, then shows where the time went."""
+    import json
+
+    from floyd.application.services.tracing import Tracer, trace_span, tracing_scope
+
+    tracer = Tracer()
     try:
-        container = create_container()
+        with tracing_scope(tracer), trace_span(f"floyd {mode}"):
+            return run()
+    finally:
+        wall = tracer.elapsed()
+        written = ""
+        if trace_path:
+            try:
+                with open(trace_path, "w", encoding="utf-8") as file:
+                    json.dump(tracer.chrome_trace(), file)
+                written = trace_path
+            except OSError as e:
+                print(f"Could not write the trace to {trace_path}: {e.strerror}", file=sys.stderr)
 
-        cli = CLIAdapter(
-            pr_generation_service=container.pr_generation_service,
-            git_repository=container.git_repository,
-            config=container.config,
-        )
+        ui.show_profile(tracer.summary(), wall, written)
+
+
+def main() -> None:
+    argv = sys.argv[1:]
+
+    # Reject bad invocations before anything heavy is imported or validated.
+    args, options = parse_args(argv)
+    if not check_usage(args, options):
+        sys.exit(1)
+
+    profiling = "--profile" in options
+    trace_path = options.get("--profile", "")
+
+    if args[0].lower() == "batch":
+        try:
+            if profiling:
+                sys.exit(_profiled("batch", lambda: run_batch(args[1], options), trace_path))
+            sys.exit(run_batch(args[1], options))
+        except DomainException as e:
+            print(f"Error: {e.message}", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"An unexpected error occurred: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+
+    if args[0].lower() == "daemon":
+        try:
+            sys.exit(run_daemon(args[1].lower(), options))
+        except DomainException as e:
+            ui.show_error(e.message)
+            sys.exit(1)
+        except OSError as e:
+            ui.show_error(f"floyd daemon: {str(e)}")
+            sys.exit(1)
+
+    from floyd.adapters.outbound.git.ref_reader import GitRefReader
+
+    if GitRefReader().is_repo() is False:
+        ui.show_error("Error: This directory is not a git repository.")
+        sys.exit(1)
+
+    try:
+        if profiling:
+            # Spans are only recorded in this process, so the daemon is bypassed.
+            def run() -> int:
+                return _create_cli("--no-cache" not in options, use_daemon=False).run(argv)
 
-        sys.exit(cli.run(sys.argv[1:]))
+            sys.exit(_profiled(args[0].lower(), run, trace_path))
+        sys.exit(_create_cli("--no-cache" not in options).run(argv))
     except DomainException as e:
         ui.show_error(e.message)
 
@@ -1,18 +1,42 @@
+import os
+import sys
 from contextlib import contextmanager
-from typing import Generator
+from functools import cache
+from typing import TYPE_CHECKING, Generator
 
-import questionary
-from rich.color import Color
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.status import Status
-from rich.text import Text
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.spinner import Spinner
+    from rich.status import Status
+    from rich.text import Text
 
-from floyd.domain.entities.commit import Commit
-from floyd.domain.entities.pull_request import PullRequest
+    from floyd.application.dto.call_timing import CallTiming
+    from floyd.application.dto.generation_stats import DraftPreview, GenerationStats
+    from floyd.application.dto.span_summary import SpanSummary
+    from floyd.application.dto.task_progress import TaskProgress
+    from floyd.domain.entities.commit import Commit
+    from floyd.domain.entities.pull_request import PullRequest
+
+# rich and questionary are imported on first use so that usage errors and
+# other early exits don't pay for loading them.
+_console_created = False
+
+
+@cache
+def get_console() -> "Console":
+    global _console_created
+    from rich.console import Console
+
+    _console_created = True
+    return Console()
+
+
+def _print_plain(message: str, ansi: str) -> None:
+    if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+        message = f"\033[{ansi}m{message}\033[0m"
+    print(message)
 
-console = Console()
 
 START_COLOR = "#F54800"
 END_COLOR = "#F5B800"
@@ -39,6 +63,8 @@ ICON = """
 
 
 def _get_transition_color(start_hex: str, end_hex: str, fraction: float) -> str:
+    from rich.color import Color
+
     start_rgb = Color.parse(start_hex).get_truecolor()
     end_rgb = Color.parse(end_hex).get_truecolor()
 
@@ -50,6 +76,8 @@ def _get_transition_color(start_hex: str, end_hex: str, fraction: float) -> str:
 
 
 def show_icon() -> None:
+    from rich.text import Text
+
     stretch = 1.0
 
     lines = ICON.splitlines()
@@ -71,30 +99,68 @@ def show_icon() -> None:
             color = _get_transition_color(START_COLOR, END_COLOR, fraction)
             rich_line.append(char, style=color)
 
-        console.print(rich_line)
+        get_console().print(rich_line)
 
 
-def show_config(provider: str, model: str) -> None:
+def show_config(provider: str, model: str, race: list[str] | None = None) -> None:
     model_info = f" ({model})" if model else ""
-    console.print(f"[gray]Using provider:[/gray] [bold]{provider}[/bold]{model_info}")
+    get_console().print(f"[gray]Using provider:[/gray] [bold]{provider}[/bold]{model_info}")
+
+    if race:
+        get_console().print(f"[gray]Racing providers:[/gray] [bold]{', '.join(race)}[/bold]")
 
 
 def show_custom_instructions(mode: str, active: bool) -> None:
     status = "[bold green]active[/bold green]" if active else "[gray]none[/gray]"
-    console.print(f"[gray]{mode} instructions:[/gray] {status}")
+    get_console().print(f"[gray]{mode} instructions:[/gray] {status}")
 
 
 def show_error(message: str) -> None:
-    console.print(f"[bold red]{message}[/bold red]")
+    if not _console_created:
+        _print_plain(message, "1;31")
+        return
+
+    get_console().print(f"[bold red]{message}[/bold red]")
 
 
 def show_info(message: str) -> None:
-    console.print(f"[gray]{message}[/gray]")
+    get_console().print(f"[gray]{message}[/gray]")
+
+
+def show_timings(timings: list["CallTiming"]) -> None:
+    if not timings:
+        return
+
+    parts = [
+        f"{t.name} {t.duration:.2f}s" + (" (failed)" if t.failed else "")
+        for t in timings
+    ]
+    get_console().print(f"[gray]Git timings: {' · '.join(parts)}[/gray]")
+
+
+# Keyed by TaskState value so the enum is only imported when progress is shown.
+TASK_MARKERS = {
+    "done": "[green]✓[/green]",
+    "failed": "[red]✗[/red]",
+    "cancelled": "[yellow]–[/yellow]",
+    "skipped": "[gray]·[/gray]",
+}
+
+
+def show_task_progress(progress: "TaskProgress") -> None:
+    from floyd.application.dto.task_progress import TaskState
+
+    marker = TASK_MARKERS.get(progress.state.value)
+    if not marker:
+        return
+
+    duration = f" ({progress.duration:.2f}s)" if progress.state is not TaskState.SKIPPED else ""
+    get_console().print(f"{marker} [gray]{progress.label}{duration}[/gray]")
 
 
 @contextmanager
-def show_loading(message: str = "Working...") -> Generator[Status, None, None]:
-    with console.status(
+def show_loading(message: str = "Working...") -> Generator["Status", None, None]:
+    with get_console().status(
         f"[gray]{message}[/gray]",
         spinner="dots",
         spinner_style=SEC_COLOR,
@@ -102,15 +168,150 @@ def show_loading(message: str = "Working...") -> Generator[Status, None, None]:
         yield status
 
 
+class LiveDraft:
+    """A spinner that turns into the draft preview as the draft streams in.
+
+    Called with a `DraftPreview`, it renders the title and body above the
+    spinner; `update` changes the spinner's text, like `Status.update`.
+    """
+
+    def __init__(self, live: "Live", spinner: "Spinner") -> None:
+        self._live = live
+        self._spinner = spinner
+
+    def update(self, message: str) -> None:
+        from rich.text import Text
+
+        self._spinner.update(text=Text(message, style="gray"))
+
+    def __call__(self, preview: "DraftPreview") -> None:
+        from rich.console import Group
+        from rich.panel import Panel
+        from rich.text import Text
+
+        if not preview.title and not preview.body:
+            return
+
+        self._live.update(
+            Group(
+                Panel(
+                    Text(preview.title, style="white"),
+                    title=_get_gradient_text(" Title "),
+                    title_align="left",
+                    border_style=MAIN_COLOR,
+                    padding=(1, 3),
+                ),
+                Panel(
+                    Text(preview.body),
+                    title=_get_gradient_text(" Body "),
+                    title_align="left",
+                    border_style=MAIN_COLOR,
+                    padding=(1, 3),
+                ),
+                self._spinner,
+            )
+        )
+
+
+@contextmanager
+def show_live_draft(message: str = "Generating...") -> Generator[LiveDraft, None, None]:
+    from rich.live import Live
+    from rich.spinner import Spinner
+    from rich.text import Text
+
+    spinner = Spinner("dots", text=Text(message, style="gray"), style=SEC_COLOR)
+
+    with Live(spinner, console=get_console(), refresh_per_second=8, transient=True) as live:
+        yield LiveDraft(live, spinner)
+
+
+def show_generation_stats(subject: str, stats: "GenerationStats") -> None:
+    if stats.cached:
+        show_info(f"{subject} loaded from cache (use --no-cache to regenerate).")
+        return
+
+    timing = ""
+    if stats.time_to_first_token is not None:
+        timing = f" (first token {stats.time_to_first_token:.2f}s, total {stats.total:.2f}s)"
+    elif stats.total:
+        timing = f" ({stats.total:.2f}s)"
+
+    via = f" via {stats.provider}" if stats.provider else ""
+    show_info(f"{subject} created successfully{via}{timing}.")
+
+    if len(stats.attempts) > 1:
+        for attempt in stats.attempts:
+            outcome = "cancelled" if attempt.cancelled else "failed" if attempt.failed else "done"
+            show_info(f"  {attempt.name}: {outcome} after {attempt.duration:.2f}s")
+
+    saved = sum(saving.saved for saving in stats.diff_savings)
+    if saved > 0:
+        steps = ", ".join(
+            f"{saving.name} {_format_size(saving.saved)}" for saving in stats.diff_savings if saving.saved
+        )
+        show_info(f"  Diff minimized by {_format_size(saved)} ({steps}).")
+
+    if stats.map_parts:
+        show_info(f"  Diff summarized in {stats.map_parts} parts first ({stats.map_time:.2f}s).")
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def show_profile(rows: list["SpanSummary"], wall: float, trace_path: str = "") -> None:
+    # On stderr, so it never mixes with what a command writes to stdout.
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title="Profile", title_justify="left", header_style="bold", box=None)
+    table.add_column("Span")
+    table.add_column("Kind", style="dim")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Max", justify="right")
+    table.add_column("Output", justify="right")
+
+    for row in rows:
+        failures = f" [red]({row.failures} failed)[/red]" if row.failures else ""
+        table.add_row(
+            f"{row.name}{failures}",
+            row.category,
+            str(row.calls),
+            f"{row.total:.3f}s",
+            f"{row.longest:.3f}s",
+            _format_size(row.output_bytes) if row.output_bytes else "",
+        )
+
+    console = Console(stderr=True)
+    console.print()
+    console.print(table)
+    console.print(
+        f"[gray]Wall time {wall:.3f}s; nested spans overlap, so totals do not add up to it.[/gray]"
+    )
+    if trace_path:
+        console.print(f"[gray]Trace written to {trace_path} (open it in ui.perfetto.dev).[/gray]")
+
+
 def show_warning(message: str) -> None:
-    console.print(f"[bold yellow]{message}[/bold yellow]")
+    if not _console_created:
+        _print_plain(message, "1;33")
+        return
+
+    get_console().print(f"[bold yellow]{message}[/bold yellow]")
 
 
 def show_success(message: str) -> None:
-    console.print(f"[bold green]{message}[/bold green]")
+    get_console().print(f"[bold green]{message}[/bold green]")
 
 
-def _get_gradient_text(text: str, bold: bool = True) -> Text:
+def _get_gradient_text(text: str, bold: bool = True) -> "Text":
+    from rich.text import Text
+
     if not text:
         return Text("")
 
@@ -127,10 +328,13 @@ def _get_gradient_text(text: str, bold: bool = True) -> Text:
     return rich_text
 
 
-def display_draft(pr: PullRequest) -> None:
+def display_draft(pr: "PullRequest") -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
     padding = (1, 3)
 
-    console.print(
+    get_console().print(
         Panel(
             Text(pr.title, style="white"),
             title=_get_gradient_text(" Title "),
@@ -140,7 +344,7 @@ def display_draft(pr: PullRequest) -> None:
         )
     )
 
-    console.print(
+    get_console().print(
         Panel(
             pr.body,
             title=_get_gradient_text(" Body "),
@@ -151,10 +355,13 @@ def display_draft(pr: PullRequest) -> None:
     )
 
 
-def display_commit_draft(commit: Commit) -> None:
+def display_commit_draft(commit: "Commit") -> None:
+    from rich.panel import Panel
+    from rich.text import Text
+
     padding = (1, 3)
 
-    console.print(
+    get_console().print(
         Panel(
             Text(commit.title, style="white"),
             title=_get_gradient_text(" Title "),
@@ -165,7 +372,7 @@ def display_commit_draft(commit: Commit) -> None:
     )
 
     if commit.body:
-        console.print(
+        get_console().print(
             Panel(
                 commit.body,
                 title=_get_gradient_text(" Body "),
@@ -177,6 +384,8 @@ def display_commit_draft(commit: Commit) -> None:
 
 
 def get_commit_action_choice() -> str | None:
+    import questionary
+
     custom_style = questionary.Style(
         [
             ("qmark", f"fg:{SEC_COLOR} bold"),
@@ -203,10 +412,14 @@ def get_commit_action_choice() -> str | None:
 
 
 def get_refinement_feedback() -> str:
+    from rich.prompt import Prompt
+
     return Prompt.ask("[bold yellow]What should I change?[/bold yellow]")
 
 
 def get_action_choice() -> str | None:
+    import questionary
+
     custom_style = questionary.Style(
         [
             ("qmark", f"fg:{SEC_COLOR} bold"),
@@ -0,0 +1,36 @@
+"""Resident daemon serving floyd calls over a Unix socket."""
+
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.inbound.daemon.client import (
+        DaemonClient,
+        RemoteConfig,
+        RemoteGitRepository,
+        RemotePRGenerationService,
+        connect_daemon,
+    )
+    from floyd.adapters.inbound.daemon.server import FloydDaemon
+
+__all__ = [
+    "DaemonClient",
+    "FloydDaemon",
+    "RemoteConfig",
+    "RemoteGitRepository",
+    "RemotePRGenerationService",
+    "connect_daemon",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DaemonClient": "floyd.adapters.inbound.daemon.client",
+        "FloydDaemon": "floyd.adapters.inbound.daemon.server",
+        "RemoteConfig": "floyd.adapters.inbound.daemon.client",
+        "RemoteGitRepository": "floyd.adapters.inbound.daemon.client",
+        "RemotePRGenerationService": "floyd.adapters.inbound.daemon.client",
+        "connect_daemon": "floyd.adapters.inbound.daemon.client",
+    },
+)
@@ -0,0 +1,233 @@
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from floyd.adapters.inbound.daemon.protocol import (
+    PROTOCOL_VERSION,
+    check_peer,
+    check_private_dir,
+    check_socket_owner,
+    decode,
+    decode_error,
+    default_socket_path,
+    encode,
+    is_supported,
+    read_frame,
+    write_frame,
+)
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.cache_config import CacheConfig
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.dto.generation_stats import DraftPreview, GenerationStats
+from floyd.application.dto.git_config import GitConfig
+from floyd.application.dto.pr_preparation import PRPreparation
+from floyd.application.dto.refinement import Refinement
+from floyd.application.dto.task_progress import TaskProgress
+from floyd.application.dto.timeout_config import TimeoutConfig
+from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
+from floyd.application.ports.outbound.config_port import ConfigPort
+from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
+from floyd.domain.entities.commit import Commit
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
+
+
+class DaemonClient:
+    """Sends one call per connection to a running floyd daemon."""
+
+    def __init__(self, socket_path: Path, cwd: Path, use_cache: bool = True) -> None:
+        self.socket_path = socket_path
+        self.cwd = cwd
+        self.use_cache = use_cache
+
+    def call(self, target: str, method: str, *args: Any, **kwargs: Any) -> Any:
+        return self.request(target, method, *args, **kwargs).get("result")
+
+    def request(self, target: str, method: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        """Makes one call and returns its decoded final frame."""
+        callbacks: dict[str, Callable[[Any], None]] = {}
+
+        def argument(value: Any) -> Any:
+            if callable(value):
+                callback_id = str(len(callbacks))
+                callbacks[callback_id] = value
+                return {"$callback": callback_id}
+            return encode(value)
+
+        request = {
+            "version": PROTOCOL_VERSION,
+            "cwd": str(self.cwd),
+            "use_cache": self.use_cache,
+            "target": target,
+            "method": method,
+            "args": [argument(value) for value in args],
+            "kwargs": {key: argument(value) for key, value in kwargs.items()},
+        }
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(self.socket_path))
+            try:
+                check_peer(conn)
+            except PermissionError as e:
+                raise UnexpectedException(f"Refusing the floyd daemon socket: {e}") from None
+
+            with conn.makefile("rb") as reader, conn.makefile("wb") as writer:
+                write_frame(writer, request)
+
+                while True:
+                    frame = read_frame(reader)
+                    if frame is None:
+                        raise UnexpectedException("The floyd daemon closed the connection.")
+
+                    if "event" in frame:
+                        callback = callbacks.get(str(frame["event"]))
+                        if callback:
+                            callback(decode(frame.get("value")))
+                    elif "error" in frame:
+                        raise decode_error(frame["error"])
+                    else:
+                        stats = frame.get("stats") or {}
+                        return {
+                            "result": decode(frame.get("result")),
+                            "stats": {key: decode(value) for key, value in stats.items()},
+                        }
+
+
+def connect_daemon(cwd: Path, use_cache: bool = True) -> DaemonClient | None:
+    """Returns a client when a daemon answers on the socket, else None."""
+    if not is_supported():
+        return None
+
+    socket_path = default_socket_path()
+    try:
+        check_private_dir(socket_path.parent)
+        check_socket_owner(socket_path)
+    except OSError:
+        # Missing, or not safe to talk to.
+        return None
+
+    client = DaemonClient(socket_path, cwd, use_cache)
+    try:
+        client.call("daemon", "ping")
+    except (OSError, UnexpectedException):
+        return None
+    return client
+
+
+class RemotePRGenerationService(PRGenerationPort):
+
+    def __init__(self, client: DaemonClient) -> None:
+        self._client = client
+        self._lock = threading.Lock()
+        self._generation_stats = GenerationStats()
+        self._timings: list[CallTiming] = []
+
+    def _call(self, method: str, *args: Any) -> Any:
+        frame = self._client.request("pr", method, *args)
+
+        stats = frame.get("stats") or {}
+        with self._lock:
+            if method in ("prepare_pr", "generate_pr_draft", "generate_commit"):
+                self._generation_stats = stats.get("generation") or GenerationStats()
+            if method in ("prepare_pr", "get_git_context"):
+                self._timings = list(stats.get("timings") or [])
+        return frame.get("result")
+
+    def generate_pr_draft(
+        self,
+        context: GitContext,
+        refinement: Refinement | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
+    ) -> PullRequest:
+        return self._call("generate_pr_draft", context, refinement, on_partial)
+
+    def create_pr(self, pr: PullRequest, base_branch: str) -> str:
+        return self._call("create_pr", pr, base_branch)
+
+    def validate_can_create_pr(self, current_branch: str, target_branch: str) -> None:
+        self._call("validate_can_create_pr", current_branch, target_branch)
+
+    def get_git_context(self, target_branch: str, fresh: bool = False) -> GitContext:
+        return self._call("get_git_context", target_branch, fresh)
+
+    def prepare_pr(
+        self,
+        target_branch: str,
+        fresh: bool = False,
+        on_progress: Callable[[TaskProgress], None] | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
+    ) -> PRPreparation:
+        return self._call("prepare_pr", target_branch, fresh, on_progress, on_partial)
+
+    def get_context_timings(self) -> list[CallTiming]:
+        with self._lock:
+            return list(self._timings)
+
+    def generate_commit(
+        self,
+        diff: str,
+        refinement: Refinement | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
+    ) -> Commit:
+        return self._call("generate_commit", diff, refinement, on_partial)
+
+    def last_generation_stats(self) -> GenerationStats:
+        with self._lock:
+            return self._generation_stats
+
+
+class RemoteGitRepository(GitRepositoryPort):
+
+    def __init__(self, client: DaemonClient) -> None:
+        self._client = client
+
+    def fetch(self, base_branch: str | None = None, force: bool = False) -> None:
+        self._client.call("git", "fetch", base_branch, force)
+
+    def is_git_repo(self) -> bool:
+        return self._client.call("git", "is_git_repo")
+
+    def branch_exists(self, branch_name: str) -> bool:
+        return self._client.call("git", "branch_exists", branch_name)
+
+    def get_current_branch(self) -> str:
+        return self._client.call("git", "get_current_branch")
+
+    def get_commits(self, base_branch: str) -> str:
+        return self._client.call("git", "get_commits", base_branch)
+
+    def get_diff(self, base_branch: str) -> str:
+        return self._client.call("git", "get_diff", base_branch)
+
+    def get_diff_stat(self, base_branch: str) -> str:
+        return self._client.call("git", "get_diff_stat", base_branch)
+
+    def get_diff_with_stat(self, base_branch: str) -> tuple[str, str]:
+        diff, stat = self._client.call("git", "get_diff_with_stat", base_branch)
+        return diff, stat
+
+    def get_staged_diff(self) -> str:
+        return self._client.call("git", "get_staged_diff")
+
+    def commit(self, commit: Commit) -> str:
+        return self._client.call("git", "commit", commit)
+
+
+class RemoteConfig(ConfigPort):
+
+    def __init__(self, client: DaemonClient) -> None:
+        self._client = client
+
+    def get_ai_config(self) -> AIConfig:
+        return self._client.call("config", "get_ai_config")
+
+    def get_git_config(self) -> GitConfig:
+        return self._client.call("config", "get_git_config")
+
+    def get_cache_config(self) -> CacheConfig:
+        return self._client.call("config", "get_cache_config")
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        return self._client.call("config", "get_timeout_config")
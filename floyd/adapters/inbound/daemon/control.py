@@ -0,0 +1,72 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from floyd.adapters.inbound.daemon.protocol import default_socket_path, is_supported
+from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
+
+if TYPE_CHECKING:
+    from floyd.adapters.inbound.daemon.client import DaemonClient
+
+START_TIMEOUT = 10.0
+
+
+def serve(idle_timeout: float) -> None:
+    from floyd.adapters.inbound.daemon.server import FloydDaemon
+    from floyd.container import create_container_factory
+
+    _ensure_supported()
+    FloydDaemon(default_socket_path(), create_container_factory(), idle_timeout).serve()
+
+
+def start(idle_timeout: float) -> str:
+    _ensure_supported()
+
+    status_line = status()
+    if status_line:
+        return status_line
+
+    subprocess.Popen(
+        [sys.executable, "-m", "floyd", "daemon", "serve", f"--idle={idle_timeout:g}"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=Path.home(),
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status_line = status()
+        if status_line:
+            return status_line
+        time.sleep(0.05)
+
+    raise UnexpectedException("The floyd daemon did not start. Run 'floyd daemon serve' to see why.")
+
+
+def stop() -> bool:
+    client = _client()
+    if client is None:
+        return False
+
+    client.call("daemon", "shutdown")
+    return True
+
+
+def status() -> str | None:
+    client = _client()
+    return client.call("daemon", "ping") if client else None
+
+
+def _client() -> "DaemonClient | None":
+    from floyd.adapters.inbound.daemon.client import connect_daemon
+
+    return connect_daemon(Path.cwd())
+
+
+def _ensure_supported() -> None:
+    if not is_supported():
+        raise UnexpectedException("The floyd daemon needs Unix domain sockets.")
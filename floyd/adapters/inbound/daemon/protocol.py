@@ -0,0 +1,232 @@
+"""Wire format shared by the floyd daemon and its client.
+
+Every message is one JSON object per line. A connection carries exactly one
+call::
+
+    -> {"version": 1, "cwd": "/repo", "use_cache": true,
+        "target": "pr", "method": "prepare_pr",
+        "args": ["main", false, {"$callback": "0"}, null], "kwargs": {}}
+    <- {"event": "0", "value": {...}}          zero or more callback events
+    <- {"result": {...}, "stats": {...}}       or {"error": {...}}
+
+`target` is one of ``pr``, ``git``, ``config`` or ``daemon``. Callables in
+the arguments are sent as ``{"$callback": id}`` and invoked on the client
+side when the daemon emits an event with that id. Domain objects and DTOs
+travel as ``{"$type": name, "fields": {...}}`` and enums as
+``{"$enum": name, "value": ...}``; only the types listed below are accepted.
+Calls on ``pr`` also return the generation stats and git timings of that
+call under ``stats``, since every call runs on its own services.
+Closing the connection cancels the running call.
+
+The socket and its directory must belong to the user, and both ends check
+the other's uid when the platform reports it.
+"""
+
+import dataclasses
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+from enum import Enum
+from importlib import import_module
+from pathlib import Path
+from typing import IO, Any
+
+from floyd.domain.exceptions.domain_exception import DomainException
+
+PROTOCOL_VERSION = 1
+
+_TYPES = {
+    "Branch": "floyd.domain.value_objects.branch",
+    "Commit": "floyd.domain.entities.commit",
+    "GitContext": "floyd.domain.entities.git_context",
+    "PullRequest": "floyd.domain.entities.pull_request",
+    "AIConfig": "floyd.application.dto.ai_config",
+    "CacheConfig": "floyd.application.dto.cache_config",
+    "CallTiming": "floyd.application.dto.call_timing",
+    "DiffSaving": "floyd.application.dto.generation_stats",
+    "DraftPreview": "floyd.application.dto.generation_stats",
+    "GenerationStats": "floyd.application.dto.generation_stats",
+    "GitConfig": "floyd.application.dto.git_config",
+    "PRPreparation": "floyd.application.dto.pr_preparation",
+    "Refinement": "floyd.application.dto.refinement",
+    "TaskProgress": "floyd.application.dto.task_progress",
+    "TaskState": "floyd.application.dto.task_progress",
+    "TimeoutConfig": "floyd.application.dto.timeout_config",
+    "ProviderType": "floyd.domain.value_objects.ai_provider",
+}
+
+_EXCEPTIONS = {
+    "DomainException": "floyd.domain.exceptions.domain_exception",
+    "InvalidProviderException": "floyd.domain.exceptions.ai.invalid_provider_exception",
+    "InvalidConfigException": "floyd.domain.exceptions.config.invalid_config_exception",
+    "BranchNotFoundException": "floyd.domain.exceptions.git.branch_not_found_exception",
+    "InvalidBranchException": "floyd.domain.exceptions.git.invalid_branch_exception",
+    "PRAlreadyExistsException": "floyd.domain.exceptions.pr.pr_already_exist_exception",
+    "PRGenerationException": "floyd.domain.exceptions.pr.pr_generation_exception",
+    "CommandTimeoutException": "floyd.domain.exceptions.terminal.command_timeout_exception",
+    "MissingDependencyException": "floyd.domain.exceptions.terminal.missing_dependency_exception",
+    "OperationCancelledException": "floyd.domain.exceptions.terminal.operation_cancelled_exception",
+    "UnexpectedException": "floyd.domain.exceptions.terminal.unexpected_exception",
+    "WorkflowTimeoutException": "floyd.domain.exceptions.terminal.workflow_timeout_exception",
+}
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def default_socket_path() -> Path:
+    override = os.environ.get("FLOYD_SOCKET")
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "floyd.sock"
+
+    return Path(tempfile.gettempdir()) / f"floyd-{os.getuid()}" / "daemon.sock"
+
+
+def is_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+def ensure_private_dir(directory: Path) -> None:
+    """Creates the socket's directory for this user only, or checks the one there."""
+    try:
+        directory.mkdir(mode=0o700, parents=True)
+    except FileExistsError:
+        pass
+    check_private_dir(directory)
+
+
+def check_private_dir(directory: Path) -> None:
+    """Raises PermissionError unless `directory` is a real directory only this user can use.
+
+    Another local user could otherwise create it first and listen in place
+    of the daemon.
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{directory} is not a directory owned by you")
+    if info.st_mode & 0o077:
+        raise PermissionError(f"{directory} is accessible to other users (mode {info.st_mode & 0o777:o})")
+
+
+def check_socket_owner(path: Path) -> None:
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{path} is not a socket owned by you")
+
+
+def peer_uid(conn: socket.socket) -> int | None:
+    """The uid of the process on the other end, where the platform reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+
+    credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid
+
+
+def check_peer(conn: socket.socket) -> None:
+    uid = peer_uid(conn)
+    if uid is not None and uid != os.getuid():
+        raise PermissionError(f"The other end of the floyd socket runs as uid {uid}")
+
+
+def write_frame(stream: IO[bytes], frame: dict[str, Any]) -> None:
+    stream.write(json.dumps(frame, separators=(",", ":")).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def read_frame(stream: IO[bytes]) -> dict[str, Any] | None:
+    line = stream.readline()
+    if not line:
+        return None
+
+    try:
+        frame = json.loads(line)
+    except ValueError as e:
+        raise ProtocolError(f"Malformed frame: {e}") from None
+
+    if not isinstance(frame, dict):
+        raise ProtocolError("Frames must be JSON objects")
+    return frame
+
+
+def encode(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)) and not isinstance(value, Enum):
+        return value
+
+    if isinstance(value, Enum):
+        return {"$enum": type(value).__name__, "value": value.value}
+
+    if isinstance(value, (list, tuple)):
+        return [encode(item) for item in value]
+
+    name = type(value).__name__
+    if name not in _TYPES:
+        raise ProtocolError(f"Cannot send values of type {name}")
+
+    if dataclasses.is_dataclass(value):
+        names = [field.name for field in dataclasses.fields(value) if field.init]
+    else:
+        names = list(type(value).model_fields)
+
+    return {"$type": name, "fields": {field: encode(getattr(value, field)) for field in names}}
+
+
+def decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [decode(item) for item in value]
+
+    if not isinstance(value, dict):
+        return value
+
+    if "$enum" in value:
+        return _resolve(_TYPES, value["$enum"])(value["value"])
+
+    if "$type" in value:
+        fields = {name: decode(item) for name, item in value["fields"].items()}
+        return _resolve(_TYPES, value["$type"])(**fields)
+
+    raise ProtocolError("Unexpected object in payload")
+
+
+def encode_error(error: BaseException) -> dict[str, Any]:
+    name = type(error).__name__
+    if isinstance(error, DomainException) and name in _EXCEPTIONS:
+        attributes = {
+            key: item
+            for key, item in vars(error).items()
+            if isinstance(item, (str, int, float, bool)) or item is None
+        }
+        return {"type": name, "attributes": attributes}
+
+    return {
+        "type": "UnexpectedException",
+        "attributes": {"message": f"An unexpected error occurred: {error}"},
+    }
+
+
+def decode_error(payload: dict[str, Any]) -> DomainException:
+    cls = _resolve(_EXCEPTIONS, str(payload.get("type")))
+    attributes = dict(payload.get("attributes") or {})
+    message = str(attributes.get("message", ""))
+
+    # Rebuilt without __init__, whose signature differs per exception.
+    error: DomainException = cls.__new__(cls)
+    Exception.__init__(error, message)
+    error.__dict__.update(attributes, message=message)
+    return error
+
+
+def _resolve(registry: dict[str, str], name: str) -> Any:
+    module = registry.get(name)
+    if module is None:
+        raise ProtocolError(f"Unknown type {name!r}")
+    return getattr(import_module(module), name)
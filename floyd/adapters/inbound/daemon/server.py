@@ -0,0 +1,243 @@
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable
+
+from floyd.adapters.inbound.daemon.protocol import (
+    PROTOCOL_VERSION,
+    ProtocolError,
+    check_peer,
+    decode,
+    encode,
+    encode_error,
+    ensure_private_dir,
+    read_frame,
+    write_frame,
+)
+from floyd.application.services.cancellation import CancellationToken, cancellation_scope
+from floyd.application.services.deadline import deadline_scope
+from floyd.container import Container
+
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+# Methods a client may call on each target; anything else is rejected.
+ALLOWED_METHODS = {
+    "pr": {
+        "prepare_pr",
+        "generate_pr_draft",
+        "create_pr",
+        "validate_can_create_pr",
+        "get_git_context",
+        "generate_commit",
+    },
+    "git": {
+        "fetch",
+        "is_git_repo",
+        "branch_exists",
+        "get_current_branch",
+        "get_commits",
+        "get_diff",
+        "get_diff_stat",
+        "get_diff_with_stat",
+        "get_staged_diff",
+        "commit",
+    },
+    "config": {"get_ai_config", "get_git_config", "get_cache_config", "get_timeout_config"},
+    "daemon": {"ping", "shutdown"},
+}
+
+
+class FloydDaemon:
+    """Serves floyd calls over a Unix socket from a warm, long-lived process.
+
+    Each connection runs in its own thread against a container built for
+    that call and the client's working directory; only connections from the
+    daemon's own user are served. The daemon exits after ``idle_timeout``
+    seconds without a connection.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        container_for: Callable[[Path, bool], Container],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ) -> None:
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self._container_for = container_for
+        self._lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+        self._started = time.monotonic()
+        self._stopping = threading.Event()
+
+    def serve(self) -> None:
+        server = self._bind()
+        try:
+            server.settimeout(min(1.0, self.idle_timeout))
+            while not self._stopping.is_set() and not self._idle():
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    continue
+
+                try:
+                    check_peer(conn)
+                except OSError:
+                    conn.close()
+                    continue
+
+                with self._lock:
+                    self._active += 1
+                    self._last_activity = time.monotonic()
+                threading.Thread(
+                    target=self._serve_connection, args=(conn,), daemon=True
+                ).start()
+        finally:
+            server.close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def _idle(self) -> bool:
+        with self._lock:
+            return self._active == 0 and time.monotonic() - self._last_activity > self.idle_timeout
+
+    def _bind(self) -> socket.socket:
+        ensure_private_dir(self.socket_path.parent)
+
+        if self.socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                # Left behind by a daemon that didn't shut down cleanly.
+                self.socket_path.unlink()
+            else:
+                raise OSError(f"A floyd daemon is already listening on {self.socket_path}")
+            finally:
+                probe.close()
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        previous_umask = os.umask(0o177)
+        try:
+            server.bind(str(self.socket_path))
+        finally:
+            os.umask(previous_umask)
+        server.listen()
+        return server
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        write_lock = threading.Lock()
+        token = CancellationToken()
+
+        try:
+            with conn, conn.makefile("rb") as reader, conn.makefile("wb") as writer:
+
+                def send(frame: dict[str, Any]) -> None:
+                    with write_lock:
+                        try:
+                            write_frame(writer, frame)
+                        except OSError:
+                            token.cancel()
+
+                try:
+                    request = read_frame(reader)
+                    if request is None:
+                        return
+                    call = self._prepare_call(request, send)
+                except Exception as e:
+                    send({"error": encode_error(e)})
+                    return
+
+                threading.Thread(
+                    target=self._watch_disconnect, args=(reader, token), daemon=True
+                ).start()
+
+                try:
+                    with cancellation_scope(token):
+                        frame = call()
+                    send(frame)
+                except Exception as e:
+                    send({"error": encode_error(e)})
+                finally:
+                    # Wakes the disconnect watcher.
+                    try:
+                        conn.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._last_activity = time.monotonic()
+
+    def _watch_disconnect(self, reader: IO[bytes], token: CancellationToken) -> None:
+        try:
+            reader.read(1)
+        except (OSError, ValueError):
+            pass
+        token.cancel()
+
+    def _prepare_call(
+        self, request: dict[str, Any], send: Callable[[dict[str, Any]], None]
+    ) -> Callable[[], dict[str, Any]]:
+        if request.get("version") != PROTOCOL_VERSION:
+            raise ProtocolError(f"Unsupported protocol version {request.get('version')!r}")
+
+        target_name = str(request.get("target"))
+        method = str(request.get("method"))
+        if method not in ALLOWED_METHODS.get(target_name, ()):
+            raise ProtocolError(f"Unknown call {target_name}.{method}")
+
+        def argument(value: Any) -> Any:
+            if isinstance(value, dict) and "$callback" in value:
+                callback_id = str(value["$callback"])
+                return lambda item: send({"event": callback_id, "value": encode(item)})
+            return decode(value)
+
+        args = [argument(value) for value in request.get("args") or []]
+        kwargs = {key: argument(value) for key, value in (request.get("kwargs") or {}).items()}
+
+        if target_name == "daemon":
+            return lambda: {"result": getattr(self, f"_{method}")()}
+
+        cwd = Path(str(request.get("cwd") or "."))
+        if not cwd.is_absolute():
+            raise ProtocolError("cwd must be an absolute path")
+
+        container = self._container_for(cwd, bool(request.get("use_cache", True)))
+        target = {
+            "pr": container.pr_generation_service,
+            "git": container.git_repository,
+            "config": container.config,
+        }[target_name]
+        timeouts = container.config.get_timeout_config()
+
+        service = container.pr_generation_service
+
+        def call() -> dict[str, Any]:
+            with container, deadline_scope(timeouts):
+                frame = {"result": encode(getattr(target, method)(*args, **kwargs))}
+
+            if target_name == "pr":
+                # The services are this call's own, so its stats go back with it.
+                frame["stats"] = {
+                    "generation": encode(service.last_generation_stats()),
+                    "timings": encode(service.get_context_timings()),
+                }
+            return frame
+
+        return call
+
+    def _ping(self) -> str:
+        return f"pid={os.getpid()} uptime={time.monotonic() - self._started:.0f}s"
+
+    def _shutdown(self) -> str:
+        self.stop()
+        return "stopping"
@@ -1,9 +1,14 @@
 """Outbound adapters (secondary/driven adapters)."""
 
-from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
-from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
-from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
-from floyd.adapters.outbound.github.github_cli_adapter import GitHubCLIAdapter
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+    from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
+    from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+    from floyd.adapters.outbound.github.github_cli_adapter import GitHubCLIAdapter
 
 __all__ = [
     "ClaudeAdapter",
@@ -11,3 +16,13 @@ __all__ = [
     "GitHubCLIAdapter",
     "TomlConfigAdapter",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClaudeAdapter": "floyd.adapters.outbound.ai.claude_adapter",
+        "GitCLIAdapter": "floyd.adapters.outbound.git.git_cli_adapter",
+        "GitHubCLIAdapter": "floyd.adapters.outbound.github.github_cli_adapter",
+        "TomlConfigAdapter": "floyd.adapters.outbound.config.toml_config_adapter",
+    },
+)
@@ -1,5 +1,19 @@
 """AI service adapters."""
 
-from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from typing import TYPE_CHECKING
 
-__all__ = ["ClaudeAdapter"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+    from floyd.adapters.outbound.ai.claude_session_adapter import ClaudeSessionAdapter
+
+__all__ = ["ClaudeAdapter", "ClaudeSessionAdapter"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ClaudeAdapter": "floyd.adapters.outbound.ai.claude_adapter",
+        "ClaudeSessionAdapter": "floyd.adapters.outbound.ai.claude_session_adapter",
+    },
+)
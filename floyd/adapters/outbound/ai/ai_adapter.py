@@ -1,71 +1,355 @@
-from abc import ABC
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from floyd.adapters.outbound.ai.diff_budget import CHARS_PER_TOKEN, allocate_diff
+from floyd.adapters.outbound.ai.diff_chunker import chunk_diff
+from floyd.adapters.outbound.ai.diff_minimizer import DiffMinimizer, drop_omitted_files
+from floyd.adapters.outbound.ai.diff_summarizer import DiffSummarizer
+from floyd.adapters.outbound.ai.draft_stream_parser import DraftStreamParser
+from floyd.adapters.outbound.ai.prompt_template import load_template
+from floyd.adapters.outbound.ai.response_cache import ResponseCache
+from floyd.adapters.outbound.git.diff_stat import format_stat, parse_patch_stat
 from floyd.adapters.outbound.utils.terminal import Terminal
 from floyd.application.dto.ai_config import AIConfig
-from floyd.application.ports.outbound.ai_service_port import AIServicePort
+from floyd.application.dto.generation_stats import DiffSaving, DraftPreview, GenerationStats
+from floyd.application.dto.refinement import Refinement
+from floyd.application.ports.outbound.ai_service_port import AIServicePort, PartialCallback
+from floyd.application.services.tracing import trace_span
 from floyd.domain.entities.commit import Commit
 from floyd.domain.entities.git_context import GitContext
 from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.entities.title_rules import validate_title
 from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
 import re
-from pathlib import Path
+
+if TYPE_CHECKING:
+    from floyd.application.services.tracing import MaybeSpan
+
+# Diff budget of a refinement prompt: the draft already covers the rest.
+REFINE_DIFF_TOKENS = 2000
+
+
+@dataclass(frozen=True, slots=True)
+class SessionTurn:
+    """What to send when the provider still holds the conversation.
+
+    `base` is the prompt the conversation was opened with and `message` the
+    short follow-up (feedback) to send instead of the full prompt.
+    """
+
+    base: str
+    message: str | None = None
 
 
 class AIAdapter(AIServicePort, ABC):
+    # Prefixes the provider's errors, e.g. "Claude Code: ...".
+    label = "AI CLI"
 
-    def __init__(self, terminal: Terminal):
+    def __init__(self, terminal: Terminal, cache: ResponseCache | None = None):
         self.terminal = terminal
+        self.cache = cache
+        self._last_stats = GenerationStats()
+        self._diff_savings: list[DiffSaving] = []
+        self._minimized: tuple[tuple[object, ...], str, list[DiffSaving]] | None = None
+        self._summarizer = DiffSummarizer(terminal, cache, self.label)
+        self._map_parts = 0
+        self._map_time = 0.0
 
-    def _build_pr_prompt(
+    def last_generation_stats(self) -> GenerationStats:
+        return self._last_stats
+
+    @abstractmethod
+    def _build_command(self, config: AIConfig) -> list[str]: ...
+
+    def _one_shot_command(self, config: AIConfig) -> list[str]:
+        """The command for a single prompt on stdin, used for the map step."""
+        return self._build_command(config)
+
+    def generate_pr(
         self,
         context: GitContext,
         config: AIConfig,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> PullRequest:
+        summaries = self._summarize(context.diff, config, refinement)
+        prompt = self._build_pr_prompt(context, config, refinement, summaries)
+        command = self._build_command(config)
+        response = self._complete(command, prompt, config, self.label, on_partial)
+        return self._parse_response(response, context.current_branch.name)
+
+    def generate_commit(
+        self,
+        diff: str,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> Commit:
+        summaries = self._summarize(diff, config, refinement)
+        prompt = self._build_commit_prompt(diff, config, refinement, summaries)
+        command = self._build_command(config)
+        response = self._complete(command, prompt, config, self.label, on_partial)
+        return self._parse_commit_response(response)
+
+    def _complete(
+        self,
+        command: list[str],
+        prompt: str,
+        config: AIConfig,
+        error_msg: str,
+        on_partial: PartialCallback | None = None,
+        turn: SessionTurn | None = None,
     ) -> str:
-        template_path = Path(__file__).parent / "prompt.txt"
+        with self._completion_span(prompt, on_partial) as span:
+            start = time.perf_counter()
+            key = self._cache_key(config, prompt)
+
+            cached = self._cached(key, on_partial, start)
+            if cached is not None:
+                span.set(cached=True)
+                return cached
+
+            chunks = self._chunks(command, prompt, error_msg, on_partial is not None, turn)
+            collector = _Collector(on_partial, start)
+            for chunk in chunks:
+                collector.feed(chunk)
+
+            return self._finish(key, collector, start)
+
+    def _completion_span(self, prompt: str, on_partial: PartialCallback | None) -> "MaybeSpan":
+        return trace_span(
+            "completion",
+            "ai",
+            provider=self.label,
+            prompt_chars=len(prompt),
+            streamed=on_partial is not None,
+        )
+
+    def _cache_key(self, config: AIConfig, prompt: str) -> str | None:
+        return self.cache.key(config.provider.value, config.model, prompt) if self.cache else None
+
+    def _cached(
+        self, key: str | None, on_partial: PartialCallback | None, start: float
+    ) -> str | None:
+        if not (self.cache and key):
+            return None
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            self._last_stats = GenerationStats(
+                cached=True,
+                total=time.perf_counter() - start,
+                diff_savings=self._diff_savings,
+                map_parts=self._map_parts,
+                map_time=self._map_time,
+            )
+            if on_partial:
+                parser = DraftStreamParser()
+                parser.feed(cached)
+                on_partial(DraftPreview(title=parser.title, body=parser.body))
+        return cached
+
+    def _finish(self, key: str | None, collector: "_Collector", start: float) -> str:
+        response = collector.text
+
+        self._last_stats = GenerationStats(
+            streamed=collector.on_partial is not None,
+            time_to_first_token=collector.first_token,
+            total=time.perf_counter() - start,
+            diff_savings=self._diff_savings,
+            map_parts=self._map_parts,
+            map_time=self._map_time,
+        )
+
+        if self.cache and key:
+            try:
+                self._extract_title_body(response)
+            except PRGenerationException:
+                return response
+            self.cache.put(key, response)
+
+        return response
+
+    def _chunks(
+        self,
+        command: list[str],
+        prompt: str,
+        error_msg: str,
+        streaming: bool,
+        turn: SessionTurn | None = None,
+    ) -> Iterable[str]:
+        """Runs the provider and yields its response text.
 
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+        `turn` is only used by adapters that keep a conversation open
+        between calls; one-shot adapters always send the full prompt.
+        """
+        if streaming:
+            return self.terminal.stream(command, input_data=prompt, error_msg=error_msg)
+        return [self.terminal.run(command, input_data=prompt, error_msg=error_msg)]
 
-        diff = context.diff
+    def _minimize(self, diff: str, config: AIConfig) -> str:
+        # Refinements rebuild the prompt from the same diff; minimize it once.
+        key = (diff, config.minimize, config.context_lines)
+        if self._minimized is None or self._minimized[0] != key:
+            # Files the git adapter omitted are only there for the stat.
+            with trace_span("minimize diff", "ai", diff_chars=len(diff)):
+                minimized, savings = DiffMinimizer.from_config(config).minimize(
+                    drop_omitted_files(diff)
+                )
+            self._minimized = (key, minimized, savings)
 
-        if config.diff_limit > 0 and len(diff) > config.diff_limit:
-            diff = diff[:config.diff_limit] + "\n\n[... DIFF TRUNCATED ...]"
+        _, minimized, self._diff_savings = self._minimized
+        return minimized
 
+    def _fit_diff(self, diff: str, config: AIConfig) -> str:
+        diff = self._minimize(diff, config)
+        if config.diff_limit <= 0 or len(diff) <= config.diff_limit:
+            return diff
+
+        return allocate_diff(diff, max(config.diff_limit // CHARS_PER_TOKEN, 1))
+
+    def _map_chunks(
+        self, diff: str, config: AIConfig, refinement: Refinement | None = None
+    ) -> list[str] | None:
+        """The diff split for a map-reduce, or None when one prompt is enough."""
+        if not config.map_reduce or (refinement and not config.full_refine):
+            # A delta refinement only sends an excerpt anyway.
+            return None
+
+        diff = self._minimize(diff, config)
+        if len(diff) <= config.chunk_size:
+            return None
+
+        return chunk_diff(diff, config.chunk_size)
+
+    def _summary_prompts(self, chunks: list[str]) -> list[str]:
+        template = load_template("summary_prompt.txt")
+        parts = str(len(chunks))
+        return [
+            template.render({"part": str(number), "parts": parts, "diff": chunk})
+            for number, chunk in enumerate(chunks, 1)
+        ]
+
+    def _summarize(
+        self, diff: str, config: AIConfig, refinement: Refinement | None = None
+    ) -> str | None:
+        """Runs the map step; the summaries for the reduce prompt, or None without one."""
+        start = time.perf_counter()
+
+        chunks = self._map_chunks(diff, config, refinement)
+        self._map_parts = len(chunks) if chunks else 0
+        self._map_time = 0.0
+        if not chunks:
+            return None
+
+        with trace_span("summarize diff", "ai", parts=len(chunks)):
+            summaries = self._summarizer.summarize(
+                self._one_shot_command(config), self._summary_prompts(chunks), config
+            )
+        self._map_time = time.perf_counter() - start
+        return "\n\n".join(
+            f"PART {number}:\n{summary}" for number, summary in enumerate(summaries, 1)
+        )
+
+    def _fit_refine_diff(self, diff: str, config: AIConfig) -> str:
+        limit = REFINE_DIFF_TOKENS
+        if config.diff_limit > 0:
+            limit = min(limit, max(config.diff_limit // CHARS_PER_TOKEN, 1))
+
+        return allocate_diff(self._minimize(diff, config), limit)
+
+    def _build_pr_prompt(
+        self,
+        context: GitContext,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        summaries: str | None = None,
+    ) -> str:
         instructions = f"\nUSER-SPECIFIC INSTRUCTIONS:\n{config.pr_instructions}" if config.pr_instructions else ""
-        feedback_section = f"\nUSER FEEDBACK:\n{feedback}" if feedback else ""
 
-        prompt = template.replace("{{current_branch}}", context.current_branch.name)
-        prompt = prompt.replace("{{target_branch}}", context.target_branch.name)
-        prompt = prompt.replace("{{commits}}", context.commits)
-        prompt = prompt.replace("{{diff_stat}}", context.diff_stat)
-        prompt = prompt.replace("{{instructions}}", instructions)
-        prompt = prompt.replace("{{feedback}}", feedback_section)
-        prompt = prompt.replace("{{diff}}", diff)
+        if refinement and not config.full_refine:
+            return load_template("pr_refine_prompt.txt").render(
+                {
+                    "current_branch": context.current_branch.name,
+                    "target_branch": context.target_branch.name,
+                    "diff_stat": context.diff_stat,
+                    "title": refinement.title,
+                    "body": refinement.body,
+                    "instructions": instructions,
+                    "feedback": _feedback_list(refinement),
+                    "diff": self._fit_refine_diff(context.diff, config),
+                }
+            )
+
+        feedback_section = f"\nUSER FEEDBACK:\n{_feedback_list(refinement)}" if refinement else ""
 
-        return prompt
+        if summaries is not None:
+            return load_template("pr_reduce_prompt.txt").render(
+                {
+                    "current_branch": context.current_branch.name,
+                    "target_branch": context.target_branch.name,
+                    "commits": context.commits,
+                    "diff_stat": context.diff_stat,
+                    "instructions": instructions,
+                    "feedback": feedback_section,
+                    "summaries": summaries,
+                }
+            )
+
+        return load_template("prompt.txt").render(
+            {
+                "current_branch": context.current_branch.name,
+                "target_branch": context.target_branch.name,
+                "commits": context.commits,
+                "diff_stat": context.diff_stat,
+                "instructions": instructions,
+                "feedback": feedback_section,
+                "diff": self._fit_diff(context.diff, config),
+            }
+        )
 
     def _build_commit_prompt(
         self,
         diff: str,
         config: AIConfig,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        summaries: str | None = None,
     ) -> str:
-        template_path = Path(__file__).parent / "commit_prompt.txt"
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            template = f.read()
+        instructions = f"\nUSER-SPECIFIC INSTRUCTIONS:\n{config.commit_instructions}" if config.commit_instructions else ""
 
-        if config.diff_limit > 0 and len(diff) > config.diff_limit:
-            diff = diff[:config.diff_limit] + "\n\n[... DIFF TRUNCATED ...]"
+        if refinement and not config.full_refine:
+            return load_template("commit_refine_prompt.txt").render(
+                {
+                    "diff_stat": format_stat(parse_patch_stat(diff)).strip(),
+                    "title": refinement.title,
+                    "body": refinement.body,
+                    "instructions": instructions,
+                    "feedback": _feedback_list(refinement),
+                    "diff": self._fit_refine_diff(diff, config),
+                }
+            )
 
-        instructions = f"\nUSER-SPECIFIC INSTRUCTIONS:\n{config.commit_instructions}" if config.commit_instructions else ""
-        feedback_section = f"\nUSER FEEDBACK:\n{feedback}" if feedback else ""
+        feedback_section = f"\nUSER FEEDBACK:\n{_feedback_list(refinement)}" if refinement else ""
 
-        prompt = template.replace("{{diff}}", diff)
-        prompt = prompt.replace("{{instructions}}", instructions)
-        prompt = prompt.replace("{{feedback}}", feedback_section)
+        if summaries is not None:
+            return load_template("commit_reduce_prompt.txt").render(
+                {
+                    "diff_stat": format_stat(parse_patch_stat(diff)).strip(),
+                    "instructions": instructions,
+                    "feedback": feedback_section,
+                    "summaries": summaries,
+                }
+            )
 
-        return prompt
+        return load_template("commit_prompt.txt").render(
+            {
+                "diff": self._fit_diff(diff, config),
+                "instructions": instructions,
+                "feedback": feedback_section,
+            }
+        )
 
     def _parse_response(self, response: str, head_branch: str) -> PullRequest:
         title, body = self._extract_title_body(response)
@@ -86,8 +370,47 @@ class AIAdapter(AIServicePort, ABC):
             title = title_match.group(1).split("BODY:")[0].strip()
             body = body_match.group(1).strip()
 
-            return title, body
+            # An unusable title fails here, before the response is cached.
+            return validate_title(title), body
         except PRGenerationException:
             raise
         except Exception as e:
             raise PRGenerationException(f"Failed to parse AI response: {e}")
+
+
+def _feedback_list(refinement: Refinement) -> str:
+    if len(refinement.feedback) == 1:
+        return refinement.latest
+    return "\n".join(f"{number}. {text}" for number, text in enumerate(refinement.feedback, 1))
+
+
+class _Collector:
+    """Joins response chunks, forwarding draft previews as they change."""
+
+    def __init__(self, on_partial: PartialCallback | None, start: float) -> None:
+        self.on_partial = on_partial
+        self.first_token: float | None = None
+        self._start = start
+        self._chunks: list[str] = []
+        self._parser = DraftStreamParser() if on_partial else None
+        self._last_preview = DraftPreview()
+
+    @property
+    def text(self) -> str:
+        if self._parser:
+            return self._parser.text.strip()
+        return "".join(self._chunks).strip()
+
+    def feed(self, chunk: str) -> None:
+        if self._parser is None or self.on_partial is None:
+            self._chunks.append(chunk)
+            return
+
+        if self.first_token is None and chunk.strip():
+            self.first_token = time.perf_counter() - self._start
+
+        self._parser.feed(chunk)
+        preview = DraftPreview(title=self._parser.title, body=self._parser.body)
+        if preview != self._last_preview:
+            self.on_partial(preview)
+            self._last_preview = preview
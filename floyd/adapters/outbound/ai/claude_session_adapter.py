@@ -0,0 +1,207 @@
+import json
+from typing import Any, Iterator
+
+from floyd.adapters.outbound.ai.ai_adapter import SessionTurn
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.ai.prompt_template import load_template
+from floyd.adapters.outbound.ai.response_cache import ResponseCache
+from floyd.adapters.outbound.utils.terminal import Terminal, TerminalProcess
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.refinement import Refinement
+from floyd.application.ports.outbound.ai_service_port import PartialCallback
+from floyd.domain.entities.commit import Commit
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+
+
+class ClaudeSessionAdapter(ClaudeAdapter):
+    """Keeps one `claude` process open and sends refinements as follow-up turns.
+
+    Talks to the CLI over its stream-json input and output. The first request
+    on a context carries the full prompt; feedback on the same context is
+    sent as a short message in the same conversation, so the diff is neither
+    re-sent nor re-read and the CLI starts only once.
+    """
+
+    def __init__(self, terminal: Terminal, cache: ResponseCache | None = None):
+        super().__init__(terminal, cache)
+        self._session: TerminalProcess | None = None
+        self._session_command: list[str] | None = None
+        self._session_base: str | None = None
+
+    def _build_command(self, config: AIConfig) -> list[str]:
+        command = ["claude"]
+
+        if config.model:
+            command.extend(["--model", config.model])
+
+        command.extend(
+            [
+                "-p",
+                "--input-format",
+                "stream-json",
+                "--output-format",
+                "stream-json",
+                "--verbose",
+                "--include-partial-messages",
+            ]
+        )
+        return command
+
+    def _one_shot_command(self, config: AIConfig) -> list[str]:
+        # Chunk summaries don't belong in the conversation.
+        return super()._build_command(config)
+
+    def generate_pr(
+        self,
+        context: GitContext,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> PullRequest:
+        # The conversation is keyed on the first draft's prompt. Its summaries
+        # are kept in memory, so only a fresh draft runs the map step here.
+        base = self._build_pr_prompt(
+            context, config, summaries=self._summarize(context.diff, config)
+        )
+        prompt = base
+        if refinement:
+            summaries = self._summarize(context.diff, config, refinement)
+            prompt = self._build_pr_prompt(context, config, refinement, summaries)
+        response = self._converse(base, prompt, refinement, config, on_partial)
+        return self._parse_response(response, context.current_branch.name)
+
+    def generate_commit(
+        self,
+        diff: str,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> Commit:
+        base = self._build_commit_prompt(diff, config, summaries=self._summarize(diff, config))
+        prompt = base
+        if refinement:
+            summaries = self._summarize(diff, config, refinement)
+            prompt = self._build_commit_prompt(diff, config, refinement, summaries)
+        response = self._converse(base, prompt, refinement, config, on_partial)
+        return self._parse_commit_response(response)
+
+    def close(self) -> None:
+        if self._session:
+            self._session.close()
+        self._session = None
+        self._session_base = None
+
+    def _converse(
+        self,
+        base: str,
+        prompt: str,
+        refinement: Refinement | None,
+        config: AIConfig,
+        on_partial: PartialCallback | None,
+    ) -> str:
+        # The conversation already holds the earlier drafts and feedback; a
+        # fresh session gets `prompt`, which carries them instead.
+        message = (
+            load_template("session_feedback.txt").render({"feedback": refinement.latest})
+            if refinement
+            else None
+        )
+        command = self._build_command(config)
+        response = self._complete(
+            command, prompt, config, self.label, on_partial, SessionTurn(base, message)
+        )
+
+        if self._last_stats.cached:
+            # The conversation never saw this answer; start over next time.
+            self._session_base = None
+
+        return response
+
+    def _chunks(
+        self,
+        command: list[str],
+        prompt: str,
+        error_msg: str,
+        streaming: bool,
+        turn: SessionTurn | None = None,
+    ) -> Iterator[str]:
+        session = self._session
+        if (
+            turn is not None
+            and turn.message is not None
+            and session is not None
+            and session.alive
+            and self._session_command == command
+            and self._session_base == turn.base
+        ):
+            message = turn.message
+        else:
+            self.close()
+            session = self.terminal.open(command, error_msg=error_msg)
+            self._session = session
+            self._session_command = command
+            self._session_base = turn.base if turn else prompt
+            message = prompt
+
+        try:
+            session.send(json.dumps(_user_message(message)))
+            yield from self._read_turn(session, error_msg)
+        except BaseException:
+            # A turn that didn't finish leaves the conversation in an unknown state.
+            self.close()
+            raise
+
+    def _read_turn(self, session: TerminalProcess, error_msg: str) -> Iterator[str]:
+        streamed = False
+        emitted = False
+
+        while True:
+            try:
+                event = json.loads(session.read_line())
+            except ValueError:
+                continue
+            if not isinstance(event, dict):
+                continue
+
+            kind = event.get("type")
+
+            if kind == "stream_event":
+                delta = (event.get("event") or {}).get("delta") or {}
+                if delta.get("type") == "text_delta" and delta.get("text"):
+                    streamed = emitted = True
+                    yield delta["text"]
+
+            elif kind == "assistant" and not streamed:
+                text = _message_text(event.get("message") or {})
+                if text:
+                    emitted = True
+                    yield text
+
+            elif kind == "result":
+                if event.get("is_error") or event.get("subtype") != "success":
+                    detail = event.get("result") or event.get("subtype") or "unknown error"
+                    raise PRGenerationException(f"{error_msg}: {detail}")
+                if not emitted and event.get("result"):
+                    yield str(event["result"])
+                return
+
+
+def _user_message(text: str) -> dict[str, Any]:
+    return {
+        "type": "user",
+        "message": {"role": "user", "content": [{"type": "text", "text": text}]},
+    }
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    content = message.get("content") or []
+    if isinstance(content, str):
+        return content
+
+    return "".join(
+        str(block.get("text", ""))
+        for block in content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
@@ -0,0 +1,240 @@
+from dataclasses import dataclass, field
+
+CHARS_PER_TOKEN = 4
+MARKER_TOKENS = 12
+MIN_TRUNCATED_HUNK_TOKENS = 24
+HEADER_SHARE = 0.5
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class _Hunk:
+    index: int
+    text: str
+    insertions: int
+    deletions: int
+    tokens: int = 0
+    score: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.tokens = estimate_tokens(self.text)
+        # Changed lines per token: hunks made mostly of context say the least.
+        self.score = (self.insertions + self.deletions) / max(self.tokens, 1)
+
+
+@dataclass
+class _FileDiff:
+    header: str
+    hunks: list[_Hunk] = field(default_factory=list[_Hunk])
+
+    @property
+    def demand(self) -> int:
+        return sum(hunk.tokens for hunk in self.hunks)
+
+
+def _with_newline(text: str) -> str:
+    return text if text.endswith("\n") else text + "\n"
+
+
+def _compact_header(header: str) -> str:
+    # Blob ids say nothing to the model and the ---/+++ paths repeat the
+    # "diff --git" line; new, deleted and renamed files keep their own lines.
+    return "".join(
+        line
+        for line in header.splitlines(keepends=True)
+        if not line.startswith(("index ", "--- ", "+++ "))
+    )
+
+
+def _split(text: str, separator: str) -> list[str]:
+    parts: list[str] = []
+    start = 0
+    while True:
+        position = text.find(separator, start)
+        if position < 0:
+            parts.append(text[start:])
+            return parts
+        parts.append(text[start:position + 1])
+        start = position + 1
+
+
+def parse_diff(diff: str) -> list[_FileDiff]:
+    files: list[_FileDiff] = []
+
+    for chunk in _split(diff, "\ndiff --git "):
+        if not chunk:
+            continue
+
+        hunk_start = 0 if chunk.startswith("@@ ") else chunk.find("\n@@ ") + 1
+        if hunk_start == 0 and not chunk.startswith("@@ "):
+            # Binary files, pure renames and mode changes have no hunks.
+            files.append(_FileDiff(header=_with_newline(chunk)))
+            continue
+
+        file_diff = _FileDiff(header=chunk[:hunk_start])
+        for index, text in enumerate(_split(chunk[hunk_start:], "\n@@ ")):
+            text = _with_newline(text)
+            file_diff.hunks.append(
+                _Hunk(
+                    index=index,
+                    text=text,
+                    insertions=text.count("\n+"),
+                    deletions=text.count("\n-"),
+                )
+            )
+        files.append(file_diff)
+
+    return files
+
+
+def _fair_shares(demands: list[int], budget: int) -> list[int]:
+    # Max-min fair split: small files get everything they need and whatever
+    # they leave over is shared among the larger ones.
+    shares = [0] * len(demands)
+    order = sorted(range(len(demands)), key=lambda i: demands[i])
+    remaining = budget
+
+    for position, index in enumerate(order):
+        share = remaining // (len(order) - position)
+        if demands[index] > share:
+            for rest in order[position:]:
+                shares[rest] = share
+            break
+        shares[index] = demands[index]
+        remaining -= demands[index]
+
+    return shares
+
+
+def _truncate(hunk: _Hunk, tokens: int) -> str:
+    cut = hunk.text.rfind("\n", 0, tokens * CHARS_PER_TOKEN)
+    if cut <= 0:
+        return ""
+    return hunk.text[:cut + 1]
+
+
+def _omitted_marker(hunks: list[_Hunk]) -> str:
+    insertions = sum(hunk.insertions for hunk in hunks)
+    deletions = sum(hunk.deletions for hunk in hunks)
+    noun = "hunk" if len(hunks) == 1 else "hunks"
+    return f"[... {len(hunks)} {noun} omitted (+{insertions} -{deletions}) ...]\n"
+
+
+def _file_path(header: str) -> str:
+    lines = header.splitlines()
+    for prefix in ("+++ b/", "rename to ", "--- a/"):
+        for line in lines:
+            if line.startswith(prefix):
+                return line[len(prefix):]
+    first = lines[0] if lines else ""
+    return first.split(" b/", 1)[-1] if first.startswith("diff --git ") else first
+
+
+def _collapsed_line(file_diff: _FileDiff) -> str:
+    insertions = sum(hunk.insertions for hunk in file_diff.hunks)
+    deletions = sum(hunk.deletions for hunk in file_diff.hunks)
+    return f"{_file_path(file_diff.header)} | +{insertions} -{deletions}\n"
+
+
+def allocate_diff(diff: str, max_tokens: int) -> str:
+    """Fits a unified diff into roughly ``max_tokens`` tokens.
+
+    File headers come first (up to half of the budget), the rest is shared
+    fairly between files and, within a file, the hunks with the most changes
+    per token are kept. Dropped hunks are summarised by a marker with their
+    line counts. Files whose headers no longer fit are still listed, one
+    ``path | +a -b`` line each.
+    """
+    if max_tokens <= 0 or estimate_tokens(diff) <= max_tokens:
+        return diff
+
+    files = parse_diff(diff)
+    headers = [_compact_header(file_diff.header) for file_diff in files]
+    lines = [_collapsed_line(file_diff) for file_diff in files]
+    header_budget = int(max_tokens * HEADER_SHARE) - MARKER_TOKENS
+    # listing[i]: listing files i.. one line each, so that every file stays named.
+    listing = [0] * (len(files) + 1)
+    for position in range(len(files) - 1, -1, -1):
+        listing[position] = listing[position + 1] + estimate_tokens(lines[position])
+    spent = 0
+    kept = len(files)
+
+    for position, header in enumerate(headers):
+        cost = estimate_tokens(header) + (MARKER_TOKENS if files[position].hunks else 0)
+        rest = listing[position + 1] + (MARKER_TOKENS if position + 1 < len(files) else 0)
+        if spent + cost + rest > header_budget:
+            # Too many files to show every header: the rest are listed one
+            # line each, without their hunks.
+            kept = position
+            break
+        spent += cost
+
+    collapsed = lines[kept:]
+    if collapsed:
+        noun = "file" if len(collapsed) == 1 else "files"
+        collapsed.insert(0, f"[... {len(collapsed)} more {noun}, hunks omitted ...]\n")
+        spent += listing[kept] + MARKER_TOKENS
+    files, headers = files[:kept], headers[:kept]
+
+    remaining = max(max_tokens - spent, 0)
+
+    shares = _fair_shares([file_diff.demand for file_diff in files], remaining)
+    selected: list[set[int]] = []
+    truncated: dict[int, tuple[int, str]] = {}
+    pool = 0
+
+    for position, file_diff in enumerate(files):
+        allowance = shares[position]
+        chosen: set[int] = set()
+
+        for hunk in sorted(file_diff.hunks, key=lambda h: (-h.score, h.index)):
+            if hunk.tokens <= allowance:
+                chosen.add(hunk.index)
+                allowance -= hunk.tokens
+
+        if not chosen and file_diff.hunks and allowance >= MIN_TRUNCATED_HUNK_TOKENS:
+            best = max(file_diff.hunks, key=lambda h: (h.score, -h.index))
+            text = _truncate(best, allowance - MARKER_TOKENS)
+            if text:
+                truncated[position] = (best.index, text)
+                chosen.add(best.index)
+                allowance -= estimate_tokens(text) + MARKER_TOKENS
+
+        selected.append(chosen)
+        pool += allowance
+
+    # Whatever a file could not spend on whole hunks goes to the best leftovers anywhere.
+    leftovers = [
+        (hunk, position)
+        for position, file_diff in enumerate(files)
+        for hunk in file_diff.hunks
+        if hunk.index not in selected[position]
+    ]
+    for hunk, position in sorted(leftovers, key=lambda item: -item[0].score):
+        if hunk.tokens <= pool:
+            selected[position].add(hunk.index)
+            pool -= hunk.tokens
+
+    parts: list[str] = []
+    for position, file_diff in enumerate(files):
+        parts.append(headers[position])
+        omitted: list[_Hunk] = []
+
+        for hunk in file_diff.hunks:
+            if hunk.index not in selected[position]:
+                omitted.append(hunk)
+            elif truncated.get(position, (-1, ""))[0] == hunk.index:
+                parts.append(truncated[position][1])
+                parts.append("[... hunk truncated ...]\n")
+            else:
+                parts.append(hunk.text)
+
+        if omitted:
+            parts.append(_omitted_marker(omitted))
+
+    parts.extend(collapsed)
+
+    return "".join(parts).rstrip("\n")
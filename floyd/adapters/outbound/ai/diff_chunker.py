@@ -0,0 +1,83 @@
+from floyd.adapters.outbound.ai.diff_minimizer import DiffLine, FileDiff, Hunk, split_diff
+
+# Room for the "@@ ... @@" line a split hunk gets.
+HUNK_HEADER_CHARS = 64
+
+
+def chunk_diff(diff: str, chunk_size: int) -> list[str]:
+    """Splits a diff into pieces of at most about `chunk_size` characters.
+
+    Whole files are packed together where they fit. A larger file is split
+    between hunks and a larger hunk between lines; every piece of a file
+    repeats its header, so each chunk reads as a diff of its own.
+    """
+    chunk_size = max(chunk_size, 1)
+    preamble, files = split_diff(diff)
+
+    pieces = [preamble] if preamble else []
+    for file_diff in files:
+        pieces.extend(_file_pieces(file_diff, chunk_size))
+
+    chunks: list[str] = []
+    current: list[str] = []
+    length = 0
+
+    for piece in pieces:
+        if current and length + len(piece) > chunk_size:
+            chunks.append("".join(current))
+            current, length = [], 0
+        current.append(piece)
+        length += len(piece)
+
+    if current:
+        chunks.append("".join(current))
+
+    return chunks
+
+
+def _file_pieces(file_diff: FileDiff, chunk_size: int) -> list[str]:
+    text = file_diff.render()
+    if len(text) <= chunk_size or not file_diff.hunks:
+        return [text]
+
+    header = "".join(file_diff.header)
+    budget = max(chunk_size - len(header), HUNK_HEADER_CHARS + 1)
+    pieces: list[str] = []
+    current: list[str] = []
+    length = 0
+
+    for hunk in file_diff.hunks:
+        for part in _hunk_parts(hunk, budget):
+            if current and length + len(part) > budget:
+                pieces.append(header + "".join(current))
+                current, length = [], 0
+            current.append(part)
+            length += len(part)
+
+    if current:
+        pieces.append(header + "".join(current))
+
+    return pieces
+
+
+def _hunk_parts(hunk: Hunk, budget: int) -> list[str]:
+    text = hunk.render()
+    if len(text) <= budget:
+        return [text]
+
+    room = budget - HUNK_HEADER_CHARS
+    parts: list[str] = []
+    lines: list[DiffLine] = []
+    length = 0
+
+    for line in hunk.lines:
+        if lines and length + len(line.text) > room:
+            parts.append(Hunk(lines, hunk.section).render())
+            lines, length = [], 0
+        lines.append(line)
+        length += len(line.text)
+
+    if lines:
+        parts.append(Hunk(lines, hunk.section).render())
+
+    return parts
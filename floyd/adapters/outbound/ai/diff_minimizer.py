@@ -0,0 +1,379 @@
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable
+
+from floyd.adapters.outbound.git.diff_stat import OMITTED_PREFIX, header_paths, quote_path
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.generation_stats import DiffSaving
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)$", re.DOTALL)
+_BLOB_RANGE = re.compile(r"^index (\w+)\.\.(\w+)")
+_NULL_BLOB = re.compile(r"^0+$")
+_EMPTY_BLOB = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+# A split costs a hunk header; shorter runs of context are kept instead.
+MIN_SPLIT_BYTES = 40
+
+
+@dataclass
+class DiffLine:
+    kind: str
+    text: str
+    old: int
+    new: int
+
+    @property
+    def content(self) -> str:
+        # Without the +/-/space prefix, but with any "\ No newline" note.
+        return self.text[1:]
+
+
+@dataclass
+class Hunk:
+    lines: list[DiffLine]
+    section: str = "\n"
+
+    @property
+    def changed(self) -> bool:
+        return any(line.kind != " " for line in self.lines)
+
+    def render(self) -> str:
+        old_count = sum(1 for line in self.lines if line.kind != "+")
+        new_count = sum(1 for line in self.lines if line.kind != "-")
+        # An empty side is numbered after the line it would follow.
+        old_start = self.lines[0].old - (0 if old_count else 1)
+        new_start = self.lines[0].new - (0 if new_count else 1)
+
+        header = f"@@ -{_range(old_start, old_count)} +{_range(new_start, new_count)} @@{self.section}"
+        return header + "".join(line.text for line in self.lines)
+
+
+def _range(start: int, count: int) -> str:
+    # Git leaves out a count of one.
+    return str(start) if count == 1 else f"{start},{count}"
+
+
+@dataclass
+class FileDiff:
+    header: list[str]
+    hunks: list[Hunk] = field(default_factory=list[Hunk])
+
+    def has(self, *prefixes: str) -> bool:
+        return any(line.startswith(prefixes) for line in self.header)
+
+    def render(self) -> str:
+        return "".join(self.header) + "".join(hunk.render() for hunk in self.hunks)
+
+
+def split_diff(diff: str) -> tuple[str, list[FileDiff]]:
+    """Splits `git diff` output into a preamble and one entry per file."""
+    preamble: list[str] = []
+    files: list[FileDiff] = []
+    hunk: Hunk | None = None
+    old = new = 0
+
+    for text in diff.splitlines(keepends=True):
+        if text.startswith("diff --git "):
+            files.append(FileDiff(header=[text]))
+            hunk = None
+            continue
+
+        if not files:
+            preamble.append(text)
+            continue
+
+        match = _HUNK_HEADER.match(text)
+        if match:
+            old_start, old_count, new_start, new_count, section = match.groups()
+            old = int(old_start) + (old_count == "0")
+            new = int(new_start) + (new_count == "0")
+            hunk = Hunk(lines=[], section=section if section.endswith("\n") else section + "\n")
+            files[-1].hunks.append(hunk)
+            continue
+
+        if hunk is None:
+            files[-1].header.append(text)
+            continue
+
+        kind = text[0] if text[0] in " +-" else None
+        if text in ("\n", "\r\n"):
+            kind = " "
+
+        if kind is None:
+            # "\ No newline at end of file" and notes such as the truncation
+            # marker stay attached to the line they follow.
+            if hunk.lines:
+                hunk.lines[-1].text += text
+            else:
+                files[-1].header.append(text)
+            continue
+
+        hunk.lines.append(DiffLine(kind, text, old, new))
+        if kind != "+":
+            old += 1
+        if kind != "-":
+            new += 1
+
+    return "".join(preamble), files
+
+
+def render_diff(preamble: str, files: list[FileDiff]) -> str:
+    return preamble + "".join(file_diff.render() for file_diff in files)
+
+
+def drop_omitted_files(diff: str) -> str:
+    """Removes the entries the git adapter left only a stat note for."""
+    if "\n" + OMITTED_PREFIX not in diff and not diff.startswith(OMITTED_PREFIX):
+        return diff
+
+    preamble, files = split_diff(diff)
+    return render_diff(preamble, [file_diff for file_diff in files if not file_diff.has(OMITTED_PREFIX)])
+
+
+def _blob_ids(file_diff: FileDiff) -> tuple[str, str] | None:
+    for line in file_diff.header:
+        match = _BLOB_RANGE.match(line)
+        if match:
+            return match.group(1), match.group(2)
+    return None
+
+
+class DiffTransform(ABC):
+    """One minimization step; it may edit the parsed entries in place."""
+
+    name: str
+
+    @abstractmethod
+    def apply(self, files: list[FileDiff]) -> list[FileDiff]: ...
+
+
+class CollapseRenames(DiffTransform):
+    """Turns a file deleted in one place and added unchanged in another into a rename.
+
+    Git already does this unless renames are turned off (`diff.renames`);
+    its own rename entries lose the similarity line.
+    """
+
+    name = "renames"
+
+    def apply(self, files: list[FileDiff]) -> list[FileDiff]:
+        added: dict[str, int] = {}
+        for position, file_diff in enumerate(files):
+            if file_diff.has("new file mode"):
+                key = self._content_key(file_diff, new=True)
+                if key is not None:
+                    added.setdefault(key, position)
+
+        moves: dict[int, int] = {}
+        for position, file_diff in enumerate(files):
+            if file_diff.has("deleted file mode"):
+                key = self._content_key(file_diff, new=False)
+                target = added.pop(key, None) if key is not None else None
+                if target is not None:
+                    moves[position] = target
+
+        moved = set(moves.values())
+        result: list[FileDiff] = []
+
+        for position, file_diff in enumerate(files):
+            if position in moved:
+                continue
+
+            if position in moves:
+                old, _ = header_paths(file_diff.header)
+                _, new = header_paths(files[moves[position]].header)
+                file_diff = FileDiff(
+                    header=[
+                        f"diff --git {quote_path('a/' + old)} {quote_path('b/' + new)}\n",
+                        f"rename from {quote_path(old)}\n",
+                        f"rename to {quote_path(new)}\n",
+                    ]
+                )
+            elif file_diff.has("rename from"):
+                file_diff.header = [
+                    line for line in file_diff.header if not line.startswith("similarity index")
+                ]
+
+            result.append(file_diff)
+
+        return result
+
+    def _content_key(self, file_diff: FileDiff, new: bool) -> str | None:
+        # Empty files all look alike; pairing them up would invent renames.
+        blobs = _blob_ids(file_diff)
+        if blobs:
+            blob = blobs[1] if new else blobs[0]
+            if _EMPTY_BLOB.startswith(blob):
+                return None
+            if not _NULL_BLOB.match(blob):
+                return "blob:" + blob
+
+        kind = "+" if new else "-"
+        text = "".join(
+            line.content for hunk in file_diff.hunks for line in hunk.lines if line.kind == kind
+        )
+        return "text:" + text if text else None
+
+
+class ElideBinaryAndModeChanges(DiffTransform):
+    """Drops entries the model can do nothing with; the file summary still lists them."""
+
+    name = "binary"
+
+    def apply(self, files: list[FileDiff]) -> list[FileDiff]:
+        return [file_diff for file_diff in files if not self._elided(file_diff)]
+
+    def _elided(self, file_diff: FileDiff) -> bool:
+        if file_diff.has("Binary files ", "GIT binary patch"):
+            return True
+
+        mode_only = not file_diff.hunks and file_diff.has("old mode", "new mode")
+        return mode_only and not file_diff.has("rename from", "copy from")
+
+
+class DropWhitespaceChanges(DiffTransform):
+    """Turns changes that only touch whitespace or blank lines back into context."""
+
+    name = "whitespace"
+
+    def apply(self, files: list[FileDiff]) -> list[FileDiff]:
+        result: list[FileDiff] = []
+
+        for file_diff in files:
+            had_hunks = bool(file_diff.hunks)
+            for hunk in file_diff.hunks:
+                hunk.lines = self._neutralize(hunk.lines)
+            file_diff.hunks = [hunk for hunk in file_diff.hunks if hunk.changed]
+
+            if had_hunks and not file_diff.hunks and not file_diff.has(
+                "rename from", "copy from", "new file mode", "deleted file mode", "old mode"
+            ):
+                continue
+            result.append(file_diff)
+
+        return result
+
+    def _neutralize(self, lines: list[DiffLine]) -> list[DiffLine]:
+        result: list[DiffLine] = []
+        position = 0
+
+        while position < len(lines):
+            if lines[position].kind == " ":
+                result.append(lines[position])
+                position += 1
+                continue
+
+            end = position
+            while end < len(lines) and lines[end].kind != " ":
+                end += 1
+            block = lines[position:end]
+            position = end
+
+            removed = [line for line in block if line.kind == "-"]
+            added = [line for line in block if line.kind == "+"]
+            if self._words(removed) != self._words(added):
+                result.extend(block)
+                continue
+
+            # The new side is kept, numbered as the old lines it replaces.
+            for index, line in enumerate(added):
+                twin = removed[index] if index < len(removed) else None
+                old = twin.old if twin else line.old
+                result.append(DiffLine(" ", " " + line.content, old, line.new))
+
+        return result
+
+    def _words(self, lines: list[DiffLine]) -> list[str]:
+        return [words for line in lines if (words := "".join(line.content.split()))]
+
+
+class ReduceContext(DiffTransform):
+    """Keeps at most `lines` lines of context around each change, splitting hunks."""
+
+    name = "context"
+
+    def __init__(self, lines: int = 2) -> None:
+        self.lines = max(0, lines)
+
+    def apply(self, files: list[FileDiff]) -> list[FileDiff]:
+        for file_diff in files:
+            file_diff.hunks = [part for hunk in file_diff.hunks for part in self._split(hunk)]
+        return files
+
+    def _split(self, hunk: Hunk) -> list[Hunk]:
+        changes = [index for index, line in enumerate(hunk.lines) if line.kind != " "]
+        if not changes:
+            return []
+
+        keep = [False] * len(hunk.lines)
+        for index in changes:
+            for near in range(max(0, index - self.lines), min(len(hunk.lines), index + self.lines + 1)):
+                keep[near] = True
+
+        # Gaps too short to pay for another hunk header stay in.
+        index = changes[0]
+        while index < changes[-1]:
+            if keep[index]:
+                index += 1
+                continue
+            end = index
+            while not keep[end]:
+                end += 1
+            if sum(len(line.text) for line in hunk.lines[index:end]) < MIN_SPLIT_BYTES:
+                keep[index:end] = [True] * (end - index)
+            index = end
+
+        parts: list[Hunk] = []
+        current: list[DiffLine] = []
+        for line, kept in zip(hunk.lines, keep):
+            if kept:
+                current.append(line)
+            elif current:
+                parts.append(Hunk(current, self._section(hunk, parts)))
+                current = []
+        if current:
+            parts.append(Hunk(current, self._section(hunk, parts)))
+
+        return parts
+
+    def _section(self, hunk: Hunk, parts: list[Hunk]) -> str:
+        # The enclosing function git named may not hold the later parts.
+        return "\n" if parts else hunk.section
+
+
+# Keyed by the names in ai_config.DIFF_TRANSFORMS, in the order they run.
+TRANSFORMS: dict[str, Callable[[AIConfig], DiffTransform]] = {
+    "renames": lambda _: CollapseRenames(),
+    "binary": lambda _: ElideBinaryAndModeChanges(),
+    "whitespace": lambda _: DropWhitespaceChanges(),
+    "context": lambda config: ReduceContext(config.context_lines),
+}
+
+
+class DiffMinimizer:
+    """Runs a chain of transforms over a diff and measures what each one saved."""
+
+    def __init__(self, transforms: list[DiffTransform]) -> None:
+        self.transforms = transforms
+
+    @classmethod
+    def from_config(cls, config: AIConfig) -> "DiffMinimizer":
+        return cls([factory(config) for name, factory in TRANSFORMS.items() if name in config.minimize])
+
+    def minimize(self, diff: str) -> tuple[str, list[DiffSaving]]:
+        if not self.transforms or not diff:
+            return diff, []
+
+        preamble, files = split_diff(diff)
+        minimized = diff
+        size = len(diff.encode("utf-8"))
+        savings: list[DiffSaving] = []
+
+        for transform in self.transforms:
+            files = transform.apply(files)
+            minimized = render_diff(preamble, files)
+            new_size = len(minimized.encode("utf-8"))
+            savings.append(DiffSaving(name=transform.name, saved=size - new_size))
+            size = new_size
+
+        return minimized, savings
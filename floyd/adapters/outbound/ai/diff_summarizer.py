@@ -0,0 +1,89 @@
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+from floyd.adapters.outbound.ai.response_cache import ResponseCache
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.services.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    current_cancellation,
+)
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+
+SummaryKey = tuple[tuple[str, ...], str]
+
+
+class DiffSummarizer:
+    """The map step of a map-reduce generation.
+
+    Sends one summary prompt per diff chunk to the provider, at most
+    `config.map_jobs` processes at a time. Summaries are kept for the last
+    diff, so a full refinement only reruns the reduce call; the first
+    failure stops the calls still running.
+    """
+
+    def __init__(self, terminal: Terminal, cache: ResponseCache | None, label: str) -> None:
+        self.terminal = terminal
+        self.cache = cache
+        self.label = label
+        self._summaries: dict[SummaryKey, str] = {}
+
+    def summarize(self, command: list[str], prompts: list[str], config: AIConfig) -> list[str]:
+        keys = [(tuple(command), prompt) for prompt in prompts]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._summaries]
+
+        if missing:
+            self._summaries = {key: self._summaries[key] for key in keys if key in self._summaries}
+            self._run(command, missing, config)
+
+        return [self._summaries[key] for key in keys]
+
+    def _run(self, command: list[str], keys: list[SummaryKey], config: AIConfig) -> None:
+        token = CancellationToken()
+        parent = current_cancellation.get()
+        unregister = parent.on_cancel(token.cancel) if parent else None
+
+        def summarize(prompt: str) -> str:
+            with cancellation_scope(token):
+                return self._summary(command, prompt, config)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(config.map_jobs, len(keys))),
+            thread_name_prefix="floyd-map",
+        )
+        try:
+            futures: dict[Future[str], SummaryKey] = {
+                executor.submit(contextvars.copy_context().run, summarize, key[1]): key
+                for key in keys
+            }
+            for future in as_completed(futures):
+                self._summaries[futures[future]] = future.result()
+        except BaseException:
+            token.cancel()
+            raise
+        finally:
+            executor.shutdown(cancel_futures=True)
+            if unregister:
+                unregister()
+
+    def _summary(self, command: list[str], prompt: str, config: AIConfig) -> str:
+        key = self._cache_key(config, prompt)
+        if key and self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        return self._store(key, self.terminal.run(command, input_data=prompt, error_msg=self.label))
+
+    def _cache_key(self, config: AIConfig, prompt: str) -> str | None:
+        return self.cache.key(config.provider.value, config.model, prompt) if self.cache else None
+
+    def _store(self, key: str | None, summary: str) -> str:
+        summary = summary.strip()
+        if not summary:
+            raise PRGenerationException(f"{self.label}: empty summary for part of the diff")
+
+        if key and self.cache:
+            self.cache.put(key, summary)
+        return summary
@@ -0,0 +1,80 @@
+import re
+
+_TITLE_MARKER = re.compile(r"TITLE:", re.IGNORECASE)
+_BODY_MARKER = re.compile(r"BODY:", re.IGNORECASE)
+
+
+class DraftStreamParser:
+    """Tracks the TITLE/BODY markers of a response while it is still arriving.
+
+    Marker scanning only looks at text that has not been scanned before, so
+    feeding a response chunk by chunk stays linear in its length. The final
+    title and body are still taken from `AIAdapter._extract_title_body`.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._text = ""
+        self._dirty = False
+        self._title_at: int | None = None
+        self._body_at: int | None = None
+        self._title_scan = 0
+        self._body_scan = 0
+        self._title: str | None = None
+
+    def feed(self, chunk: str) -> None:
+        if chunk:
+            self._chunks.append(chunk)
+            self._dirty = True
+
+    @property
+    def text(self) -> str:
+        if self._dirty:
+            self._text += "".join(self._chunks)
+            self._chunks.clear()
+            self._dirty = False
+            self._scan()
+        return self._text
+
+    @property
+    def title(self) -> str:
+        text = self.text
+
+        if self._title is not None:
+            return self._title
+        if self._title_at is None:
+            return ""
+
+        segment = text[self._title_at:].lstrip()
+        line, newline, _ = segment.partition("\n")
+        title = line.split("BODY:")[0].strip()
+
+        if newline and title:
+            self._title = title
+
+        return title
+
+    @property
+    def body(self) -> str:
+        text = self.text
+        if self._body_at is None:
+            return ""
+        return text[self._body_at:].strip()
+
+    def _scan(self) -> None:
+        text = self._text
+        overlap = len("TITLE:") - 1
+
+        if self._title_at is None:
+            match = _TITLE_MARKER.search(text, self._title_scan)
+            if match:
+                self._title_at = match.end()
+            else:
+                self._title_scan = max(0, len(text) - overlap)
+
+        if self._body_at is None:
+            match = _BODY_MARKER.search(text, self._body_scan)
+            if match:
+                self._body_at = match.end()
+            else:
+                self._body_scan = max(0, len(text) - overlap)
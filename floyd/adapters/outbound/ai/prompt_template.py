@@ -0,0 +1,44 @@
+import re
+from functools import cache
+from pathlib import Path
+from typing import Mapping
+
+_SLOT = re.compile(r"\{\{(\w+)\}\}")
+
+
+class PromptTemplate:
+    """A template split once into literal text and ``{{name}}`` slots.
+
+    Rendering joins the pieces in a single pass, so values are copied once
+    and placeholder-like text inside them is never substituted again.
+    """
+
+    def __init__(self, source: str) -> None:
+        self.literals: list[str] = []
+        self.slots: list[str] = []
+
+        position = 0
+        for match in _SLOT.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.slots.append(match.group(1))
+            position = match.end()
+        self.literals.append(source[position:])
+
+    def render(self, values: Mapping[str, str]) -> str:
+        missing = [slot for slot in self.slots if slot not in values]
+        if missing:
+            raise KeyError(f"Missing template values: {', '.join(sorted(set(missing)))}")
+
+        pieces = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            pieces.append(values[slot])
+            pieces.append(literal)
+        return "".join(pieces)
+
+
+@cache
+def load_template(name: str) -> PromptTemplate:
+    template_path = Path(__file__).parent / name
+
+    with open(template_path, "r", encoding="utf-8") as f:
+        return PromptTemplate(f.read())
@@ -0,0 +1,196 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.dto.generation_stats import DraftPreview, GenerationStats
+from floyd.application.dto.refinement import Refinement
+from floyd.application.ports.outbound.ai_service_port import AIServicePort, PartialCallback
+from floyd.application.services.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+    current_cancellation,
+)
+from floyd.domain.entities.commit import Commit
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+from floyd.domain.value_objects.ai_provider import ProviderType
+
+T = TypeVar("T")
+
+
+class RacingAIAdapter(AIServicePort):
+    """Sends the same request to several providers and keeps the first valid draft.
+
+    Every provider runs under its own cancellation token, so the losers' CLI
+    processes are killed as soon as a winner is found.
+    """
+
+    def __init__(self, adapters: dict[ProviderType, AIServicePort]) -> None:
+        self._adapters = adapters
+        self._last_stats = GenerationStats()
+
+    def last_generation_stats(self) -> GenerationStats:
+        return self._last_stats
+
+    def close(self) -> None:
+        for adapter in self._adapters.values():
+            adapter.close()
+
+    def generate_pr(
+        self,
+        context: GitContext,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> PullRequest:
+        return self._race(
+            config,
+            on_partial,
+            lambda adapter, provider_config, partial: adapter.generate_pr(
+                context, provider_config, refinement, partial
+            ),
+        )
+
+    def generate_commit(
+        self,
+        diff: str,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> Commit:
+        return self._race(
+            config,
+            on_partial,
+            lambda adapter, provider_config, partial: adapter.generate_commit(
+                diff, provider_config, refinement, partial
+            ),
+        )
+
+    def _providers(self, config: AIConfig) -> list[ProviderType]:
+        providers = [p for p in (config.race or [config.provider]) if p in self._adapters]
+
+        if not providers:
+            raise PRGenerationException("No AI provider available for racing")
+
+        return providers
+
+    def _provider_config(self, config: AIConfig, provider: ProviderType) -> AIConfig:
+        # Model names are provider specific, so only the primary provider keeps it.
+        model = config.model if provider == config.provider else ""
+        return config.model_copy(update={"provider": provider, "model": model, "race": ()})
+
+    def _race(
+        self,
+        config: AIConfig,
+        on_partial: PartialCallback | None,
+        call: Callable[[AIServicePort, AIConfig, PartialCallback | None], T],
+    ) -> T:
+        providers = self._providers(config)
+        tokens = {provider: CancellationToken() for provider in providers}
+        started = time.perf_counter()
+        lock = threading.Lock()
+        leader: list[ProviderType | None] = [None]
+
+        def partial_for(provider: ProviderType) -> PartialCallback | None:
+            if on_partial is None:
+                return None
+
+            def forward(preview: DraftPreview) -> None:
+                with lock:
+                    if leader[0] is None:
+                        leader[0] = provider
+                    if leader[0] != provider:
+                        return
+                on_partial(preview)
+
+            return forward
+
+        def run(provider: ProviderType) -> tuple[T, float]:
+            with cancellation_scope(tokens[provider]):
+                result = call(
+                    self._adapters[provider],
+                    self._provider_config(config, provider),
+                    partial_for(provider),
+                )
+            return result, time.perf_counter() - started
+
+        def cancel_all() -> None:
+            for token in tokens.values():
+                token.cancel()
+
+        parent = current_cancellation.get()
+        unregister = parent.on_cancel(cancel_all) if parent else None
+
+        executor = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="floyd-race")
+        futures: dict[Future[tuple[T, float]], ProviderType] = {
+            executor.submit(contextvars.copy_context().run, run, provider): provider
+            for provider in providers
+        }
+        attempts: dict[ProviderType, CallTiming] = {}
+        errors: dict[ProviderType, BaseException] = {}
+        winner: tuple[ProviderType, T] | None = None
+
+        try:
+            pending = set(futures)
+            while pending and winner is None:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    provider = futures[future]
+                    try:
+                        result, duration = future.result()
+                    except Exception as e:
+                        errors[provider] = e
+                        attempts[provider] = CallTiming(
+                            name=provider.value,
+                            duration=time.perf_counter() - started,
+                            failed=True,
+                        )
+                        with lock:
+                            if leader[0] == provider:
+                                leader[0] = None
+                        continue
+
+                    attempts[provider] = CallTiming(name=provider.value, duration=duration)
+                    if winner is None:
+                        winner = (provider, result)
+                        with lock:
+                            leader[0] = provider
+        finally:
+            cancel_all()
+            if unregister:
+                unregister()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for provider in providers:
+            if provider not in attempts:
+                attempts[provider] = CallTiming(
+                    name=provider.value,
+                    duration=time.perf_counter() - started,
+                    cancelled=True,
+                )
+
+        winner_stats = (
+            self._adapters[winner[0]].last_generation_stats() if winner else GenerationStats()
+        )
+        self._last_stats = winner_stats.model_copy(
+            update={
+                "provider": winner[0].value if winner else "",
+                "attempts": [attempts[provider] for provider in providers],
+            }
+        )
+
+        if winner is None:
+            details = "; ".join(f"{p.value}: {self._describe(e)}" for p, e in errors.items())
+            raise PRGenerationException(f"All providers failed ({details})")
+
+        return winner[1]
+
+    def _describe(self, error: BaseException) -> str:
+        message = getattr(error, "message", None)
+        return message if isinstance(message, str) else str(error)
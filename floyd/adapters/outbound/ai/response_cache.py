@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import platform
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import cast
+
+ENTRY_SUFFIX = ".z"
+
+
+def default_cache_dir() -> Path:
+    if platform.system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA")
+        root = Path(base) if base else Path.home() / "AppData" / "Local"
+        return root / "floyd" / "cache"
+
+    base = os.environ.get("XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "floyd"
+
+
+class ResponseCache:
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = 50 * 1024 * 1024,
+        ttl: int = 7 * 24 * 3600,
+        bypass: bool = False,
+    ) -> None:
+        self._directory = directory / "responses"
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._bypass = bypass
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, provider: str, model: str, prompt: str) -> str:
+        digest = hashlib.sha256()
+        for part in (provider, model, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        if self._bypass:
+            return None
+
+        path = self._path(key)
+
+        try:
+            data = json.loads(zlib.decompress(path.read_bytes()))
+        except (OSError, ValueError, zlib.error):
+            self.misses += 1
+            return None
+
+        entry = cast(dict[str, object], data) if isinstance(data, dict) else {}
+        created = entry.get("created")
+        response = entry.get("response")
+
+        if not isinstance(created, (int, float)) or not isinstance(response, str):
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        if self._ttl > 0 and time.time() - created > self._ttl:
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self.hits += 1
+        return response
+
+    def put(self, key: str, response: str) -> None:
+        payload = json.dumps({"created": time.time(), "response": response})
+        data = zlib.compress(payload.encode("utf-8"), level=6)
+
+        if len(data) > self._max_bytes:
+            return
+
+        path = self._path(key)
+
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            # A temp file of its own, so concurrent writers never share one.
+            fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, path)
+        except OSError:
+            self._remove(Path(tmp_name))
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+
+        try:
+            for path in self._directory.glob(f"*{ENTRY_SUFFIX}"):
+                stat = path.stat()
+                entries.append((stat.st_mtime, stat.st_size, path))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f"{key}{ENTRY_SUFFIX}"
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
@@ -1,5 +1,23 @@
 """Configuration adapters."""
 
-from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
+from typing import TYPE_CHECKING
 
-__all__ = ["TomlConfigAdapter"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.config.batch_manifest import (
+        BatchManifest,
+        load_batch_manifest,
+    )
+    from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
+
+__all__ = ["BatchManifest", "TomlConfigAdapter", "load_batch_manifest"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchManifest": "floyd.adapters.outbound.config.batch_manifest",
+        "TomlConfigAdapter": "floyd.adapters.outbound.config.toml_config_adapter",
+        "load_batch_manifest": "floyd.adapters.outbound.config.batch_manifest",
+    },
+)
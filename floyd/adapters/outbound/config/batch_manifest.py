@@ -0,0 +1,64 @@
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from floyd.application.dto.batch_item import BatchItem
+from floyd.domain.exceptions.config.invalid_config_exception import (
+    InvalidConfigException,
+)
+
+
+@dataclass(frozen=True)
+class BatchManifest:
+    items: list[BatchItem]
+    jobs: int | None = None
+
+
+def load_batch_manifest(path: Path) -> BatchManifest:
+    """Reads a TOML manifest of ``[[pr]]`` tables with repo, head and target.
+
+    Relative repo paths are resolved against the manifest's directory.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except FileNotFoundError:
+        raise InvalidConfigException(f"Batch manifest not found at {path}.")
+    except tomllib.TOMLDecodeError as e:
+        raise InvalidConfigException(f"Failed to parse batch manifest: {str(e)}")
+    except OSError as e:
+        raise InvalidConfigException(f"Failed to read batch manifest: {str(e)}")
+
+    entries = data.get("pr", [])
+    if not isinstance(entries, list) or not entries:
+        raise InvalidConfigException("Batch manifest must contain at least one [[pr]] entry.")
+
+    base = path.resolve().parent
+    items = [_parse_item(entry, index, base) for index, entry in enumerate(entries, start=1)]
+
+    jobs_raw = data.get("jobs")
+    jobs: int | None = None
+    if jobs_raw is not None:
+        if not isinstance(jobs_raw, int) or isinstance(jobs_raw, bool) or jobs_raw < 1:
+            raise InvalidConfigException("'jobs' must be a positive integer.")
+        jobs = jobs_raw
+
+    return BatchManifest(items=items, jobs=jobs)
+
+
+def _parse_item(entry: Any, index: int, base: Path) -> BatchItem:
+    if not isinstance(entry, dict):
+        raise InvalidConfigException(f"Batch entry {index} must be a table.")
+
+    missing = [key for key in ("head", "target") if not str(entry.get(key) or "").strip()]
+    if missing:
+        raise InvalidConfigException(f"Batch entry {index} is missing {', '.join(missing)}.")
+
+    repo = Path(str(entry.get("repo") or ".")).expanduser()
+
+    return BatchItem(
+        repo=(base / repo).resolve(),
+        head=str(entry["head"]).strip(),
+        target=str(entry["target"]).strip(),
+    )
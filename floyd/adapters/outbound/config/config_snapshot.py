@@ -0,0 +1,73 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_CHECK_INTERVAL = 2.0
+
+
+class ConfigSnapshot:
+    """Parsed contents of a config file, re-read only when the file changes.
+
+    The file is stat'ed at most once per ``check_interval`` seconds and parsed
+    again only when its mtime or size differ. Values derived from the data
+    are cached until the next reload.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        loader: Callable[[Path], dict[str, Any]],
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ) -> None:
+        self.path = path
+        self.check_interval = check_interval
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] | None = None
+        self._signature: tuple[int, int] | None = None
+        self._checked_at = 0.0
+        self._derived: dict[str, Any] = {}
+
+    def data(self) -> dict[str, Any]:
+        with self._lock:
+            return self._refresh()
+
+    def derive(self, name: str, build: Callable[[dict[str, Any]], T]) -> T:
+        with self._lock:
+            data = self._refresh()
+            if name not in self._derived:
+                self._derived[name] = build(data)
+            return self._derived[name]
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data = None
+            self._signature = None
+            self._derived.clear()
+
+    def _refresh(self) -> dict[str, Any]:
+        now = time.monotonic()
+        if self._data is not None and now - self._checked_at < self.check_interval:
+            return self._data
+
+        signature = self._stat()
+        if self._data is None or signature is None or signature != self._signature:
+            # Let the loader report a missing or unreadable file.
+            self._data = None
+            self._derived.clear()
+            self._data = self._loader(self.path)
+            self._signature = signature
+
+        self._checked_at = now
+        return self._data
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -1,8 +1,16 @@
 import platform
 import tomllib
 from pathlib import Path
+from typing import Any
 
-from floyd.application.dto.ai_config import AIConfig
+from floyd.adapters.outbound.config.config_snapshot import (
+    DEFAULT_CHECK_INTERVAL,
+    ConfigSnapshot,
+)
+from floyd.application.dto.ai_config import DEFAULT_MINIMIZE, DIFF_TRANSFORMS, AIConfig
+from floyd.application.dto.cache_config import CacheConfig
+from floyd.application.dto.git_config import GitConfig
+from floyd.application.dto.timeout_config import TimeoutConfig
 from floyd.application.ports.outbound.config_port import ConfigPort
 from floyd.domain.exceptions.ai.invalid_provider_exception import (
     InvalidProviderException,
@@ -10,13 +18,18 @@ from floyd.domain.exceptions.ai.invalid_provider_exception import (
 from floyd.domain.exceptions.config.invalid_config_exception import (
     InvalidConfigException,
 )
-from floyd.domain.value_objects.ai_provider import AIProvider
+from floyd.domain.value_objects.ai_provider import AIProvider, ProviderType
 
 
 class TomlConfigAdapter(ConfigPort):
 
-    def __init__(self, config_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        config_path: Path | None = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ) -> None:
         self._config_path = config_path or self._get_default_config_path()
+        self._snapshot = ConfigSnapshot(self._config_path, self._read, check_interval)
 
     def _get_default_config_path(self) -> Path:
         home = Path.home()
@@ -27,17 +40,26 @@ class TomlConfigAdapter(ConfigPort):
 
         return home / ".config" / "floyd.toml"
 
-    def get_ai_config(self) -> AIConfig:
-        if not self._config_path.exists():
+    def _read(self, path: Path) -> dict[str, Any]:
+        if not path.exists():
             raise InvalidConfigException(
-                f"Configuration file not found at {self._config_path}. "
+                f"Configuration file not found at {path}. "
                 "Please create it or check the path."
             )
 
         try:
-            with open(self._config_path, "rb") as f:
-                data = tomllib.load(f)
+            with open(path, "rb") as f:
+                return tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
+            raise InvalidConfigException(f"Failed to parse TOML file: {str(e)}")
+        except Exception as e:
+            raise InvalidConfigException(f"Configuration error: {str(e)}")
+
+    def get_ai_config(self) -> AIConfig:
+        return self._snapshot.derive("ai", self._parse_ai_config)
 
+    def _parse_ai_config(self, data: dict[str, Any]) -> AIConfig:
+        try:
             ai_section = data.get("ai", {})
 
             raw_provider = str(ai_section.get("provider")).lower().strip()
@@ -59,17 +81,175 @@ class TomlConfigAdapter(ConfigPort):
             pr_instructions = str(ai_section.get("pr_instructions") or "").strip()
             commit_instructions = str(ai_section.get("commit_instructions") or "").strip()
 
+            session = bool(ai_section.get("session", False))
+            full_refine = bool(ai_section.get("full_refine", False))
+
+            minimize_raw = ai_section.get("minimize", list(DEFAULT_MINIMIZE))
+            if not isinstance(minimize_raw, list):
+                raise InvalidConfigException("'minimize' must be a list of diff transforms")
+
+            minimize = tuple(str(item).lower().strip() for item in minimize_raw)
+            unknown = [name for name in minimize if name not in DIFF_TRANSFORMS]
+            if unknown:
+                raise InvalidConfigException(
+                    f"Unknown diff transform(s) {', '.join(unknown)}; "
+                    f"expected any of {', '.join(DIFF_TRANSFORMS)}"
+                )
+
+            context_lines_raw = ai_section.get("context_lines")
+
+            context_lines = 2
+
+            if context_lines_raw is not None:
+                try:
+                    context_lines = max(0, int(context_lines_raw))
+                except (ValueError, TypeError):
+                    context_lines = 2
+
+            map_reduce = bool(ai_section.get("map_reduce", False))
+
+            chunk_size_raw = ai_section.get("chunk_size")
+
+            chunk_size = 40000
+
+            if chunk_size_raw is not None:
+                try:
+                    chunk_size = max(1, int(chunk_size_raw))
+                except (ValueError, TypeError):
+                    chunk_size = 40000
+
+            map_jobs_raw = ai_section.get("map_jobs")
+
+            map_jobs = 4
+
+            if map_jobs_raw is not None:
+                try:
+                    map_jobs = max(1, int(map_jobs_raw))
+                except (ValueError, TypeError):
+                    map_jobs = 4
+
+            race_raw = ai_section.get("race") or []
+            if not isinstance(race_raw, list):
+                raise InvalidConfigException("'race' must be a list of providers")
+
+            race: list[ProviderType] = []
+            for name in [provider.name, *(str(item) for item in race_raw)]:
+                race_type = AIProvider(name=name).type
+                if race_type not in race:
+                    race.append(race_type)
+
             return AIConfig(
                 provider=provider.type,
                 model=model,
                 diff_limit=diff_limit,
                 pr_instructions=pr_instructions,
                 commit_instructions=commit_instructions,
+                race=tuple(race) if len(race) > 1 else (),
+                session=session,
+                full_refine=full_refine,
+                minimize=minimize,
+                context_lines=context_lines,
+                map_reduce=map_reduce,
+                chunk_size=chunk_size,
+                map_jobs=map_jobs,
             )
 
-        except InvalidProviderException as e:
+        except (InvalidProviderException, InvalidConfigException) as e:
             raise e
-        except tomllib.TOMLDecodeError as e:
-            raise InvalidConfigException(f"Failed to parse TOML file: {str(e)}")
         except Exception as e:
             raise InvalidConfigException(f"Configuration error: {str(e)}")
+
+    def get_git_config(self) -> GitConfig:
+        return self._snapshot.derive("git", self._parse_git_config)
+
+    def _parse_git_config(self, data: dict[str, Any]) -> GitConfig:
+        try:
+            git_section = data.get("git", {})
+
+            fetch_ttl_raw = git_section.get("fetch_ttl")
+
+            fetch_ttl = 0
+
+            if fetch_ttl_raw is not None:
+                try:
+                    fetch_ttl = max(0, int(fetch_ttl_raw))
+                except (ValueError, TypeError):
+                    fetch_ttl = 0
+
+            targeted_fetch = bool(git_section.get("targeted_fetch", True))
+
+            exclude_raw = git_section.get("exclude")
+            if exclude_raw is not None and not isinstance(exclude_raw, list):
+                raise InvalidConfigException("'exclude' must be a list of path patterns")
+
+            exclude = (
+                tuple(pattern for item in exclude_raw if (pattern := str(item).strip()))
+                if exclude_raw is not None
+                else GitConfig().exclude
+            )
+
+            gitattributes = bool(git_section.get("gitattributes", True))
+
+            return GitConfig(
+                fetch_ttl=fetch_ttl,
+                targeted_fetch=targeted_fetch,
+                exclude=exclude,
+                gitattributes=gitattributes,
+            )
+
+        except InvalidConfigException as e:
+            raise e
+        except Exception as e:
+            raise InvalidConfigException(f"Configuration error: {str(e)}")
+
+    def get_cache_config(self) -> CacheConfig:
+        return self._snapshot.derive("cache", self._parse_cache_config)
+
+    def _parse_cache_config(self, data: dict[str, Any]) -> CacheConfig:
+        try:
+            cache_section = data.get("cache", {})
+            defaults = CacheConfig()
+
+            enabled = bool(cache_section.get("enabled", defaults.enabled))
+
+            try:
+                ttl = max(0, int(cache_section.get("ttl", defaults.ttl)))
+            except (ValueError, TypeError):
+                ttl = defaults.ttl
+
+            try:
+                max_size_mb = max(0, int(cache_section.get("max_size_mb", defaults.max_size_mb)))
+            except (ValueError, TypeError):
+                max_size_mb = defaults.max_size_mb
+
+            return CacheConfig(enabled=enabled, ttl=ttl, max_size_mb=max_size_mb)
+
+        except Exception as e:
+            raise InvalidConfigException(f"Configuration error: {str(e)}")
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        return self._snapshot.derive("timeouts", self._parse_timeout_config)
+
+    def _parse_timeout_config(self, data: dict[str, Any]) -> TimeoutConfig:
+        timeouts_section = data.get("timeouts", {})
+        if not isinstance(timeouts_section, dict):
+            raise InvalidConfigException("'timeouts' must be a table")
+
+        defaults = TimeoutConfig()
+        values: dict[str, float] = {}
+
+        for key, raw in timeouts_section.items():
+            if isinstance(raw, bool) or not isinstance(raw, (int, float)) or raw < 0:
+                raise InvalidConfigException(
+                    f"'timeouts.{key}' must be a number of seconds (0 for no limit)"
+                )
+            values[str(key).lower()] = float(raw)
+
+        command = values.pop("command", defaults.command)
+        workflow = values.pop("workflow", defaults.workflow)
+
+        return TimeoutConfig(
+            command=command,
+            workflow=workflow,
+            tools=tuple(sorted(values.items())),
+        )
@@ -1,5 +1,19 @@
 """Git CLI adapter."""
 
-from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from typing import TYPE_CHECKING
 
-__all__ = ["GitCLIAdapter"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+    from floyd.adapters.outbound.git.ref_reader import GitRefReader
+
+__all__ = ["GitCLIAdapter", "GitRefReader"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GitCLIAdapter": "floyd.adapters.outbound.git.git_cli_adapter",
+        "GitRefReader": "floyd.adapters.outbound.git.ref_reader",
+    },
+)
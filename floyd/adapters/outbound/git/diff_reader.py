@@ -0,0 +1,106 @@
+from contextlib import closing
+from typing import Iterator
+
+FILE_SEPARATOR = "\ndiff --git "
+TRUNCATION_NOTE = "[... diff truncated while reading ...]\n"
+
+
+class DiffReader:
+    """Collects a streamed ``git diff`` without holding more than it can use.
+
+    Each file keeps at most ``per_file_chars`` and reading stops altogether
+    once ``max_chars`` have been kept or ``max_scan_chars`` have been seen;
+    closing the stream early terminates git.
+    """
+
+    def __init__(self, max_chars: int, per_file_chars: int, max_scan_chars: int) -> None:
+        self.max_chars = max_chars
+        self.per_file_chars = per_file_chars
+        self.max_scan_chars = max_scan_chars
+        self.truncated = False
+        self._parts: list[str] = []
+        self._total = 0
+        self._scanned = 0
+        self._file_chars = 0
+        self._skipping = False
+        self._carry = ""
+
+    def read(self, chunks: Iterator[str]) -> str:
+        with closing(chunks):
+            for chunk in chunks:
+                if not self._consume(chunk):
+                    return self.text
+
+            self._finish()
+
+        return self.text
+
+    def _consume(self, chunk: str) -> bool:
+        """Takes the next chunk; False once reading should stop."""
+        buffer = self._carry + chunk
+        # A separator may straddle two chunks: look for it in the whole
+        # buffer but hold the unfinished tail back for the next round.
+        keep = len(FILE_SEPARATOR) - 1
+        # Feed whole lines so a cut never leaves half a line behind.
+        limit = buffer.rfind("\n", 0, len(buffer) - keep) + 1
+        if not limit:
+            limit = max(len(buffer) - keep, 0)
+        self._carry = buffer[limit:]
+        if not self._feed(buffer, limit):
+            return False
+
+        self._scanned += len(chunk)
+        if self._scanned >= self.max_scan_chars:
+            if not self._skipping:
+                self._parts.append(TRUNCATION_NOTE)
+            self.truncated = True
+            return False
+
+        return True
+
+    def _finish(self) -> None:
+        self._feed(self._carry, len(self._carry))
+        self._carry = ""
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts).strip()
+
+    def _feed(self, buffer: str, limit: int) -> bool:
+        start = 0
+
+        while True:
+            # Any separator found in the buffer starts before ``limit``.
+            boundary = buffer.find(FILE_SEPARATOR, start)
+            end = limit if boundary < 0 else boundary + 1
+
+            if not self._append(buffer[start:end]):
+                return False
+
+            if boundary < 0:
+                return True
+
+            start = end
+            self._file_chars = 0
+            self._skipping = False
+
+    def _append(self, segment: str) -> bool:
+        if self._skipping or not segment:
+            return True
+
+        file_room = self.per_file_chars - self._file_chars
+        total_room = self.max_chars - self._total
+        if len(segment) <= min(file_room, total_room):
+            self._parts.append(segment)
+            self._total += len(segment)
+            self._file_chars += len(segment)
+            return True
+
+        room = min(file_room, total_room)
+        cut = segment.rfind("\n", 0, max(room, 0)) + 1
+        self._parts.append(segment[:cut] + TRUNCATION_NOTE)
+        self._total += cut
+        self._file_chars += cut
+        self._skipping = True
+        self.truncated = True
+        return file_room < total_room
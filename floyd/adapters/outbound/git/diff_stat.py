@@ -0,0 +1,448 @@
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, Mapping
+
+STAT_WIDTH = 80
+
+_HUNK_HEADER = re.compile(r"^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@")
+# Stands in for the hunks of a file left out of the diff body.
+_OMITTED_NOTE = re.compile(r"^\[omitted ([\w-]+) file: \+(\d+) -(\d+)\]$")
+OMITTED_PREFIX = "[omitted "
+# A side of `index <old>..<new>` that does not exist, as in an added file.
+_MISSING_BLOB = re.compile(r"^0+$")
+_INDEX_LINE = re.compile(r"^index ([0-9a-f]+)\.\.([0-9a-f]+)")
+_QUOTED_PART = re.compile(r'\\([0-7]{3}|.)|([^\\]+)', re.DOTALL)
+_ESCAPES = {"a": 7, "b": 8, "t": 9, "n": 10, "v": 11, "f": 12, "r": 13}
+
+
+@dataclass(frozen=True)
+class NumstatEntry:
+    path: str
+    insertions: int
+    deletions: int
+    binary: bool = False
+    omitted: str = ""
+    # Abbreviated blob ids from the `index` line, for sizing binary files.
+    blobs: tuple[str, str] = ("", "")
+
+    @property
+    def changes(self) -> int:
+        return self.insertions + self.deletions
+
+
+def omitted_note(kind: str, insertions: int, deletions: int) -> str:
+    return f"{OMITTED_PREFIX}{kind} file: +{insertions} -{deletions}]\n"
+
+
+def _unquote(path: str) -> str:
+    """Undoes git's C-style quoting of paths with special or non-ASCII bytes."""
+    if len(path) < 2 or path[0] != '"' or path[-1] != '"':
+        return path
+
+    data = bytearray()
+    for match in _QUOTED_PART.finditer(path[1:-1]):
+        escape, text = match.groups()
+        if text is not None:
+            data += text.encode("utf-8")
+        elif len(escape) == 3:
+            data.append(int(escape, 8))
+        else:
+            data += bytes([_ESCAPES[escape]]) if escape in _ESCAPES else escape.encode("utf-8")
+    return data.decode("utf-8", errors="replace")
+
+
+def quote_path(path: str) -> str:
+    """Quotes a path the way git shows it, the inverse of `_unquote`."""
+    data = path.encode("utf-8")
+    if not any(byte < 0x20 or byte >= 0x7F or byte in b'"\\' for byte in data):
+        return path
+
+    names = {value: key for key, value in _ESCAPES.items()}
+    parts: list[str] = []
+    for byte in data:
+        if byte in b'"\\':
+            parts.append("\\" + chr(byte))
+        elif byte in names:
+            parts.append("\\" + names[byte])
+        elif byte < 0x20 or byte >= 0x7F:
+            parts.append(f"\\{byte:03o}")
+        else:
+            parts.append(chr(byte))
+    return '"' + "".join(parts) + '"'
+
+
+def _strip_prefix(path: str) -> str:
+    path = _unquote(path)
+    if path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def _patch_path(line: str) -> str | None:
+    """The path of a `--- ` or `+++ ` line, or None for /dev/null."""
+    # git ends the line with a tab when an unquoted name contains a space.
+    name = line[4:].rstrip("\n").removesuffix("\t")
+    return None if name == "/dev/null" else _strip_prefix(name)
+
+
+def _git_line_paths(line: str) -> tuple[str, str]:
+    names = line[len("diff --git "):].rstrip("\n")
+
+    if names.startswith('"'):
+        match = re.match(r'("(?:[^"\\]|\\.)*") (.*)$', names)
+        if match:
+            return _strip_prefix(match.group(1)), _strip_prefix(match.group(2))
+    elif names.endswith('"'):
+        old, _, new = names.rpartition(' "')
+        return _strip_prefix(old), _strip_prefix('"' + new)
+
+    # Unquoted, the line is only unambiguous when both sides name the same
+    # file; a rename carries `rename from`/`rename to` lines to read instead.
+    half = (len(names) - 1) // 2
+    if names[half:half + 1] == " " and names[2:half] == names[half + 3:]:
+        return names[2:half], names[half + 3:]
+
+    old, _, new = names.partition(" b/")
+    return _strip_prefix(old), new
+
+
+def header_paths(lines: Iterable[str]) -> tuple[str, str]:
+    """The old and new path of one file's diff, from its header lines.
+
+    `rename`/`copy` lines and then the `---`/`+++` lines are preferred over
+    the `diff --git` line, which cannot be split reliably when the two
+    names differ. A side that does not exist takes the other side's path.
+    """
+    git_line = ("", "")
+    extended: list[str | None] = [None, None]
+    patch: list[str | None] = [None, None]
+
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith("diff --git "):
+            git_line = _git_line_paths(line)
+        elif line.startswith(("rename from ", "copy from ")):
+            extended[0] = _unquote(line.split(" ", 2)[2])
+        elif line.startswith(("rename to ", "copy to ")):
+            extended[1] = _unquote(line.split(" ", 2)[2])
+        elif line.startswith("--- "):
+            patch[0] = _patch_path(line)
+        elif line.startswith("+++ "):
+            patch[1] = _patch_path(line)
+
+    old = extended[0] or patch[0] or git_line[0]
+    new = extended[1] or patch[1] or git_line[1]
+    return old or new, new or old
+
+
+def _rename_display(old: str, new: str) -> str:
+    prefix = 0
+    for index, (a, b) in enumerate(zip(old, new)):
+        if a != b:
+            break
+        if a == "/":
+            prefix = index + 1
+
+    suffix = 0
+    old_end, new_end = len(old), len(new)
+    while old_end > prefix and new_end > prefix and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+        if old[old_end] == "/":
+            suffix = len(old) - old_end
+
+    if not prefix and not suffix:
+        return f"{old} => {new}"
+
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+    return f"{old[:prefix]}{{{old_mid} => {new_mid}}}{old[len(old) - suffix:]}"
+
+
+class _FileStat:
+
+    def __init__(self, header: str) -> None:
+        self.path = _git_line_paths(header)[1]
+        self.old_path: str | None = None
+        self.new_path: str | None = None
+        self.rename_from: str | None = None
+        self.rename_to: str | None = None
+        self.insertions = 0
+        self.deletions = 0
+        self.binary = False
+        self.omitted = ""
+        self.blobs = ("", "")
+
+    def to_entry(self) -> NumstatEntry:
+        if self.rename_from is not None and self.rename_to is not None:
+            path = _rename_display(self.rename_from, self.rename_to)
+        else:
+            path = quote_path(self.new_path or self.old_path or self.path)
+
+        return NumstatEntry(
+            path=path,
+            insertions=self.insertions,
+            deletions=self.deletions,
+            binary=self.binary,
+            omitted=self.omitted,
+            blobs=self.blobs,
+        )
+
+
+def parse_patch_stat(diff: str) -> list[NumstatEntry]:
+    entries: list[NumstatEntry] = []
+    current: _FileStat | None = None
+    old_left = new_left = 0
+
+    for line in diff.split("\n"):
+        if current and (old_left > 0 or new_left > 0):
+            marker = line[:1]
+            if marker == "+":
+                new_left -= 1
+                current.insertions += 1
+            elif marker == "-":
+                old_left -= 1
+                current.deletions += 1
+            elif marker != "\\":
+                old_left -= 1
+                new_left -= 1
+            continue
+
+        if line.startswith("diff --git "):
+            if current:
+                entries.append(current.to_entry())
+            current = _FileStat(line)
+        elif current is None:
+            continue
+        elif line.startswith("@@ "):
+            match = _HUNK_HEADER.match(line)
+            if match:
+                old_left = int(match.group(1) or 1)
+                new_left = int(match.group(2) or 1)
+        elif line.startswith("--- "):
+            current.old_path = _patch_path(line) or current.old_path
+        elif line.startswith("+++ "):
+            current.new_path = _patch_path(line) or current.new_path
+        elif line.startswith("rename from "):
+            current.rename_from = _unquote(line[len("rename from "):])
+        elif line.startswith("rename to "):
+            current.rename_to = _unquote(line[len("rename to "):])
+        elif line.startswith("index "):
+            index = _INDEX_LINE.match(line)
+            if index:
+                current.blobs = (index.group(1), index.group(2))
+        elif line.startswith("Binary files ") or line == "GIT binary patch":
+            current.binary = True
+        elif line.startswith(OMITTED_PREFIX):
+            note = _OMITTED_NOTE.match(line)
+            if note:
+                current.omitted = note.group(1)
+                current.insertions += int(note.group(2))
+                current.deletions += int(note.group(3))
+
+    if current:
+        entries.append(current.to_entry())
+
+    return entries
+
+
+def parse_numstat(
+    output: str, classify: Callable[[str], str | None] | None = None
+) -> list[NumstatEntry]:
+    """Entries from `git diff --raw --numstat -z`.
+
+    `classify` names the files left out of the diff body, as `DiffPathFilter`
+    would, so the stat can mark them the same way.
+    """
+    fields = output.split("\0")
+    blobs: list[tuple[str, str]] = []
+    entries: list[NumstatEntry] = []
+    index = 0
+
+    while index < len(fields):
+        field = fields[index]
+        if not field:
+            index += 1
+        elif field.startswith(":"):
+            # ":<old mode> <new mode> <old blob> <new blob> <status>", then the paths.
+            _, _, old_blob, new_blob, status = field.split()
+            blobs.append((old_blob, new_blob))
+            index += 3 if status[:1] in ("R", "C") else 2
+        else:
+            insertions, deletions, path = field.split("\t", 2)
+            if path:
+                old = new = path
+                index += 1
+            else:
+                old, new = fields[index + 1], fields[index + 2]
+                index += 3
+
+            binary = insertions == "-"
+            entries.append(
+                NumstatEntry(
+                    path=_rename_display(old, new) if old != new else quote_path(new),
+                    insertions=0 if binary else int(insertions),
+                    deletions=0 if binary else int(deletions),
+                    binary=binary,
+                    omitted=(classify(new) if classify else None) or "",
+                    blobs=blobs[len(entries)] if len(entries) < len(blobs) else ("", ""),
+                )
+            )
+
+    return entries
+
+
+def binary_blobs(entries: Iterable[NumstatEntry]) -> list[str]:
+    """The blob ids whose sizes `format_stat` needs for binary files."""
+    return [
+        blob
+        for entry in entries
+        if entry.binary
+        for blob in entry.blobs
+        if blob and not _MISSING_BLOB.match(blob)
+    ]
+
+
+def parse_blob_sizes(output: str) -> dict[str, int]:
+    """Sizes from `git cat-file --batch-check` run on `binary_blobs`, by the id asked."""
+    sizes: dict[str, int] = {}
+    for line in output.splitlines():
+        # "<id> <type> <size>", or "<name> missing" for an unknown one.
+        fields = line.split()
+        if len(fields) == 3 and fields[2].isdigit():
+            sizes[fields[0]] = int(fields[2])
+    return sizes
+
+
+def _binary_sizes(entry: NumstatEntry, sizes: Mapping[str, int]) -> tuple[int, int] | None:
+    # cat-file answers with the full id; the diff has an abbreviated one.
+    def size(blob: str) -> int | None:
+        if _MISSING_BLOB.match(blob):
+            return 0
+        return next((value for key, value in sizes.items() if key.startswith(blob)), None)
+
+    old, new = (size(blob) if blob else None for blob in entry.blobs)
+    return (old, new) if old is not None and new is not None else None
+
+
+def _scale(value: int, width: int, max_change: int) -> int:
+    if not value:
+        return 0
+    return 1 + (value * (width - 1)) // max_change
+
+
+def _graph(entry: NumstatEntry, width: int, max_change: int) -> str:
+    added, removed = entry.insertions, entry.deletions
+
+    if width <= max_change:
+        total = _scale(added + removed, width, max_change)
+        if total < 2 and added and removed:
+            total = 2
+        if added < removed:
+            added = _scale(added, width, max_change)
+            removed = total - added
+        else:
+            removed = _scale(removed, width, max_change)
+            added = total - removed
+
+    return "+" * added + "-" * removed
+
+
+def _widths(
+    entries: list[NumstatEntry], binaries: dict[int, tuple[int, int]], width: int
+) -> tuple[int, int, int]:
+    """Name, number and graph widths, sized the way `git diff --stat` does."""
+    max_len = max(len(entry.path) for entry in entries)
+    max_change = max((entry.changes for entry in entries if not entry.binary), default=0)
+    number_width = len(str(max_change))
+    bin_width = 0
+    for index, entry in enumerate(entries):
+        if entry.binary:
+            number_width = max(number_width, 3)
+            old, new = binaries.get(index, (0, 0))
+            # len("Bin X -> Y bytes")
+            bin_width = max(bin_width, 14 + len(str(old)) + len(str(new)))
+
+    # At least 6 columns for the graph and 10 for the name.
+    width = max(width, 16 + 6 + number_width)
+    graph_width = max_change if max_change + 4 > bin_width else bin_width - 4
+    name_width = max_len
+
+    if name_width + number_width + 6 + graph_width > width:
+        if graph_width > width * 3 // 8 - number_width - 6:
+            graph_width = max(width * 3 // 8 - number_width - 6, 6)
+        if name_width > width - number_width - 6 - graph_width:
+            name_width = width - number_width - 6 - graph_width
+        else:
+            graph_width = width - number_width - 6 - name_width
+
+    return name_width, number_width, graph_width
+
+
+def _fit_name(path: str, width: int) -> str:
+    """Shortens a name from the left to `width`, as git does, padding it."""
+    if len(path) <= width:
+        return path.ljust(width)
+
+    tail = path[len(path) - max(width - 3, 0):]
+    slash = tail.find("/")
+    if slash >= 0:
+        tail = tail[slash:]
+    return ("..." + tail).ljust(width)
+
+
+def format_stat(
+    entries: list[NumstatEntry],
+    width: int = STAT_WIDTH,
+    sizes: Mapping[str, int] | None = None,
+) -> str:
+    """The `git diff --stat` summary of `entries`, laid out like git's.
+
+    Binary files show `Bin X -> Y bytes` when `sizes` (see `binary_blobs`)
+    has both blobs, and just `Bin` otherwise. Files the git adapter left out
+    of the diff are marked as such.
+    """
+    if not entries:
+        return ""
+
+    binaries: dict[int, tuple[int, int]] = {}
+    for index, entry in enumerate(entries):
+        known = _binary_sizes(entry, sizes) if entry.binary and sizes is not None else None
+        if known is not None:
+            binaries[index] = known
+
+    name_width, number_width, graph_width = _widths(entries, binaries, width)
+    max_change = max((entry.changes for entry in entries if not entry.binary), default=0)
+
+    lines: list[str] = []
+    insertions = deletions = 0
+
+    for index, entry in enumerate(entries):
+        name = _fit_name(entry.path, name_width)
+        note = f" ({entry.omitted}, not in diff)" if entry.omitted else ""
+
+        if entry.binary:
+            line = f" {name} | {'Bin'.rjust(number_width)}"
+            old, new = binaries.get(index, (0, 0))
+            if old or new:
+                line += f" {old} -> {new} bytes"
+            lines.append(line + note)
+            continue
+
+        insertions += entry.insertions
+        deletions += entry.deletions
+
+        graph = _graph(entry, graph_width, max_change)
+        count = str(entry.changes).rjust(number_width)
+        separator = " " if entry.changes else ""
+        lines.append(f" {name} | {count}{separator}{graph}" + note)
+
+    files = len(entries)
+    summary = f" {files} file{'s' if files != 1 else ''} changed"
+    if insertions or not deletions:
+        summary += f", {insertions} insertion{'s' if insertions != 1 else ''}(+)"
+    if deletions or not insertions:
+        summary += f", {deletions} deletion{'s' if deletions != 1 else ''}(-)"
+    lines.append(summary)
+
+    return "\n".join(lines)
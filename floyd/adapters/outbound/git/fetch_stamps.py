@@ -0,0 +1,60 @@
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import cast
+
+STAMP_FILE = "floyd-fetch.json"
+
+
+class FetchStamps:
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def _read(self) -> dict[str, float]:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data: object = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(data, dict):
+            return {}
+
+        return {
+            ref: float(stamp)
+            for ref, stamp in cast(dict[str, object], data).items()
+            if isinstance(stamp, (int, float))
+        }
+
+    def stale(self, refs: list[str], ttl: int) -> list[str]:
+        if ttl <= 0:
+            return list(refs)
+
+        stamps = self._read()
+        now = time.time()
+
+        return [ref for ref in refs if now - stamps.get(ref, 0.0) >= ttl]
+
+    def touch(self, refs: list[str]) -> None:
+        stamps = self._read()
+        now = time.time()
+        stamps.update({ref: now for ref in refs})
+
+        try:
+            # Batch runs and the daemon may touch the same file at once.
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(stamps, f)
+            os.replace(tmp_name, self._path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
@@ -1,85 +1,301 @@
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from floyd.adapters.outbound.git.diff_reader import DiffReader
+from floyd.adapters.outbound.git.diff_stat import (
+    NumstatEntry,
+    binary_blobs,
+    format_stat,
+    parse_blob_sizes,
+    parse_numstat,
+    parse_patch_stat,
+)
+from floyd.adapters.outbound.git.fetch_stamps import STAMP_FILE, FetchStamps
+from floyd.adapters.outbound.git.path_classifier import DiffPathFilter, PathClassifier
+from floyd.adapters.outbound.git.ref_reader import GitRefReader
 from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
 from floyd.adapters.outbound.utils.terminal import Terminal
 from floyd.domain.entities.commit import Commit
+from floyd.domain.exceptions.domain_exception import DomainException
+
+# Files listed in the diff stat but left out of the diff body by default.
+DIFF_EXCLUDES = ("*.lock", "*-lock.json", "*.min.js", "*.min.css")
+# How much more than diff_limit to keep, and to scan past oversized files, so
+# the prompt budget can still pick the most useful hunks across files.
+DIFF_READ_FACTOR = 8
+DIFF_SCAN_FACTOR = 64
+FETCH_ERROR = "Failed to sync with remote repository."
 
 
 class GitCLIAdapter(GitRepositoryPort):
 
-    def __init__(self, terminal: Terminal):
+    def __init__(
+        self,
+        terminal: Terminal,
+        single_pass_diff: bool = True,
+        ref_reader: GitRefReader | None = None,
+        targeted_fetch: bool = True,
+        fetch_ttl: int = 0,
+        diff_limit: int = -1,
+        cwd: Path | None = None,
+        head: str | None = None,
+        path_rules: Iterable[str] = DIFF_EXCLUDES,
+        gitattributes: bool = True,
+    ):
         self.terminal = terminal
+        self.single_pass_diff = single_pass_diff
+        self.ref_reader = ref_reader
+        self.targeted_fetch = targeted_fetch
+        self.fetch_ttl = fetch_ttl
+        self.diff_limit = diff_limit
+        self.cwd = cwd
+        self.head = head
+        self.path_rules = tuple(path_rules)
+        self.gitattributes = gitattributes
 
-    def fetch(self) -> None:
-        self.terminal.run(
-            ["git", "fetch", "origin", "--prune"],
-            error_msg="Failed to sync with remote repository.",
-        )
+    def _run(self, command: list[str], **kwargs: Any) -> str:
+        return self.terminal.run(command, cwd=self.cwd, **kwargs)
+
+    def _stream(self, command: list[str], **kwargs: Any) -> Iterator[str]:
+        return self.terminal.stream(command, cwd=self.cwd, **kwargs)
+
+    def _revision_range(self, base_branch: str) -> str:
+        return f"origin/{base_branch}..{self.head or 'HEAD'}"
+
+    def _resolve_git_path(self, output: str) -> Path:
+        path = Path(output)
+        return self.cwd / path if self.cwd else path
+
+    def fetch(self, base_branch: str | None = None, force: bool = False) -> None:
+        if base_branch is None or not self.targeted_fetch:
+            self._run(["git", "fetch", "origin", "--prune"], error_msg=FETCH_ERROR)
+            return
+
+        branches = [base_branch]
+        upstream = self._get_upstream_branch()
+        if upstream and upstream != base_branch:
+            branches.append(upstream)
+
+        stamps = self._get_fetch_stamps() if self.fetch_ttl > 0 else None
+        if stamps and not force:
+            stale = stamps.stale([f"refs/remotes/origin/{b}" for b in branches], self.fetch_ttl)
+            branches = [b for b in branches if f"refs/remotes/origin/{b}" in stale]
+
+        if not branches:
+            return
 
-    def is_git_repo(self) -> bool:
         try:
-            self.terminal.run(["git", "rev-parse", "--is-inside-work-tree"])
-            return True
-        except Exception:
-            return False
+            self._fetch_branches(branches)
+        except DomainException:
+            # A deleted upstream must not block fetching the target branch.
+            if branches == [base_branch]:
+                raise
+            branches = [b for b in branches if b == base_branch]
+            if branches:
+                self._fetch_branches(branches)
 
-    def branch_exists(self, branch_name: str) -> bool:
+        if stamps:
+            stamps.touch([f"refs/remotes/origin/{b}" for b in branches])
+
+    def _fetch_branches(self, branches: list[str]) -> None:
+        self._run(
+            [
+                "git",
+                "fetch",
+                "origin",
+                "--no-tags",
+                *(f"+refs/heads/{b}:refs/remotes/origin/{b}" for b in branches),
+            ],
+            error_msg=FETCH_ERROR,
+        )
+
+    def _get_upstream_branch(self) -> str | None:
         try:
-            self.terminal.run(
-                ["git", "show-ref", "--verify", f"refs/remotes/origin/{branch_name}"]
+            upstream = self._run(
+                [
+                    "git",
+                    "rev-parse",
+                    "--abbrev-ref",
+                    "--symbolic-full-name",
+                    f"{self.head or ''}@{{upstream}}",
+                ]
             )
-            return True
         except Exception:
-            pass
+            return None
+
+        if not upstream.startswith("origin/"):
+            return None
+
+        return upstream[len("origin/"):] or None
+
+    def _get_fetch_stamps(self) -> FetchStamps | None:
+        common_dir = self.ref_reader.common_dir() if self.ref_reader else None
+
+        if common_dir is None:
+            try:
+                common_dir = self._resolve_git_path(self._run(["git", "rev-parse", "--git-common-dir"]))
+            except Exception:
+                return None
+
+        return FetchStamps(common_dir / STAMP_FILE)
+
+    def is_git_repo(self) -> bool:
+        if self.ref_reader:
+            is_repo = self.ref_reader.is_repo()
+            if is_repo is not None:
+                return is_repo
 
         try:
-            self.terminal.run(
-                ["git", "show-ref", "--verify", f"refs/heads/{branch_name}"]
-            )
+            self._run(["git", "rev-parse", "--is-inside-work-tree"])
             return True
         except Exception:
             return False
 
+    def branch_exists(self, branch_name: str) -> bool:
+        refs = (f"refs/remotes/origin/{branch_name}", f"refs/heads/{branch_name}")
+
+        if self.ref_reader:
+            for ref in refs:
+                exists = self.ref_reader.ref_exists(ref)
+                if exists is None:
+                    break
+                if exists:
+                    return True
+            else:
+                return False
+
+        for ref in refs:
+            try:
+                self._run(["git", "show-ref", "--verify", ref])
+                return True
+            except Exception:
+                pass
+
+        return False
+
     def get_current_branch(self) -> str:
-        result = self.terminal.run(["git", "branch", "--show-current"])
+        if self.head:
+            return self.head
+
+        if self.ref_reader:
+            branch = self.ref_reader.current_branch()
+            if branch is not None:
+                return branch
+
+        result = self._run(["git", "branch", "--show-current"])
         return result or ""
 
     def get_commits(self, base_branch: str) -> str:
-        result = self.terminal.run(["git", "log", f"origin/{base_branch}..HEAD", "--oneline"])
+        result = self._run(["git", "log", self._revision_range(base_branch), "--oneline"])
         return result or ""
 
     def get_diff(self, base_branch: str) -> str:
-        result = self.terminal.run(
-            [
-                "git",
-                "diff",
-                f"origin/{base_branch}..HEAD",
-                ":!*.lock",
-                ":!*-lock.json",
-            ]
+        diff, _ = self._read_diff(self._diff_command(base_branch))
+        return diff
+
+    def _diff_command(self, base_branch: str) -> list[str]:
+        return [
+            "git",
+            "diff",
+            self._revision_range(base_branch),
+        ]
+
+    def _read_diff(self, command: list[str], filter_paths: bool = True) -> tuple[str, bool]:
+        path_filter = self._path_filter() if filter_paths else None
+
+        if self.diff_limit <= 0:
+            diff = self._run(command) or ""
+            return (path_filter.apply(diff).strip() if path_filter else diff), True
+
+        # Stream so a huge diff is never buffered whole; git is stopped once
+        # enough has been read.
+        reader = DiffReader(
+            max_chars=self.diff_limit * DIFF_READ_FACTOR,
+            per_file_chars=self.diff_limit,
+            max_scan_chars=self.diff_limit * DIFF_SCAN_FACTOR,
         )
-        return result or ""
+        chunks = self._stream(command)
+        diff = reader.read(path_filter.filter(chunks) if path_filter else chunks)
+        return diff, not reader.truncated
+
+    def _path_filter(self) -> DiffPathFilter | None:
+        if not self.path_rules and not self.gitattributes:
+            return None
+
+        work_tree, common_dir = self._get_attribute_dirs() or (None, None)
+        return DiffPathFilter(
+            PathClassifier(
+                self.path_rules,
+                work_tree=work_tree,
+                info_attributes=common_dir / "info" / "attributes" if common_dir else None,
+            )
+        )
+
+    def _get_attribute_dirs(self) -> tuple[Path, Path] | None:
+        """The work tree and common dir whose attributes files classify paths."""
+        if not self.gitattributes:
+            return None
+
+        if self.ref_reader:
+            work_tree = self.ref_reader.work_tree()
+            common_dir = self.ref_reader.common_dir()
+            if work_tree and common_dir:
+                return work_tree, common_dir
+
+        try:
+            output = self._run(["git", "rev-parse", "--show-toplevel", "--git-common-dir"])
+        except Exception:
+            return None
+
+        lines = output.splitlines()
+        if len(lines) != 2:
+            return None
+        return Path(lines[0]), self._resolve_git_path(lines[1])
 
     def get_diff_stat(self, base_branch: str) -> str:
-        result = self.terminal.run(
-            [
-                "git",
-                "diff",
-                "--stat",
-                f"origin/{base_branch}..HEAD",
-                ":!*.lock",
-                ":!*-lock.json",
-            ]
+        path_filter = self._path_filter()
+        if path_filter is None:
+            result = self._run(["git", "diff", "--stat", self._revision_range(base_branch)])
+            return result or ""
+
+        # git's own stat can't mark the files left out of the diff body.
+        output = self._run(
+            ["git", "diff", "--raw", "--numstat", "-z", self._revision_range(base_branch)]
         )
-        return result or ""
+        return self._format_stat(parse_numstat(output, path_filter.classifier.classify))
+
+    def get_diff_with_stat(self, base_branch: str) -> tuple[str, str]:
+        if not self.single_pass_diff:
+            return super().get_diff_with_stat(base_branch)
+
+        diff, complete = self._read_diff(self._diff_command(base_branch))
+        if not complete:
+            return diff, self.get_diff_stat(base_branch)
+
+        return diff, self._format_stat(parse_patch_stat(diff))
+
+    def _format_stat(self, entries: list[NumstatEntry]) -> str:
+        blobs = binary_blobs(entries)
+        sizes = None
+        if blobs:
+            # Only binary files need a size, and only then is git asked.
+            try:
+                sizes = parse_blob_sizes(
+                    self._run(
+                        ["git", "cat-file", "--batch-check"], input_data="\n".join(blobs) + "\n"
+                    )
+                )
+            except Exception:
+                sizes = None
+        return format_stat(entries, sizes=sizes).strip()
 
     def get_staged_diff(self) -> str:
-        return self.terminal.run(["git", "diff", "--cached"])
+        # `[git] exclude` and .gitattributes only shape the PR diff.
+        diff, _ = self._read_diff(["git", "diff", "--cached"], filter_paths=False)
+        return diff
 
     def commit(self, commit: Commit) -> str:
         command = ["git", "commit", "-m", commit.title]
         if commit.body:
             command.extend(["-m", commit.body])
-        return self.terminal.run(command)
-
-
-
-
+        return self._run(command)
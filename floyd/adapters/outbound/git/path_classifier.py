@@ -0,0 +1,316 @@
+import re
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from floyd.adapters.outbound.git.diff_stat import header_paths, omitted_note
+
+# gitattributes that keep a file out of the diff body, and what it is called then.
+ATTRIBUTES = {
+    "linguist-generated": "generated",
+    "linguist-vendored": "vendored",
+    "diff": "no-diff",
+}
+# The built-in macro git expands `binary` into, as far as it matters here.
+_MACROS = {"binary": ("-diff",)}
+
+FILE_HEADER = "diff --git "
+FILE_SEPARATOR = "\n" + FILE_HEADER
+
+
+def glob_regex(pattern: str, base: str = "") -> str:
+    """Translates a gitignore-style pattern into a regex over repository paths.
+
+    A pattern without a slash matches a name at any depth below `base`; one
+    with a slash is anchored to it. `**` crosses directories, and a trailing
+    slash matches everything inside a directory.
+    """
+    directory = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    pattern = pattern.lstrip("/")
+
+    parts: list[str] = []
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+
+        if pattern.startswith("**/", index) and (index == 0 or pattern[index - 1] == "/"):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif pattern.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif char == "?":
+            parts.append("[^/]")
+            index += 1
+        elif char == "[" and (end := pattern.find("]", index + 2)) > 0:
+            members = pattern[index + 1:end]
+            if members[0] in "!^":
+                members = "^" + members[1:]
+            parts.append("[" + members.replace("\\", "\\\\") + "]")
+            index = end + 1
+        else:
+            parts.append(re.escape(char))
+            index += 1
+
+    body = "".join(parts)
+    if not anchored:
+        body = "(?:.*/)?" + body
+    if directory:
+        body += "/.*"
+
+    return re.escape(base) + body
+
+
+class _RuleSet:
+    """Ordered pattern rules compiled into one regex; the last matching rule wins.
+
+    The alternatives are tried in reverse, so the first one that matches is
+    the last rule, and its group number says which rule that was.
+    """
+
+    def __init__(self, rules: list[tuple[str, bool | None]]) -> None:
+        rules = rules[::-1]
+        self._values = [value for _, value in rules]
+        self._regex = (
+            re.compile("|".join(f"({regex})" for regex, _ in rules), re.DOTALL) if rules else None
+        )
+
+    def match(self, path: str) -> tuple[bool, bool | None]:
+        """(whether any rule matched, the value it set)."""
+        match = self._regex.fullmatch(path) if self._regex else None
+        if match is None or match.lastindex is None:
+            return False, None
+
+        return True, self._values[match.lastindex - 1]
+
+
+def _attribute_value(token: str) -> tuple[str, bool | None]:
+    if token.startswith("-"):
+        return token[1:], False
+    if token.startswith("!"):
+        return token[1:], None
+
+    name, has_value, value = token.partition("=")
+    if not has_value:
+        return name, True
+    # `diff=<driver>` still shows a diff; linguist treats anything but false as set.
+    return name, value.lower() not in ("false", "0")
+
+
+def parse_attributes(text: str, base: str = "") -> dict[str, _RuleSet]:
+    """Reads a .gitattributes file into one rule set per attribute of interest."""
+    rules: dict[str, list[tuple[str, bool | None]]] = {name: [] for name in ATTRIBUTES}
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        pattern, *tokens = line.split()
+        if pattern.startswith('"') and pattern.endswith('"') and len(pattern) > 1:
+            pattern = pattern[1:-1]
+        if pattern.startswith("!"):
+            # Negative patterns are not allowed in gitattributes.
+            continue
+
+        regex = glob_regex(pattern, base)
+        for token in (expanded for token in tokens for expanded in _MACROS.get(token, (token,))):
+            name, value = _attribute_value(token)
+            if name in rules:
+                rules[name].append((regex, value))
+
+    return {name: _RuleSet(entries) for name, entries in rules.items() if entries}
+
+
+class PathClassifier:
+    """Decides which changed files stay out of the diff body.
+
+    `rules` are gitignore-style patterns from the config; a leading `!` keeps
+    a path the earlier rules matched, and a config rule that matches has the
+    final say. Otherwise the repository's .gitattributes files decide,
+    read lazily for the directories changed paths live in, with
+    `.git/info/attributes` taking precedence as in git.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[str] = (),
+        work_tree: Path | None = None,
+        info_attributes: Path | None = None,
+    ) -> None:
+        compiled: list[tuple[str, bool | None]] = []
+        for rule in rules:
+            keep = rule.startswith("!")
+            compiled.append((glob_regex(rule[1:] if keep else rule), not keep))
+        self._rules = _RuleSet(compiled)
+
+        self._work_tree = work_tree
+        self._directories: dict[str, dict[str, _RuleSet]] = {}
+        self._info = self._read(info_attributes, "") if info_attributes else {}
+
+    def classify(self, path: str) -> str | None:
+        """What kind of omitted file `path` is, or None when its diff is kept."""
+        matched, excluded = self._rules.match(path)
+        if matched:
+            return "excluded" if excluded else None
+
+        if self._work_tree is None and not self._info:
+            return None
+
+        layers = self._layers(path)
+        for name, kind in ATTRIBUTES.items():
+            value = self._attribute(layers, name, path)
+            # `diff` is set on every file; only unsetting it means anything.
+            if value is (False if name == "diff" else True):
+                return kind
+
+        return None
+
+    def _attribute(self, layers: list[dict[str, _RuleSet]], name: str, path: str) -> bool | None:
+        for layer in layers:
+            rule_set = layer.get(name)
+            if rule_set is None:
+                continue
+            matched, value = rule_set.match(path)
+            if matched:
+                return value
+        return None
+
+    def _layers(self, path: str) -> list[dict[str, _RuleSet]]:
+        # Most specific first: info/attributes, then the deepest directory.
+        layers = [self._info]
+        directory = path.rpartition("/")[0]
+        while True:
+            layers.append(self._directory(directory))
+            if not directory:
+                return layers
+            directory = directory.rpartition("/")[0]
+
+    def _directory(self, directory: str) -> dict[str, _RuleSet]:
+        attributes = self._directories.get(directory)
+        if attributes is None:
+            attributes = {}
+            if self._work_tree is not None:
+                base = directory + "/" if directory else ""
+                attributes = self._read(self._work_tree / directory / ".gitattributes", base)
+            self._directories[directory] = attributes
+        return attributes
+
+    def _read(self, path: Path, base: str) -> dict[str, _RuleSet]:
+        try:
+            return parse_attributes(path.read_text(encoding="utf-8", errors="replace"), base)
+        except OSError:
+            return {}
+
+
+class DiffPathFilter:
+    """Drops the hunks of classified files from a streamed diff.
+
+    An omitted file keeps its header and gets one note with its line counts
+    in place of its hunks, so `parse_patch_stat` still lists it and the AI
+    adapter can leave it out of the prompt. A file is classified once its
+    header has been read, since only the `rename`/`---`/`+++` lines name a
+    renamed file reliably; beyond that, nothing of a dropped file is held
+    past the line being read.
+    """
+
+    def __init__(self, classifier: PathClassifier) -> None:
+        self.classifier = classifier
+        self.omitted = 0
+        self._carry = ""
+        # The header lines of a file not classified yet.
+        self._header: list[str] | None = None
+        self._kind: str | None = None
+        self._in_hunks = False
+        self._insertions = 0
+        self._deletions = 0
+
+    def filter(self, chunks: Iterator[str]) -> Iterator[str]:
+        with closing(chunks):
+            for chunk in chunks:
+                if text := self._consume(chunk):
+                    yield text
+
+            if text := self._finish():
+                yield text
+
+    def apply(self, diff: str) -> str:
+        return self._consume(diff) + self._finish()
+
+    def _consume(self, chunk: str) -> str:
+        buffer = self._carry + chunk
+        # Only whole lines are looked at; the tail waits for the next chunk.
+        limit = buffer.rfind("\n") + 1
+        self._carry = buffer[limit:]
+        return self._feed(buffer, limit)
+
+    def _finish(self) -> str:
+        text = self._feed(self._carry, len(self._carry))
+        self._carry = ""
+        return text + self._close_file()
+
+    def _feed(self, buffer: str, limit: int) -> str:
+        kept: list[str] = []
+        start = 0
+
+        while start < limit:
+            if buffer.startswith(FILE_HEADER, start):
+                kept.append(self._close_file())
+                self._header = []
+                self._in_hunks = False
+
+            if self._header is not None:
+                end = buffer.find("\n", start, limit)
+                end = limit if end < 0 else end + 1
+                line = buffer[start:end]
+                if not line.startswith(("@@ ", "GIT binary patch")):
+                    self._header.append(line)
+                    start = end
+                    continue
+                kept.append(self._classify())
+
+            boundary = buffer.find(FILE_SEPARATOR, start, limit)
+            end = limit if boundary < 0 else boundary + 1
+            if self._kind is None:
+                kept.append(buffer[start:end])
+            else:
+                kept.append(self._drop(buffer[start:end]))
+            start = end
+
+        return "".join(kept)
+
+    def _classify(self) -> str:
+        """Classifies the file whose header was just read and returns the header."""
+        header = self._header or []
+        self._header = None
+        self._kind = self.classifier.classify(header_paths(header)[1])
+        return "".join(header)
+
+    def _drop(self, segment: str) -> str:
+        kept = ""
+        if not self._in_hunks:
+            self._in_hunks = True
+            if segment.startswith("GIT binary patch"):
+                kept = "GIT binary patch\n"
+
+        # Inside the hunks every line starts with its +, - or space marker.
+        segment = "\n" + segment
+        self._insertions += segment.count("\n+")
+        self._deletions += segment.count("\n-")
+        return kept
+
+    def _close_file(self) -> str:
+        header = self._classify() if self._header is not None else ""
+        if self._kind is None:
+            return header
+
+        note = omitted_note(self._kind, self._insertions, self._deletions)
+        self.omitted += 1
+        self._kind = None
+        self._insertions = self._deletions = 0
+        return header + note
@@ -0,0 +1,199 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+_GIT_ENV_OVERRIDES = ("GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR", "GIT_CEILING_DIRECTORIES")
+
+
+@dataclass(frozen=True)
+class RepositoryLayout:
+    git_dir: Path
+    common_dir: Path
+    work_tree: Path
+
+
+class GitRefReader:
+    """Answers repository metadata questions by reading `.git` files directly.
+
+    Every query returns None when the layout is not one this reader understands
+    (reftable, alternate ref backends, GIT_DIR overrides), so callers can fall
+    back to the git CLI.
+    """
+
+    def __init__(self, root: Path | None = None) -> None:
+        self.root = root
+        self._layouts: dict[Path, RepositoryLayout | None] = {}
+        self._packed_refs: dict[Path, tuple[tuple[int, int], frozenset[str]]] = {}
+
+    def is_repo(self) -> bool | None:
+        if self._has_env_override():
+            return None
+
+        layout = self._layout()
+        if layout is None:
+            return None if self._looks_like_bare_repo(self._start()) else False
+
+        return True if self._is_supported(layout) else None
+
+    def current_branch(self) -> str | None:
+        layout = self._supported_layout()
+        if layout is None:
+            return None
+
+        try:
+            head = (layout.git_dir / "HEAD").read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+        if not head.startswith("ref:"):
+            return ""
+
+        ref = head[len("ref:"):].strip()
+        if ref.startswith("refs/heads/"):
+            return ref[len("refs/heads/"):]
+
+        return ""
+
+    def common_dir(self) -> Path | None:
+        layout = self._supported_layout()
+        return layout.common_dir if layout else None
+
+    def work_tree(self) -> Path | None:
+        layout = self._supported_layout()
+        return layout.work_tree if layout else None
+
+    def ref_exists(self, ref: str) -> bool | None:
+        layout = self._supported_layout()
+        if layout is None or not self._is_safe_ref(ref):
+            return None
+
+        if (layout.common_dir / ref).is_file():
+            return True
+
+        packed = self._read_packed_refs(layout.common_dir)
+        if packed is None:
+            return None
+
+        return ref in packed
+
+    def _supported_layout(self) -> RepositoryLayout | None:
+        if self._has_env_override():
+            return None
+
+        layout = self._layout()
+        if layout is None or not self._is_supported(layout):
+            return None
+
+        return layout
+
+    def _layout(self) -> RepositoryLayout | None:
+        start = self._start()
+
+        if start not in self._layouts:
+            self._layouts[start] = self._discover(start)
+
+        return self._layouts[start]
+
+    def _start(self) -> Path:
+        return self.root if self.root is not None else Path.cwd()
+
+    def _discover(self, start: Path) -> RepositoryLayout | None:
+        for directory in (start, *start.parents):
+            candidate = directory / ".git"
+
+            if candidate.is_dir():
+                return RepositoryLayout(git_dir=candidate, common_dir=candidate, work_tree=directory)
+
+            if candidate.is_file():
+                git_dir = self._read_pointer(candidate, "gitdir:")
+                if git_dir is None:
+                    return None
+                return RepositoryLayout(
+                    git_dir=git_dir, common_dir=self._common_dir(git_dir), work_tree=directory
+                )
+
+        return None
+
+    def _read_pointer(self, path: Path, prefix: str) -> Path | None:
+        try:
+            content = path.read_text(encoding="utf-8").strip()
+        except OSError:
+            return None
+
+        if not content.startswith(prefix):
+            return None
+
+        target = Path(content[len(prefix):].strip())
+        return target if target.is_absolute() else (path.parent / target).resolve()
+
+    def _common_dir(self, git_dir: Path) -> Path:
+        commondir = git_dir / "commondir"
+
+        try:
+            target = Path(commondir.read_text(encoding="utf-8").strip())
+        except OSError:
+            return git_dir
+
+        return target if target.is_absolute() else (git_dir / target).resolve()
+
+    def _is_supported(self, layout: RepositoryLayout) -> bool:
+        if (layout.common_dir / "reftable").exists():
+            return False
+
+        try:
+            config = (layout.common_dir / "config").read_text(encoding="utf-8")
+        except OSError:
+            return False
+
+        for line in config.splitlines():
+            key, _, value = line.partition("=")
+            if key.strip().lower() == "refstorage" and value.strip().lower() != "files":
+                return False
+
+        return (layout.git_dir / "HEAD").is_file()
+
+    def _read_packed_refs(self, common_dir: Path) -> frozenset[str] | None:
+        path = common_dir / "packed-refs"
+
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return frozenset()
+        except OSError:
+            return None
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._packed_refs.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        refs: set[str] = set()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    _, _, name = line.rstrip("\n").partition(" ")
+                    if name:
+                        refs.add(name)
+        except OSError:
+            return None
+
+        packed = frozenset(refs)
+        self._packed_refs[path] = (key, packed)
+        return packed
+
+    def _is_safe_ref(self, ref: str) -> bool:
+        return (
+            ref.startswith("refs/")
+            and ".." not in ref
+            and "\\" not in ref
+            and not ref.endswith("/")
+            and "//" not in ref
+        )
+
+    def _looks_like_bare_repo(self, path: Path) -> bool:
+        return (path / "HEAD").is_file() and (path / "objects").is_dir()
+
+    def _has_env_override(self) -> bool:
+        return any(os.environ.get(name) for name in _GIT_ENV_OVERRIDES)
@@ -1,5 +1,17 @@
 """GitHub CLI adapter."""
 
-from floyd.adapters.outbound.github.github_cli_adapter import GitHubCLIAdapter
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.github.github_cli_adapter import GitHubCLIAdapter
 
 __all__ = ["GitHubCLIAdapter"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GitHubCLIAdapter": "floyd.adapters.outbound.github.github_cli_adapter",
+    },
+)
@@ -1,5 +1,6 @@
 import os
 import tempfile
+from pathlib import Path
 
 from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
 from floyd.domain.entities.pull_request import PullRequest
@@ -8,8 +9,9 @@ from floyd.adapters.outbound.utils.terminal import Terminal
 
 class GitHubCLIAdapter(PRRepositoryPort):
 
-    def __init__(self, terminal: Terminal):
+    def __init__(self, terminal: Terminal, cwd: Path | None = None):
         self.terminal = terminal
+        self.cwd = cwd
 
     def pr_exists(self, head_branch: str, base_branch: str) -> bool:
         result = self.terminal.run(
@@ -27,7 +29,8 @@ class GitHubCLIAdapter(PRRepositoryPort):
                 "number",
                 "--jq",
                 ".[0].number",
-            ]
+            ],
+            cwd=self.cwd,
         )
         return bool(result)
 
@@ -53,7 +56,7 @@ class GitHubCLIAdapter(PRRepositoryPort):
                 pr.head_branch,
             ]
 
-            return self.terminal.run(command, error_msg="GitHub CLI")
+            return self.terminal.run(command, error_msg="GitHub CLI", cwd=self.cwd)
         finally:
             if os.path.exists(temp_file_path):
                 os.remove(temp_file_path)
@@ -1,20 +1,264 @@
+import codecs
+import io
+import os
+import signal
 import subprocess
 import shutil
 import platform
 import shlex
-from rich.console import Console
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import replace
+from functools import cached_property
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterator, cast
 
+from floyd.application.services.cancellation import CancellationToken, current_cancellation
+from floyd.application.services.deadline import CommandLimit, command_limit
+from floyd.application.services.tracing import process_span
 from floyd.domain.exceptions.terminal.missing_dependency_exception import (
     MissingDependencyException,
 )
+from floyd.domain.exceptions.terminal.operation_cancelled_exception import (
+    OperationCancelledException,
+)
 from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from floyd.application.services.tracing import Span
+
+_live: "weakref.WeakSet[subprocess.Popen[Any]]" = weakref.WeakSet()
+_live_lock = threading.Lock()
+_closed = False
+
+
+class TerminalProcess:
+    """A long-lived child process exchanging one line at a time.
+
+    Blocking reads honour the current cancellation token and deadline:
+    cancelling, or an exchange running past the command's timeout, kills the
+    process, so the next exchange needs a new one. An exchange starts when a
+    line is sent and covers every line read until the next one is.
+    """
+
+    def __init__(
+        self,
+        process: "subprocess.Popen[bytes]",
+        error_msg: str,
+        tool: str = "",
+        span: "Span | None" = None,
+    ) -> None:
+        self._process = process
+        self._error_msg = error_msg
+        self._tool = tool
+        self._stderr: deque[bytes] = deque(maxlen=50)
+        # Open from spawn until the process is closed, killed or found dead.
+        self._span = span
+        self._sent = self._received = 0
+        # The limit of the current exchange and when it started.
+        self._exchange: tuple[CommandLimit | None, float] | None = None
+
+        if process.stderr:
+            threading.Thread(
+                target=_drain, args=(process.stderr, self._stderr), daemon=True
+            ).start()
+
+        # Don't leave the CLI running if the owner forgets to close it.
+        weakref.finalize(self, _kill_process, process)
+
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+
+    def send(self, line: str) -> None:
+        self._exchange = (command_limit(self._tool), time.monotonic())
+        stdin = cast(IO[bytes], self._process.stdin)
+        try:
+            data = line.encode("utf-8") + b"\n"
+            stdin.write(data)
+            stdin.flush()
+            self._sent += len(data)
+        except (BrokenPipeError, OSError, ValueError):
+            raise self._exited() from None
+
+    def read_line(self) -> str:
+        token = current_cancellation.get()
+
+        if _stopped(token):
+            raise OperationCancelledException(f"{self._error_msg}: cancelled")
+
+        limit, remaining = self._remaining()
+        watchdog = _Watchdog(self._process, remaining)
+        unregister = token.on_cancel(self.kill) if token else None
+        try:
+            data = cast(IO[bytes], self._process.stdout).readline()
+        except (OSError, ValueError):
+            data = b""
+        finally:
+            watchdog.cancel()
+            if unregister:
+                unregister()
+
+        if limit and watchdog.fired:
+            raise limit.error()
+
+        if _stopped(token):
+            raise OperationCancelledException(f"{self._error_msg}: cancelled")
+
+        if not data:
+            raise self._exited()
+
+        self._received += len(data)
+        return data.decode("utf-8", errors="replace")
+
+    def kill(self) -> None:
+        _kill_process(self._process)
+        self._end_span()
+
+    def _remaining(self) -> tuple[CommandLimit | None, CommandLimit | None]:
+        """The exchange's limit, and what is left of it for the next read."""
+        if self._exchange is None:
+            limit = command_limit(self._tool)
+            return limit, limit
+
+        limit, started = self._exchange
+        if limit is None:
+            return None, None
+
+        remaining = limit.seconds - (time.monotonic() - started)
+        if remaining <= 0:
+            self.kill()
+            raise limit.error()
+        return limit, replace(limit, seconds=remaining)
+
+    def close(self, timeout: float = 2.0) -> None:
+        try:
+            cast(IO[bytes], self._process.stdin).close()
+        except OSError:
+            pass
+
+        try:
+            self._process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+        try:
+            cast(IO[bytes], self._process.stdout).close()
+        except OSError:
+            pass
+        self._end_span()
+
+    def _end_span(self) -> None:
+        span, self._span = self._span, None
+        if span:
+            span.set(
+                exit_code=self._process.returncode,
+                stdin_bytes=self._sent,
+                stdout_bytes=self._received,
+            )
+            span.__exit__(None, None, None)
+
+    def _exited(self) -> UnexpectedException:
+        try:
+            returncode = self._process.wait(1.0)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            returncode = self._process.wait()
+        self._end_span()
+
+        detail = b"".join(self._stderr).decode("utf-8", errors="replace").strip() or (
+            f"Process exited with status {returncode}."
+        )
+        return UnexpectedException(f"{self._error_msg}: {detail}")
+
+
+def _stopped(token: CancellationToken | None) -> bool:
+    """Whether the call was cancelled, or all children were killed on Ctrl-C."""
+    return _closed or bool(token and token.cancelled)
+
+
+class _Watchdog:
+    """Kills a process group once its command limit runs out."""
+
+    def __init__(self, process: "subprocess.Popen[Any]", limit: CommandLimit | None) -> None:
+        self.fired = False
+        self._timer: threading.Timer | None = None
+
+        if limit is not None:
+            self._timer = threading.Timer(limit.seconds, self._fire, (process,))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cancel(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+
+    def _fire(self, process: "subprocess.Popen[Any]") -> None:
+        self.fired = True
+        _signal_group(process)
+
+
+def _drain(stream: IO[bytes], lines: "deque[bytes]") -> None:
+    with stream:
+        for line in stream:
+            lines.append(line)
+
+
+def _signal_group(process: "subprocess.Popen[Any]") -> None:
+    """Kills the process and everything it started, without waiting."""
+    # Until the leader is reaped its pid, and so the group id, can't be reused.
+    # An exited but unreaped leader still gets its group killed, which stops
+    # grandchildren that hold the pipes open.
+    if process.returncode is not None:
+        return
+
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except OSError:
+        pass
+
+
+def _kill_process(process: "subprocess.Popen[Any]") -> None:
+    _signal_group(process)
+    try:
+        process.wait()
+    except OSError:
+        pass
+
 
 class Terminal:
     def __init__(self) -> None:
-        self.console = Console()
         self._is_windows = platform.system() == "Windows"
 
+    @cached_property
+    def console(self) -> "Console":
+        from rich.console import Console
+
+        return Console()
+
+    @staticmethod
+    def kill_all() -> None:
+        """Kills every running child process tree and refuses to start new ones.
+
+        For shutting down on Ctrl-C: children run in their own process group
+        and do not see the terminal's interrupt themselves.
+        """
+        global _closed
+
+        with _live_lock:
+            _closed = True
+            processes = list(_live)
+
+        for process in processes:
+            _signal_group(process)
+
     def is_installed(self, tool: str) -> bool:
         return shutil.which(tool) is not None
 
@@ -22,36 +266,231 @@ class Terminal:
         if not self.is_installed(tool):
             raise MissingDependencyException(tool)
 
+    def _to_cmd_list(self, command: list[str] | str) -> list[str] | str:
+        if isinstance(command, str):
+            return command if self._is_windows else shlex.split(command)
+        return command
+
+    def _tool_name(self, cmd_list: list[str] | str) -> str:
+        """The executable's name, the key of its timeout in the config."""
+        program = cmd_list[0] if isinstance(cmd_list, list) else (cmd_list.split() or [""])[0]
+        name = os.path.basename(program).lower()
+
+        for suffix in (".exe", ".cmd", ".bat"):
+            name = name.removesuffix(suffix)
+        return name
+
+    def _missing_dependency(self, cmd_list: list[str] | str) -> MissingDependencyException:
+        cmd_name = cmd_list[0] if isinstance(cmd_list, list) else cmd_list.split()[0]
+        return MissingDependencyException(cmd_name)
+
+    def _spawn(
+        self,
+        cmd_list: list[str] | str,
+        error_msg: str,
+        stdin: bool,
+        cwd: Path | None,
+        text: bool = False,
+    ) -> "subprocess.Popen[Any]":
+        with _live_lock:
+            if _closed:
+                raise OperationCancelledException(f"{error_msg}: cancelled")
+
+            try:
+                # A session of its own, so a timeout or Ctrl-C can kill the
+                # whole tree, and a credential prompt fails instead of
+                # waiting on a terminal nobody is looking at.
+                process = subprocess.Popen(
+                    cmd_list,
+                    stdin=subprocess.PIPE if stdin else None,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=text,
+                    encoding="utf-8" if text else None,
+                    shell=self._is_windows,
+                    cwd=cwd,
+                    start_new_session=not self._is_windows,
+                )
+            except FileNotFoundError:
+                raise self._missing_dependency(cmd_list)
+
+            _live.add(process)
+            return process
+
     def run(
         self,
         command: list[str] | str,
         input_data: str | None = None,
         error_msg: str = "Command Failed",
+        cwd: Path | None = None,
+        timeout: float | None = None,
     ) -> str:
-        if isinstance(command, str):
-            cmd_list = command if self._is_windows else shlex.split(command)
-        else:
-            cmd_list = command
+        """Runs a command to completion and returns its stripped stdout.
 
-        try:
-            result = subprocess.run(
-                cmd_list,
-                input=input_data,
-                capture_output=True,
-                text=True,
-                check=True,
-                encoding="utf-8",
-                shell=self._is_windows,
-            )
+        `timeout` overrides the limit configured for the executable; the
+        current workflow deadline applies either way.
+        """
+        cmd_list = self._to_cmd_list(command)
 
-            return result.stdout.strip()
+        token = current_cancellation.get()
 
-        except subprocess.CalledProcessError as e:
-            detail = e.stderr.strip() or str(e)
-            raise UnexpectedException(f"{error_msg}: {detail}") from None
+        if _stopped(token):
+            raise OperationCancelledException(f"{error_msg}: cancelled")
 
-        except FileNotFoundError:
-            cmd_name = (
-                cmd_list[0] if isinstance(cmd_list, list) else cmd_list.split()[0]
-            )
-            raise MissingDependencyException(cmd_name)
+        limit = command_limit(self._tool_name(cmd_list), timeout)
+        with process_span(cmd_list) as span:
+            process = self._spawn(cmd_list, error_msg, input_data is not None, cwd, text=True)
+            watchdog = _Watchdog(process, limit)
+            unregister = token.on_cancel(lambda: _signal_group(process)) if token else None
+
+            try:
+                stdout, stderr = process.communicate(input_data)
+            except BaseException:
+                _kill_process(process)
+                raise
+            finally:
+                watchdog.cancel()
+                if unregister:
+                    unregister()
+
+            if span:
+                span.set(
+                    exit_code=process.returncode,
+                    stdin_bytes=len(input_data.encode("utf-8")) if input_data else 0,
+                    stdout_bytes=len(stdout.encode("utf-8")),
+                    stderr_bytes=len(stderr.encode("utf-8")),
+                )
+
+            if limit and watchdog.fired:
+                raise limit.error()
+
+            if _stopped(token):
+                raise OperationCancelledException(f"{error_msg}: cancelled")
+
+            if process.returncode != 0:
+                detail = stderr.strip() or (
+                    f"Command {cmd_list!r} returned non-zero exit status {process.returncode}."
+                )
+                raise UnexpectedException(f"{error_msg}: {detail}") from None
+
+            return stdout.strip()
+
+    def open(
+        self,
+        command: list[str] | str,
+        error_msg: str = "Command Failed",
+        cwd: Path | None = None,
+    ) -> TerminalProcess:
+        cmd_list = self._to_cmd_list(command)
+        span = process_span(cmd_list)
+        process = self._spawn(cmd_list, error_msg, True, cwd)
+        return TerminalProcess(
+            process, error_msg, self._tool_name(cmd_list), span.__enter__() if span else None
+        )
+
+    def stream(
+        self,
+        command: list[str] | str,
+        input_data: str | None = None,
+        error_msg: str = "Command Failed",
+        cwd: Path | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[str]:
+        cmd_list = self._to_cmd_list(command)
+
+        token = current_cancellation.get()
+
+        if _stopped(token):
+            raise OperationCancelledException(f"{error_msg}: cancelled")
+
+        limit = command_limit(self._tool_name(cmd_list), timeout)
+        output_bytes = 0
+
+        with process_span(cmd_list) as span:
+            process = self._spawn(cmd_list, error_msg, input_data is not None, cwd)
+
+            stderr_chunks: list[bytes] = []
+
+            def write_stdin(stdin: IO[bytes], data: bytes) -> None:
+                try:
+                    stdin.write(data)
+                except (BrokenPipeError, OSError):
+                    pass
+                finally:
+                    try:
+                        stdin.close()
+                    except OSError:
+                        pass
+
+            def read_stderr(stderr: IO[bytes]) -> None:
+                stderr_chunks.append(stderr.read())
+
+            threads: list[threading.Thread] = []
+            if process.stdin and input_data is not None:
+                threads.append(
+                    threading.Thread(
+                        target=write_stdin,
+                        args=(process.stdin, input_data.encode("utf-8")),
+                        daemon=True,
+                    )
+                )
+            if process.stderr:
+                threads.append(threading.Thread(target=read_stderr, args=(process.stderr,), daemon=True))
+            for thread in threads:
+                thread.start()
+
+            watchdog = _Watchdog(process, limit)
+            unregister = token.on_cancel(lambda: _signal_group(process)) if token else None
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+            try:
+                stdout = cast(io.BufferedReader, process.stdout)
+
+                while True:
+                    data = stdout.read1(65536)
+                    if not data:
+                        break
+                    if span:
+                        output_bytes += len(data)
+                    text = decoder.decode(data)
+                    if text:
+                        yield text
+
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+
+                process.wait()
+            except BaseException:
+                _kill_process(process)
+                raise
+            finally:
+                watchdog.cancel()
+                if unregister:
+                    unregister()
+                for thread in threads:
+                    thread.join()
+                for pipe in (process.stdout, process.stderr):
+                    if pipe:
+                        pipe.close()
+
+            if span:
+                span.set(
+                    exit_code=process.returncode,
+                    stdin_bytes=len(input_data.encode("utf-8")) if input_data else 0,
+                    stdout_bytes=output_bytes,
+                    stderr_bytes=sum(len(chunk) for chunk in stderr_chunks),
+                )
+
+            if limit and watchdog.fired:
+                raise limit.error()
+
+            if _stopped(token):
+                raise OperationCancelledException(f"{error_msg}: cancelled")
+
+            if process.returncode != 0:
+                stderr_text = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+                detail = stderr_text or (
+                    f"Command {cmd_list!r} returned non-zero exit status {process.returncode}."
+                )
+                raise UnexpectedException(f"{error_msg}: {detail}") from None
@@ -1,6 +1,19 @@
 """Application layer - Use cases and ports."""
 
-from floyd.application.dto.ai_config import AIConfig
-from floyd.application.services.pr_generation_service import PRGenerationService
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.application.dto.ai_config import AIConfig
+    from floyd.application.services.pr_generation_service import PRGenerationService
 
 __all__ = ["AIConfig", "PRGenerationService"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AIConfig": "floyd.application.dto.ai_config",
+        "PRGenerationService": "floyd.application.services.pr_generation_service",
+    },
+)
@@ -1,5 +1,52 @@
 """Application DTOs."""
 
-from floyd.application.dto.ai_config import AIConfig
+from typing import TYPE_CHECKING
 
-__all__ = ["AIConfig"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.application.dto.ai_config import AIConfig
+    from floyd.application.dto.batch_item import BatchItem, BatchResult, BatchStatus
+    from floyd.application.dto.cache_config import CacheConfig
+    from floyd.application.dto.call_timing import CallTiming
+    from floyd.application.dto.git_config import GitConfig
+    from floyd.application.dto.pr_preparation import PRPreparation
+    from floyd.application.dto.refinement import Refinement
+    from floyd.application.dto.span_summary import SpanSummary
+    from floyd.application.dto.task_progress import TaskProgress, TaskState
+    from floyd.application.dto.timeout_config import TimeoutConfig
+
+__all__ = [
+    "AIConfig",
+    "BatchItem",
+    "BatchResult",
+    "BatchStatus",
+    "CacheConfig",
+    "CallTiming",
+    "GitConfig",
+    "PRPreparation",
+    "Refinement",
+    "SpanSummary",
+    "TaskProgress",
+    "TaskState",
+    "TimeoutConfig",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AIConfig": "floyd.application.dto.ai_config",
+        "BatchItem": "floyd.application.dto.batch_item",
+        "BatchResult": "floyd.application.dto.batch_item",
+        "BatchStatus": "floyd.application.dto.batch_item",
+        "CacheConfig": "floyd.application.dto.cache_config",
+        "CallTiming": "floyd.application.dto.call_timing",
+        "GitConfig": "floyd.application.dto.git_config",
+        "PRPreparation": "floyd.application.dto.pr_preparation",
+        "Refinement": "floyd.application.dto.refinement",
+        "SpanSummary": "floyd.application.dto.span_summary",
+        "TaskProgress": "floyd.application.dto.task_progress",
+        "TaskState": "floyd.application.dto.task_progress",
+        "TimeoutConfig": "floyd.application.dto.timeout_config",
+    },
+)
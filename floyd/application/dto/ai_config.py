@@ -2,6 +2,12 @@ from pydantic import BaseModel, Field
 
 from floyd.domain.value_objects.ai_provider import ProviderType
 
+# Diff minimization steps, in the order they run.
+DIFF_TRANSFORMS = ("renames", "binary", "whitespace", "context")
+# Whitespace-only changes can matter (indentation in Python or YAML), so
+# dropping them is opt-in.
+DEFAULT_MINIMIZE = ("renames", "binary", "context")
+
 
 class AIConfig(BaseModel):
     provider: ProviderType
@@ -9,3 +15,14 @@ class AIConfig(BaseModel):
     diff_limit: int = Field(default=-1)
     pr_instructions: str = Field(default="")
     commit_instructions: str = Field(default="")
+    race: tuple[ProviderType, ...] = Field(default=())
+    session: bool = Field(default=False)
+    full_refine: bool = Field(default=False)
+    minimize: tuple[str, ...] = Field(default=DEFAULT_MINIMIZE)
+    context_lines: int = Field(default=2, ge=0)
+    # Diffs longer than chunk_size characters are summarized in parts first.
+    map_reduce: bool = Field(default=False)
+    chunk_size: int = Field(default=40000, ge=1)
+    map_jobs: int = Field(default=4, ge=1)
+
+    model_config = {"frozen": True}
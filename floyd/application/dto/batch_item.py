@@ -0,0 +1,33 @@
+from enum import Enum
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class BatchItem(BaseModel):
+    repo: Path
+    head: str = Field(..., min_length=1)
+    target: str = Field(..., min_length=1)
+
+    model_config = {"frozen": True}
+
+
+class BatchStatus(str, Enum):
+    CREATED = "created"
+    DRAFTED = "drafted"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class BatchResult(BaseModel):
+    repo: Path
+    head: str
+    target: str
+    status: BatchStatus
+    title: str = Field(default="")
+    body: str = Field(default="")
+    url: str = Field(default="")
+    error: str = Field(default="")
+    duration: float = Field(default=0.0, ge=0.0)
+
+    model_config = {"frozen": True}
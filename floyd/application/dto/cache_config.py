@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = Field(default=True)
+    ttl: int = Field(default=7 * 24 * 3600, ge=0)
+    max_size_mb: int = Field(default=50, ge=0)
+
+    model_config = {"frozen": True}
@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+
+
+class CallTiming(BaseModel):
+    name: str
+    duration: float = Field(default=0.0, ge=0.0)
+    failed: bool = Field(default=False)
+    cancelled: bool = Field(default=False)
+
+    model_config = {"frozen": True}
@@ -0,0 +1,33 @@
+from pydantic import BaseModel, Field
+
+from floyd.application.dto.call_timing import CallTiming
+
+
+class DraftPreview(BaseModel):
+    title: str = Field(default="")
+    body: str = Field(default="")
+
+    model_config = {"frozen": True}
+
+
+class DiffSaving(BaseModel):
+    """Bytes one diff minimization step removed from the prompt."""
+
+    name: str
+    saved: int = Field(default=0)
+
+    model_config = {"frozen": True}
+
+
+class GenerationStats(BaseModel):
+    cached: bool = Field(default=False)
+    streamed: bool = Field(default=False)
+    time_to_first_token: float | None = Field(default=None)
+    total: float = Field(default=0.0, ge=0.0)
+    provider: str = Field(default="")
+    attempts: list[CallTiming] = Field(default_factory=list[CallTiming])
+    diff_savings: list[DiffSaving] = Field(default_factory=list[DiffSaving])
+    map_parts: int = Field(default=0, ge=0)
+    map_time: float = Field(default=0.0, ge=0.0)
+
+    model_config = {"frozen": True}
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class GitConfig(BaseModel):
+    fetch_ttl: int = Field(default=0, ge=0)
+    targeted_fetch: bool = Field(default=True)
+    # Gitignore-style patterns of files kept out of the diff body; "!" keeps one.
+    exclude: tuple[str, ...] = Field(default=("*.lock", "*-lock.json", "*.min.js", "*.min.css"))
+    gitattributes: bool = Field(default=True)
+
+    model_config = {"frozen": True}
@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+from floyd.application.dto.call_timing import CallTiming
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+
+
+class PRPreparation(BaseModel):
+    context: GitContext
+    draft: PullRequest | None = Field(default=None)
+    timings: list[CallTiming] = Field(default_factory=list[CallTiming])
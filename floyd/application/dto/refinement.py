@@ -0,0 +1,17 @@
+from pydantic import BaseModel, Field
+
+
+class Refinement(BaseModel):
+    """A request to revise a draft: the draft itself and every piece of feedback on it."""
+
+    title: str
+    body: str = Field(default="")
+    # Oldest first; earlier feedback still applies.
+    feedback: tuple[str, ...] = Field(min_length=1)
+
+    model_config = {"frozen": True}
+
+    @property
+    def latest(self) -> str:
+        return self.feedback[-1]
+
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+
+
+class SpanSummary(BaseModel):
+    """Every traced span with one name and category, added up."""
+
+    name: str
+    category: str
+    calls: int = Field(default=0, ge=0)
+    total: float = Field(default=0.0, ge=0.0)
+    longest: float = Field(default=0.0, ge=0.0)
+    failures: int = Field(default=0, ge=0)
+    output_bytes: int = Field(default=0, ge=0)
+
+    model_config = {"frozen": True}
@@ -0,0 +1,21 @@
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class TaskState(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+
+class TaskProgress(BaseModel):
+    name: str
+    label: str
+    state: TaskState
+    duration: float = Field(default=0.0, ge=0.0)
+
+    model_config = {"frozen": True}
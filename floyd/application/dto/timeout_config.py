@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class TimeoutConfig(BaseModel):
+    """Time limits in seconds; 0 means no limit."""
+
+    command: float = Field(default=300.0, ge=0)
+    workflow: float = Field(default=900.0, ge=0)
+    # Per-executable overrides of `command`, e.g. (("claude", 600.0),).
+    tools: tuple[tuple[str, float], ...] = Field(default=())
+
+    model_config = {"frozen": True}
+
+    def for_tool(self, tool: str) -> float:
+        for name, seconds in self.tools:
+            if name == tool:
+                return seconds
+        return self.command
@@ -1,5 +1,19 @@
 """Inbound ports (primary/driving ports)."""
 
-from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
+from typing import TYPE_CHECKING
 
-__all__ = ["PRGenerationPort"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.application.ports.inbound.batch_pr_port import BatchPRPort
+    from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
+
+__all__ = ["BatchPRPort", "PRGenerationPort"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchPRPort": "floyd.application.ports.inbound.batch_pr_port",
+        "PRGenerationPort": "floyd.application.ports.inbound.pr_generation_port",
+    },
+)
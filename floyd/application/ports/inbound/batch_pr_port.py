@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+
+from floyd.application.dto.batch_item import BatchItem, BatchResult
+
+
+class BatchPRPort(ABC):
+
+    @abstractmethod
+    def run(
+        self,
+        items: Iterable[BatchItem],
+        on_result: Callable[[BatchResult], None] | None = None,
+    ) -> list[BatchResult]: ...
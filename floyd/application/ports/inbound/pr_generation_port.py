@@ -1,5 +1,11 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.dto.generation_stats import DraftPreview, GenerationStats
+from floyd.application.dto.pr_preparation import PRPreparation
+from floyd.application.dto.refinement import Refinement
+from floyd.application.dto.task_progress import TaskProgress
 from floyd.domain.entities.git_context import GitContext
 from floyd.domain.entities.pull_request import PullRequest
 from floyd.domain.entities.commit import Commit
@@ -11,7 +17,8 @@ class PRGenerationPort(ABC):
     def generate_pr_draft(
         self,
         context: GitContext,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
     ) -> PullRequest: ...
 
     @abstractmethod
@@ -23,7 +30,32 @@ class PRGenerationPort(ABC):
     ) -> None: ...
 
     @abstractmethod
-    def get_git_context(self, target_branch: str) -> GitContext: ...
+    def get_git_context(
+        self, target_branch: str, fresh: bool = False
+    ) -> GitContext: ...
 
     @abstractmethod
-    def generate_commit(self, diff: str, feedback: str | None = None) -> Commit: ...
+    def prepare_pr(
+        self,
+        target_branch: str,
+        fresh: bool = False,
+        on_progress: Callable[[TaskProgress], None] | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
+    ) -> PRPreparation: ...
+
+    @abstractmethod
+    def get_context_timings(self) -> list[CallTiming]: ...
+
+    @abstractmethod
+    def generate_commit(
+        self,
+        diff: str,
+        refinement: Refinement | None = None,
+        on_partial: Callable[[DraftPreview], None] | None = None,
+    ) -> Commit: ...
+
+    @abstractmethod
+    def last_generation_stats(self) -> GenerationStats: ...
+
+    def close(self) -> None:
+        """Ends the workflow, releasing what was kept open across its steps."""
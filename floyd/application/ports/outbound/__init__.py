@@ -1,9 +1,14 @@
 """Outbound ports (secondary/driven ports)."""
 
-from floyd.application.ports.outbound.ai_service_port import AIServicePort
-from floyd.application.ports.outbound.config_port import ConfigPort
-from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
-from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.application.ports.outbound.ai_service_port import AIServicePort
+    from floyd.application.ports.outbound.config_port import ConfigPort
+    from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
+    from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
 
 __all__ = [
     "AIServicePort",
@@ -11,3 +16,13 @@ __all__ = [
     "GitRepositoryPort",
     "PRRepositoryPort",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AIServicePort": "floyd.application.ports.outbound.ai_service_port",
+        "ConfigPort": "floyd.application.ports.outbound.config_port",
+        "GitRepositoryPort": "floyd.application.ports.outbound.git_repository_port",
+        "PRRepositoryPort": "floyd.application.ports.outbound.pr_repository_port",
+    },
+)
@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 
 from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.generation_stats import DraftPreview, GenerationStats
+from floyd.application.dto.refinement import Refinement
 from floyd.domain.entities.commit import Commit
 from floyd.domain.entities.git_context import GitContext
 from floyd.domain.entities.pull_request import PullRequest
 
+PartialCallback = Callable[[DraftPreview], None]
+
 
 class AIServicePort(ABC):
 
@@ -13,7 +18,8 @@ class AIServicePort(ABC):
         self,
         context: GitContext,
         config: AIConfig,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
     ) -> PullRequest: ...
 
     @abstractmethod
@@ -21,5 +27,12 @@ class AIServicePort(ABC):
         self,
         diff: str,
         config: AIConfig,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
     ) -> Commit: ...
+
+    def last_generation_stats(self) -> GenerationStats:
+        return GenerationStats()
+
+    def close(self) -> None:
+        """Releases anything kept between calls, such as a CLI session."""
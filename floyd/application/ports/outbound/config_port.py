@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 
 from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.cache_config import CacheConfig
+from floyd.application.dto.git_config import GitConfig
+from floyd.application.dto.timeout_config import TimeoutConfig
 
 
 class ConfigPort(ABC):
@@ -8,3 +11,15 @@ class ConfigPort(ABC):
     @abstractmethod
     def get_ai_config(self) -> AIConfig:
         ...
+
+    @abstractmethod
+    def get_git_config(self) -> GitConfig:
+        ...
+
+    @abstractmethod
+    def get_cache_config(self) -> CacheConfig:
+        ...
+
+    @abstractmethod
+    def get_timeout_config(self) -> TimeoutConfig:
+        ...
@@ -6,7 +6,7 @@ from floyd.domain.entities.commit import Commit
 class GitRepositoryPort(ABC):
 
     @abstractmethod
-    def fetch(self) -> None:
+    def fetch(self, base_branch: str | None = None, force: bool = False) -> None:
         ...
 
     @abstractmethod
@@ -33,6 +33,9 @@ class GitRepositoryPort(ABC):
     def get_diff_stat(self, base_branch: str) -> str:
         ...
 
+    def get_diff_with_stat(self, base_branch: str) -> tuple[str, str]:
+        return self.get_diff(base_branch), self.get_diff_stat(base_branch)
+
     @abstractmethod
     def get_staged_diff(self) -> str:
         ...
@@ -1,5 +1,36 @@
 """Application services (use cases)."""
 
-from floyd.application.services.pr_generation_service import PRGenerationService
+from typing import TYPE_CHECKING
 
-__all__ = ["PRGenerationService"]
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.application.services.batch_pr_service import BatchPRService
+    from floyd.application.services.git_context_collector import (
+        ConcurrentGitContextCollector,
+        GitContextCollector,
+        SequentialGitContextCollector,
+    )
+    from floyd.application.services.pr_generation_service import PRGenerationService
+    from floyd.application.services.task_graph import TaskGraph
+
+__all__ = [
+    "BatchPRService",
+    "ConcurrentGitContextCollector",
+    "GitContextCollector",
+    "PRGenerationService",
+    "SequentialGitContextCollector",
+    "TaskGraph",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BatchPRService": "floyd.application.services.batch_pr_service",
+        "ConcurrentGitContextCollector": "floyd.application.services.git_context_collector",
+        "GitContextCollector": "floyd.application.services.git_context_collector",
+        "PRGenerationService": "floyd.application.services.pr_generation_service",
+        "SequentialGitContextCollector": "floyd.application.services.git_context_collector",
+        "TaskGraph": "floyd.application.services.task_graph",
+    },
+)
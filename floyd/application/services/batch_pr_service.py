@@ -0,0 +1,109 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Iterable
+
+from floyd.application.dto.batch_item import BatchItem, BatchResult, BatchStatus
+from floyd.application.ports.inbound.batch_pr_port import BatchPRPort
+from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
+from floyd.application.services.tracing import trace_span
+from floyd.domain.exceptions.domain_exception import DomainException
+from floyd.domain.exceptions.pr.pr_already_exist_exception import (
+    PRAlreadyExistsException,
+)
+
+ServiceFactory = Callable[[BatchItem], PRGenerationPort]
+ResultCallback = Callable[[BatchResult], None]
+
+
+class BatchPRService(BatchPRPort):
+    """Prepares (and optionally opens) one PR per manifest item, without prompts.
+
+    Items run on a bounded thread pool; each gets its own PR generation
+    service from `service_factory`, since git and gh must run inside that
+    item's repository. A failing item is reported, never raised.
+    """
+
+    def __init__(
+        self,
+        service_factory: ServiceFactory,
+        max_workers: int = 4,
+        dry_run: bool = False,
+        fresh: bool = False,
+    ) -> None:
+        self._service_factory = service_factory
+        self._max_workers = max(1, max_workers)
+        self._dry_run = dry_run
+        self._fresh = fresh
+
+    def run(
+        self,
+        items: Iterable[BatchItem],
+        on_result: ResultCallback | None = None,
+    ) -> list[BatchResult]:
+        items = list(items)
+        results: list[BatchResult | None] = [None] * len(items)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(items) or 1),
+            thread_name_prefix="floyd-batch",
+        )
+        try:
+            running: dict[Future[BatchResult], int] = {
+                # Copied per item, so a trace being recorded sees every item's work.
+                executor.submit(contextvars.copy_context().run, self._process, item): index
+                for index, item in enumerate(items)
+            }
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    results[index] = future.result()
+                    if on_result:
+                        on_result(future.result())
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        else:
+            executor.shutdown()
+
+        return [result for result in results if result is not None]
+
+    def _process(self, item: BatchItem) -> BatchResult:
+        started = time.perf_counter()
+
+        def result(status: BatchStatus, **fields: str) -> BatchResult:
+            return BatchResult(
+                repo=item.repo,
+                head=item.head,
+                target=item.target,
+                status=status,
+                duration=time.perf_counter() - started,
+                **fields,
+            )
+
+        with trace_span("batch item", "task", repo=str(item.repo), head=item.head):
+            service: PRGenerationPort | None = None
+            try:
+                service = self._service_factory(item)
+                preparation = service.prepare_pr(item.target, self._fresh)
+
+                if not preparation.context.has_changes():
+                    return result(BatchStatus.SKIPPED, error="No changes found to create a PR.")
+
+                pr = preparation.draft or service.generate_pr_draft(preparation.context)
+                if self._dry_run:
+                    return result(BatchStatus.DRAFTED, title=pr.title, body=pr.body)
+
+                url = service.create_pr(pr, item.target)
+                return result(BatchStatus.CREATED, title=pr.title, body=pr.body, url=url)
+            except PRAlreadyExistsException as e:
+                return result(BatchStatus.SKIPPED, error=e.message)
+            except DomainException as e:
+                return result(BatchStatus.FAILED, error=e.message)
+            except Exception as e:
+                return result(BatchStatus.FAILED, error=f"An unexpected error occurred: {e}")
+            finally:
+                if service is not None:
+                    service.close()
@@ -0,0 +1,61 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Generator
+
+
+class CancellationToken:
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._callbacks: dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception:
+                pass
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        with self._lock:
+            if not self._cancelled:
+                callback_id = self._next_id
+                self._next_id += 1
+                self._callbacks[callback_id] = callback
+
+                def unregister() -> None:
+                    with self._lock:
+                        self._callbacks.pop(callback_id, None)
+
+                return unregister
+
+        callback()
+        return lambda: None
+
+
+current_cancellation: ContextVar[CancellationToken | None] = ContextVar(
+    "floyd_cancellation", default=None
+)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Generator[CancellationToken, None, None]:
+    reset_token = current_cancellation.set(token)
+    try:
+        yield token
+    finally:
+        current_cancellation.reset(reset_token)
@@ -0,0 +1,95 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generator
+
+from floyd.domain.exceptions.domain_exception import DomainException
+from floyd.domain.exceptions.terminal.command_timeout_exception import (
+    CommandTimeoutException,
+)
+from floyd.domain.exceptions.terminal.workflow_timeout_exception import (
+    WorkflowTimeoutException,
+)
+
+if TYPE_CHECKING:
+    from floyd.application.dto.timeout_config import TimeoutConfig
+
+
+@dataclass(frozen=True, slots=True)
+class CommandLimit:
+    """How long one command may run, and which limit that comes from."""
+
+    command: str
+    seconds: float
+    workflow_timeout: float | None = None
+
+    def error(self) -> DomainException:
+        if self.workflow_timeout is not None:
+            return WorkflowTimeoutException(self.workflow_timeout)
+        return CommandTimeoutException(self.command, self.seconds)
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """Time limits for the commands run by one workflow step.
+
+    Every command gets the timeout configured for its executable, cut short
+    when the step as a whole would run past `expires_at`.
+    """
+
+    timeouts: "TimeoutConfig"
+    expires_at: float | None = None
+
+    def limit_for(self, tool: str, timeout: float | None = None) -> CommandLimit | None:
+        """The limit for running `tool` now; `timeout` overrides the configured one.
+
+        Raises WorkflowTimeoutException when the step is already out of time.
+        """
+        seconds = self.timeouts.for_tool(tool) if timeout is None else timeout
+        limit = CommandLimit(tool, seconds) if seconds > 0 else None
+
+        if self.expires_at is None:
+            return limit
+
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            raise WorkflowTimeoutException(self.timeouts.workflow)
+
+        if limit is None or remaining < limit.seconds:
+            return CommandLimit(tool, remaining, self.timeouts.workflow)
+        return limit
+
+
+current_deadline: ContextVar[Deadline | None] = ContextVar("floyd_deadline", default=None)
+
+
+def command_limit(tool: str, timeout: float | None = None) -> CommandLimit | None:
+    deadline = current_deadline.get()
+
+    if deadline is None:
+        return CommandLimit(tool, timeout) if timeout else None
+
+    return deadline.limit_for(tool, timeout)
+
+
+@contextmanager
+def deadline_scope(timeouts: "TimeoutConfig") -> Generator[Deadline, None, None]:
+    """Applies `timeouts` to the commands run inside the block.
+
+    A nested scope never extends the deadline of the one it runs in.
+    """
+    expires_at = time.monotonic() + timeouts.workflow if timeouts.workflow > 0 else None
+
+    parent = current_deadline.get()
+    if parent and parent.expires_at is not None:
+        if expires_at is None or parent.expires_at < expires_at:
+            expires_at = parent.expires_at
+            timeouts = timeouts.model_copy(update={"workflow": parent.timeouts.workflow})
+
+    deadline = Deadline(timeouts, expires_at)
+    reset_token = current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        current_deadline.reset(reset_token)
@@ -6,8 +6,14 @@ from floyd.domain.value_objects.ai_provider import ProviderType
 class EnvironmentValidator:
     def __init__(self, terminal: Terminal):
         self._terminal = terminal
+        # Only successful checks are remembered, so a long-lived process
+        # picks up tools installed after a failure.
+        self._validated: set[str] = set()
 
     def validate_core_dependencies(self) -> None:
+        if "core" in self._validated:
+            return
+
         self._terminal.ensure_installed("git")
         self._terminal.ensure_installed("gh")
 
@@ -15,9 +21,14 @@ class EnvironmentValidator:
             from floyd.domain.exceptions.terminal.missing_dependency_exception import MissingDependencyException
             raise MissingDependencyException("python")
 
+        self._validated.add("core")
+
     def validate_ai_provider(self, provider: ProviderType) -> None:
         tool_name = provider.value
 
-        if tool_name:
-            self._terminal.ensure_installed(tool_name)
+        if not tool_name or tool_name in self._validated:
+            return
+
+        self._terminal.ensure_installed(tool_name)
+        self._validated.add(tool_name)
 
@@ -0,0 +1,176 @@
+import contextvars
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
+from floyd.application.services.tracing import trace_span
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.value_objects.branch import Branch
+
+if TYPE_CHECKING:
+    from floyd.application.services.task_graph import TaskAction, TaskGraph
+
+GitRead = tuple[str, Callable[[], Any]]
+
+# Reads that only look at the local repository and so need not wait for the fetch.
+LOCAL_READS = frozenset({"current_branch"})
+READ_LABELS = {
+    "current_branch": "Reading current branch",
+    "commits": "Reading commits",
+    "diff": "Reading diff",
+}
+
+
+class GitContextCollector(ABC):
+
+    def __init__(self, git_repository: GitRepositoryPort) -> None:
+        self._git_repository = git_repository
+        self._timings: list[CallTiming] = []
+
+    @property
+    def timings(self) -> list[CallTiming]:
+        return list(self._timings)
+
+    def collect(self, target_branch: str, fresh: bool = False) -> GitContext:
+        self._timings = []
+
+        start = time.perf_counter()
+        try:
+            with trace_span("fetch", "task"):
+                self._git_repository.fetch(target_branch, force=fresh)
+        except Exception:
+            self._timings.append(self._timing("fetch", start, failed=True))
+            raise
+        self._timings.append(self._timing("fetch", start))
+
+        return self._build_context(target_branch, self._run_reads(self._reads(target_branch)))
+
+    def add_tasks(
+        self,
+        graph: "TaskGraph",
+        target_branch: str,
+        fresh: bool = False,
+        fetch_after: tuple[str, ...] = (),
+    ) -> None:
+        """Adds the fetch, the reads and a `context` task to `graph`.
+
+        The graph schedules them in place of `_run_reads`: local reads start
+        at once, the others as soon as the fetch (run after `fetch_after`) is
+        done. Their timings are kept as `collect` keeps them.
+        """
+        self._timings = []
+        reads = self._reads(target_branch)
+
+        for name, read in reads:
+            graph.add(
+                name,
+                self._timed(name, read),
+                () if name in LOCAL_READS else ("fetch",),
+                label=READ_LABELS.get(name, name),
+            )
+        graph.add(
+            "fetch",
+            self._timed("fetch", partial(self._git_repository.fetch, target_branch, force=fresh)),
+            fetch_after,
+            label=f"Fetching '{target_branch}' (network)",
+        )
+        graph.add(
+            "context",
+            partial(self._build_context, target_branch),
+            tuple(name for name, _ in reads),
+            label="Building context",
+        )
+
+    def _timed(self, name: str, call: Callable[[], Any]) -> "TaskAction":
+        def action(_: Mapping[str, Any]) -> Any:
+            start = time.perf_counter()
+            try:
+                value = call()
+            except Exception:
+                self._timings.append(self._timing(name, start, failed=True))
+                raise
+            self._timings.append(self._timing(name, start))
+            return value
+
+        return action
+
+    def _build_context(self, target_branch: str, results: Mapping[str, Any]) -> GitContext:
+        diff, diff_stat = results["diff"]
+        return GitContext(
+            current_branch=Branch(name=results["current_branch"]),
+            target_branch=Branch(name=target_branch),
+            commits=results["commits"],
+            diff=diff,
+            diff_stat=diff_stat,
+        )
+
+    def _reads(self, target_branch: str) -> list[GitRead]:
+        return [
+            ("current_branch", self._git_repository.get_current_branch),
+            ("commits", partial(self._git_repository.get_commits, target_branch)),
+            ("diff", partial(self._git_repository.get_diff_with_stat, target_branch)),
+        ]
+
+    def _timing(self, name: str, start: float, failed: bool = False) -> CallTiming:
+        return CallTiming(name=name, duration=time.perf_counter() - start, failed=failed)
+
+    @abstractmethod
+    def _run_reads(self, reads: list[GitRead]) -> dict[str, Any]: ...
+
+
+class SequentialGitContextCollector(GitContextCollector):
+
+    def _run_reads(self, reads: list[GitRead]) -> dict[str, Any]:
+        results: dict[str, Any] = {}
+
+        for name, read in reads:
+            start = time.perf_counter()
+            try:
+                with trace_span(name, "task"):
+                    results[name] = read()
+            except Exception:
+                self._timings.append(self._timing(name, start, failed=True))
+                raise
+            self._timings.append(self._timing(name, start))
+
+        return results
+
+
+class ConcurrentGitContextCollector(GitContextCollector):
+
+    def __init__(self, git_repository: GitRepositoryPort, max_workers: int = 4) -> None:
+        super().__init__(git_repository)
+        self._max_workers = max(1, max_workers)
+
+    def _run_reads(self, reads: list[GitRead]) -> dict[str, Any]:
+        timings: list[CallTiming | None] = [None] * len(reads)
+
+        def timed(index: int, name: str, read: Callable[[], Any]) -> Any:
+            start = time.perf_counter()
+            failed = True
+            try:
+                with trace_span(name, "task"):
+                    value = read()
+                failed = False
+                return value
+            finally:
+                timings[index] = self._timing(name, start, failed=failed)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self._max_workers, len(reads)),
+            thread_name_prefix="floyd-git",
+        ) as executor:
+            futures: list[Future[Any]] = [
+                executor.submit(contextvars.copy_context().run, timed, index, name, read)
+                for index, (name, read) in enumerate(reads)
+            ]
+
+        self._timings.extend(timing for timing in timings if timing is not None)
+
+        # Results and errors are resolved in declaration order, so the first
+        # failing read is the one raised, exactly as in the sequential collector.
+        return {name: future.result() for (name, _), future in zip(reads, futures)}
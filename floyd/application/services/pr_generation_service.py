@@ -1,8 +1,21 @@
+from typing import Any, ContextManager, Mapping
+
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.dto.generation_stats import GenerationStats
+from floyd.application.dto.pr_preparation import PRPreparation
+from floyd.application.dto.refinement import Refinement
 from floyd.application.ports.inbound.pr_generation_port import PRGenerationPort
-from floyd.application.ports.outbound.ai_service_port import AIServicePort
+from floyd.application.ports.outbound.ai_service_port import AIServicePort, PartialCallback
 from floyd.application.ports.outbound.config_port import ConfigPort
 from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
 from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
+from floyd.application.services.deadline import Deadline, deadline_scope
+from floyd.application.services.git_context_collector import (
+    GitContextCollector,
+    SequentialGitContextCollector,
+)
+from floyd.application.services.task_graph import ProgressCallback, TaskGraph
+from floyd.application.services.tracing import trace_span
 from floyd.domain.entities.commit import Commit
 from floyd.domain.entities.git_context import GitContext
 from floyd.domain.entities.pull_request import PullRequest
@@ -24,13 +37,31 @@ class PRGenerationService(PRGenerationPort):
         git_repository: GitRepositoryPort,
         pr_repository: PRRepositoryPort,
         config: ConfigPort,
+        context_collector: GitContextCollector | None = None,
+        max_workers: int = 4,
+        speculative_generation: bool = True,
     ) -> None:
         self._ai_service = ai_service
         self._git_repository = git_repository
         self._pr_repository = pr_repository
         self._config = config
+        self._context_collector = context_collector or SequentialGitContextCollector(
+            git_repository
+        )
+        self._max_workers = max_workers
+        self._speculative_generation = speculative_generation
+
+    def _deadline(self) -> ContextManager[Deadline]:
+        # Each call is one step of a workflow and gets the workflow timeout;
+        # steps nested in another step share the outer deadline.
+        return deadline_scope(self._config.get_timeout_config())
 
     def validate_can_create_pr(self, current_branch: str, target_branch: str) -> None:
+        with self._deadline(), trace_span("validate_can_create_pr"):
+            self._validate_branches(current_branch, target_branch)
+            self._ensure_no_open_pr(current_branch, target_branch)
+
+    def _validate_branches(self, current_branch: str, target_branch: str) -> None:
         if current_branch == target_branch:
             raise InvalidBranchException(
                 f"Cannot create PR: source and target branch are the same ({current_branch})"
@@ -39,40 +70,98 @@ class PRGenerationService(PRGenerationPort):
         if not self._git_repository.branch_exists(target_branch):
             raise BranchNotFoundException(target_branch)
 
+    def _ensure_no_open_pr(self, current_branch: str, target_branch: str) -> None:
         if self._pr_repository.pr_exists(current_branch, target_branch):
             raise PRAlreadyExistsException(current_branch, target_branch)
 
-    def get_git_context(self, target_branch: str) -> GitContext:
-        self._git_repository.fetch()
+    def prepare_pr(
+        self,
+        target_branch: str,
+        fresh: bool = False,
+        on_progress: ProgressCallback | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> PRPreparation:
+        graph = self._build_pr_graph(target_branch, fresh, on_partial)
+        with self._deadline(), trace_span("prepare_pr"):
+            results = graph.run(on_progress)
+
+        return PRPreparation(
+            context=results["context"],
+            draft=results["generate"],
+            timings=graph.timings,
+        )
+
+    def _build_pr_graph(
+        self,
+        target_branch: str,
+        fresh: bool,
+        on_partial: PartialCallback | None = None,
+    ) -> TaskGraph:
+        graph = TaskGraph(max_workers=self._max_workers)
+
+        def validate(r: Mapping[str, Any]) -> None:
+            self._validate_branches(r["current_branch"], target_branch)
+
+        def check_open_pr(r: Mapping[str, Any]) -> None:
+            self._ensure_no_open_pr(r["current_branch"], target_branch)
 
-        current_branch = self._git_repository.get_current_branch()
-        commits = self._git_repository.get_commits(target_branch)
-        diff = self._git_repository.get_diff(target_branch)
-        diff_stat = self._git_repository.get_diff_stat(target_branch)
+        def generate(r: Mapping[str, Any]) -> PullRequest | None:
+            context: GitContext = r["context"]
+            if not context.has_changes():
+                return None
+            return self.generate_pr_draft(context, on_partial=on_partial)
 
-        return GitContext(
-            current_branch=Branch(name=current_branch),
-            target_branch=Branch(name=target_branch),
-            commits=commits,
-            diff=diff,
-            diff_stat=diff_stat,
+        # The draft is generated speculatively while `gh pr list` is still in
+        # flight; if that check fails the graph cancels the AI process.
+        generate_deps = ("context",)
+        if not self._speculative_generation:
+            generate_deps = ("context", "pr_exists")
+
+        self._context_collector.add_tasks(graph, target_branch, fresh, fetch_after=("validate",))
+        graph.add("validate", validate, ("current_branch",), label="Validating branches")
+        graph.add(
+            "pr_exists",
+            check_open_pr,
+            ("current_branch", "validate"),
+            label="Checking open PRs (network)",
         )
+        graph.add("generate", generate, generate_deps, label="Generating PR draft")
+
+        return graph
+
+    def get_git_context(self, target_branch: str, fresh: bool = False) -> GitContext:
+        with self._deadline(), trace_span("get_git_context"):
+            return self._context_collector.collect(target_branch, fresh)
+
+    def get_context_timings(self) -> list[CallTiming]:
+        return self._context_collector.timings
 
     def generate_pr_draft(
         self,
         context: GitContext,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
     ) -> PullRequest:
         ai_config = self._config.get_ai_config()
-        return self._ai_service.generate_pr(context, ai_config, feedback)
+        with self._deadline(), trace_span("generate_pr_draft", refining=refinement is not None):
+            return self._ai_service.generate_pr(context, ai_config, refinement, on_partial)
 
     def generate_commit(
         self,
         diff: str,
-        feedback: str | None = None,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
     ) -> Commit:
         ai_config = self._config.get_ai_config()
-        return self._ai_service.generate_commit(diff, ai_config, feedback)
+        with self._deadline(), trace_span("generate_commit", refining=refinement is not None):
+            return self._ai_service.generate_commit(diff, ai_config, refinement, on_partial)
+
+    def last_generation_stats(self) -> GenerationStats:
+        return self._ai_service.last_generation_stats()
+
+    def close(self) -> None:
+        self._ai_service.close()
 
     def create_pr(self, pr: PullRequest, base_branch: str) -> str:
-        return self._pr_repository.create_pr(pr, base_branch)
+        with self._deadline(), trace_span("create_pr"):
+            return self._pr_repository.create_pr(pr, base_branch)
@@ -0,0 +1,172 @@
+import contextvars
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping
+
+from floyd.application.dto.call_timing import CallTiming
+from floyd.application.dto.task_progress import TaskProgress, TaskState
+from floyd.application.services.cancellation import (
+    CancellationToken,
+    cancellation_scope,
+)
+from floyd.application.services.tracing import trace_span
+
+TaskAction = Callable[[Mapping[str, Any]], Any]
+ProgressCallback = Callable[[TaskProgress], None]
+
+
+@dataclass(frozen=True)
+class _Task:
+    name: str
+    action: TaskAction
+    depends_on: tuple[str, ...]
+    label: str
+
+
+class TaskGraph:
+    """Runs named tasks as soon as their dependencies have finished.
+
+    The first task to fail cancels every task still running (through the
+    cancellation token Terminal watches) and skips everything not yet started;
+    its exception is then re-raised from `run`.
+    """
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self._max_workers = max(1, max_workers)
+        self._tasks: dict[str, _Task] = {}
+        self._timings: list[CallTiming] = []
+
+    @property
+    def timings(self) -> list[CallTiming]:
+        return list(self._timings)
+
+    def add(
+        self,
+        name: str,
+        action: TaskAction,
+        depends_on: tuple[str, ...] = (),
+        label: str = "",
+    ) -> None:
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already registered")
+
+        self._tasks[name] = _Task(name, action, depends_on, label or name)
+
+    def run(self, on_progress: ProgressCallback | None = None) -> dict[str, Any]:
+        self._validate()
+        self._timings = []
+
+        states = {name: TaskState.PENDING for name in self._tasks}
+        tokens: dict[str, CancellationToken] = {}
+        started: dict[str, float] = {}
+        results: dict[str, Any] = {}
+        running: dict[Future[Any], str] = {}
+        failure: BaseException | None = None
+
+        def notify(name: str, duration: float = 0.0) -> None:
+            if on_progress:
+                task = self._tasks[name]
+                on_progress(
+                    TaskProgress(name=name, label=task.label, state=states[name], duration=duration)
+                )
+
+        def execute(task: _Task, token: CancellationToken, inputs: dict[str, Any]) -> Any:
+            with cancellation_scope(token), trace_span(task.name, "task", label=task.label):
+                return task.action(inputs)
+
+        def cancel_running() -> None:
+            for name in running.values():
+                tokens[name].cancel()
+
+        with ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="floyd-task"
+        ) as executor:
+
+            def submit_ready() -> None:
+                for name, task in self._tasks.items():
+                    if states[name] is not TaskState.PENDING:
+                        continue
+                    if not all(states[dep] is TaskState.DONE for dep in task.depends_on):
+                        continue
+
+                    tokens[name] = CancellationToken()
+                    states[name] = TaskState.RUNNING
+                    started[name] = time.perf_counter()
+                    notify(name)
+
+                    inputs = {dep: results[dep] for dep in task.depends_on}
+                    # Copied per task, so the caller's deadline applies in the worker.
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, execute, task, tokens[name], inputs)] = name
+
+            try:
+                submit_ready()
+
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+                    for future in done:
+                        name = running.pop(future)
+                        duration = time.perf_counter() - started[name]
+
+                        try:
+                            results[name] = future.result()
+                            states[name] = TaskState.DONE
+                        except BaseException as e:
+                            if tokens[name].cancelled:
+                                states[name] = TaskState.CANCELLED
+                            else:
+                                states[name] = TaskState.FAILED
+                                if failure is None:
+                                    failure = e
+                                    cancel_running()
+
+                        self._timings.append(
+                            CallTiming(
+                                name=name,
+                                duration=duration,
+                                failed=states[name] is not TaskState.DONE,
+                            )
+                        )
+                        notify(name, duration)
+
+                    if failure is None:
+                        submit_ready()
+            except BaseException:
+                cancel_running()
+                raise
+
+        for name, state in states.items():
+            if state is TaskState.PENDING:
+                states[name] = TaskState.SKIPPED
+                notify(name)
+
+        if failure is not None:
+            raise failure
+
+        return results
+
+    def _validate(self) -> None:
+        for task in self._tasks.values():
+            for dep in task.depends_on:
+                if dep not in self._tasks:
+                    raise ValueError(f"Task '{task.name}' depends on unknown task '{dep}'")
+
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Task graph has a cycle through '{name}'")
+
+            visiting.add(name)
+            for dep in self._tasks[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._tasks:
+            visit(name)
@@ -0,0 +1,196 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Generator
+
+if TYPE_CHECKING:
+    from floyd.application.dto.span_summary import SpanSummary
+
+# Summary rows come in this order; anything else after them.
+CATEGORIES = ("phase", "task", "ai", "process")
+
+
+class Span:
+    """One timed operation; `set` attaches what is learned while it runs."""
+
+    __slots__ = ("name", "category", "args", "start", "end", "thread", "_tracer")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.thread = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end: float | None = None
+
+    def set(self, **args: Any) -> None:
+        self.args.update(args)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, kind: type[BaseException] | None, error: object, traceback: object) -> None:
+        self.end = time.perf_counter()
+        if kind is not None:
+            self.args["error"] = kind.__name__
+        self._tracer._add(self)
+
+
+class _NullSpan:
+    """What `trace_span` hands out when nothing is being traced.
+
+    Falsy, so callers can skip computing what they would `set`.
+    """
+
+    __slots__ = ()
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, kind: object, error: object, traceback: object) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+MaybeSpan = Span | _NullSpan
+
+
+class Tracer:
+    """Collects the spans of one run, from any thread or task."""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self.origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._thread_names: dict[int, str] = {}
+
+    def span(self, name: str, category: str, **args: Any) -> Span:
+        return Span(self, name, category, args)
+
+    def _add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+            self._thread_names.setdefault(span.thread, threading.current_thread().name)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.origin
+
+    def summary(self) -> list["SpanSummary"]:
+        """Spans grouped by category and name, in the order they first started."""
+        from floyd.application.dto.span_summary import SpanSummary
+
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+
+        groups: dict[tuple[str, str], list[Span]] = {}
+        for span in spans:
+            groups.setdefault((span.category, span.name), []).append(span)
+
+        def order(key: tuple[str, str]) -> int:
+            return CATEGORIES.index(key[0]) if key[0] in CATEGORIES else len(CATEGORIES)
+
+        return [
+            SpanSummary(
+                name=name,
+                category=category,
+                calls=len(group),
+                total=sum(span.duration for span in group),
+                longest=max(span.duration for span in group),
+                failures=sum(1 for span in group if "error" in span.args),
+                output_bytes=sum(int(span.args.get("stdout_bytes", 0)) for span in group),
+            )
+            for category, name in sorted(groups, key=order)
+            for group in (groups[(category, name)],)
+        ]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The spans in Chrome's trace event format, for chrome://tracing or Perfetto.
+
+        Every thread gets a track of its own, named after the thread.
+        """
+        pid = os.getpid()
+
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+            thread_names = dict(self._thread_names)
+
+        events: list[dict[str, Any]] = [
+            {"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": "floyd"}}
+        ]
+        events.extend(
+            {"ph": "M", "name": "thread_name", "pid": pid, "tid": thread, "args": {"name": name}}
+            for thread, name in thread_names.items()
+        )
+
+        for span in spans:
+            start = (span.start - self.origin) * 1e6
+            event = {
+                "name": span.name,
+                "cat": span.category,
+                "pid": pid,
+                "tid": span.thread,
+                "ts": round(start, 3),
+                "args": {key: _jsonable(value) for key, value in span.args.items()},
+            }
+            events.append(dict(event, ph="X", dur=round(span.duration * 1e6, 3)))
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return str(value)
+
+
+current_tracer: ContextVar[Tracer | None] = ContextVar("floyd_tracer", default=None)
+
+
+def trace_span(name: str, category: str = "phase", **args: Any) -> MaybeSpan:
+    """A span for `with`, recorded by the current tracer; a no-op without one."""
+    tracer = current_tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+
+    return tracer.span(name, category, **args)
+
+
+def process_span(argv: list[str] | str) -> MaybeSpan:
+    """A span for running `argv`, named after the executable and its subcommand."""
+    tracer = current_tracer.get()
+    if tracer is None:
+        return _NULL_SPAN
+
+    words = argv if isinstance(argv, list) else argv.split()
+    name = os.path.basename(words[0]) if words else ""
+    # `git diff`, `gh pr`; not `sleep 0.1` or `claude -p`.
+    if len(words) > 1 and words[1][:1].isalpha() and words[1].replace("-", "").isalnum():
+        name += " " + words[1]
+
+    return tracer.span(name, "process", argv=list(words))
+
+
+@contextmanager
+def tracing_scope(tracer: Tracer) -> Generator[Tracer, None, None]:
+    reset_token = current_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        current_tracer.reset(reset_token)
@@ -1,23 +1,50 @@
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
-from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
-from floyd.adapters.outbound.ai.copilot_adapter import CopilotAdapter
-from floyd.adapters.outbound.ai.gemini_adapter import GeminiAdapter
+from floyd.adapters.outbound.ai.response_cache import ResponseCache, default_cache_dir
 from floyd.adapters.outbound.config.toml_config_adapter import TomlConfigAdapter
 from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from floyd.adapters.outbound.git.ref_reader import GitRefReader
 from floyd.adapters.outbound.github.github_cli_adapter import GitHubCLIAdapter
+from floyd.application.dto.batch_item import BatchItem
 from floyd.application.ports.outbound.ai_service_port import AIServicePort
 from floyd.application.ports.outbound.config_port import ConfigPort
 from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
 from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
+from floyd.application.services.batch_pr_service import BatchPRService
 from floyd.application.services.environment_validator import EnvironmentValidator
+from floyd.application.services.git_context_collector import (
+    ConcurrentGitContextCollector,
+)
 from floyd.application.services.pr_generation_service import PRGenerationService
 from floyd.adapters.outbound.utils.terminal import Terminal
 from floyd.domain.exceptions.ai.invalid_provider_exception import (
     InvalidProviderException,
 )
+from floyd.domain.exceptions.config.invalid_config_exception import (
+    InvalidConfigException,
+)
 from floyd.domain.value_objects.ai_provider import ProviderType
 
+if TYPE_CHECKING:
+    from floyd.adapters.outbound.ai.ai_adapter import AIAdapter
+
+# Resolved on demand so only the configured providers' adapters are imported.
+ADAPTER_MAP: dict[ProviderType, str] = {
+    ProviderType.CLAUDE: "floyd.adapters.outbound.ai.claude_adapter:ClaudeAdapter",
+    ProviderType.GEMINI: "floyd.adapters.outbound.ai.gemini_adapter:GeminiAdapter",
+    ProviderType.COPILOT: "floyd.adapters.outbound.ai.copilot_adapter:CopilotAdapter",
+}
+
+# Adapters that keep the provider CLI running between turns (`session = true`).
+SESSION_ADAPTER_MAP: dict[ProviderType, str] = {
+    ProviderType.CLAUDE: "floyd.adapters.outbound.ai.claude_session_adapter:ClaudeSessionAdapter",
+}
+
 
 @dataclass
 class Container:
@@ -27,38 +54,117 @@ class Container:
     config: ConfigPort
     pr_generation_service: PRGenerationService
 
+    def close(self) -> None:
+        self.pr_generation_service.close()
 
-def create_container() -> Container:
-    terminal = Terminal()
-    config = TomlConfigAdapter()
-    validator = EnvironmentValidator(terminal)
+    def __enter__(self) -> "Container":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _adapter_class(provider: ProviderType, session: bool = False) -> "type[AIAdapter]":
+    target = (session and SESSION_ADAPTER_MAP.get(provider)) or ADAPTER_MAP.get(provider)
+
+    if not target:
+        raise InvalidProviderException(f"No adapter registered for {provider}")
+
+    module, _, name = target.partition(":")
+    return getattr(import_module(module), name)
 
-    validator.validate_core_dependencies()
 
+def _providers(
+    config: ConfigPort, validator: EnvironmentValidator
+) -> "dict[ProviderType, type[AIAdapter]]":
     settings = config.get_ai_config()
+    providers = settings.race or (settings.provider,)
 
-    validator.validate_ai_provider(settings.provider)
+    for provider in providers:
+        validator.validate_ai_provider(provider)
 
-    ADAPTER_MAP = {
-        ProviderType.CLAUDE: ClaudeAdapter,
-        ProviderType.GEMINI: GeminiAdapter,
-        ProviderType.COPILOT: CopilotAdapter,
-    }
+    return {provider: _adapter_class(provider, settings.session) for provider in providers}
 
-    adapter_class = ADAPTER_MAP.get(settings.provider)
 
-    if not adapter_class:
-        raise InvalidProviderException(f"No adapter registered for {settings.provider}")
+def _response_cache(config: ConfigPort, use_cache: bool) -> ResponseCache | None:
+    cache_settings = config.get_cache_config()
 
-    ai_service = adapter_class(terminal)
-    git_repository = GitCLIAdapter(terminal)
-    pr_repository = GitHubCLIAdapter(terminal)
+    if not cache_settings.enabled:
+        return None
+
+    return ResponseCache(
+        default_cache_dir(),
+        max_bytes=cache_settings.max_size_mb * 1024 * 1024,
+        ttl=cache_settings.ttl,
+        bypass=not use_cache,
+    )
+
+
+def _ai_service(
+    terminal: Terminal,
+    adapter_classes: "dict[ProviderType, type[AIAdapter]]",
+    cache: ResponseCache | None,
+) -> AIServicePort:
+    if len(adapter_classes) > 1:
+        from floyd.adapters.outbound.ai.racing_adapter import RacingAIAdapter
+
+        return RacingAIAdapter(
+            {provider: adapter(terminal, cache) for provider, adapter in adapter_classes.items()}
+        )
+
+    (adapter,) = adapter_classes.values()
+    return adapter(terminal, cache)
+
+
+def _git_repository(
+    terminal: Terminal,
+    config: ConfigPort,
+    cwd: Path | None = None,
+    head: str | None = None,
+) -> GitCLIAdapter:
+    git_settings = config.get_git_config()
+    ai_config = config.get_ai_config()
+
+    return GitCLIAdapter(
+        terminal,
+        ref_reader=GitRefReader(root=cwd),
+        targeted_fetch=git_settings.targeted_fetch,
+        fetch_ttl=git_settings.fetch_ttl,
+        # A map-reduce reads the whole diff; each part then fits a prompt.
+        diff_limit=-1 if ai_config.map_reduce else ai_config.diff_limit,
+        cwd=cwd,
+        head=head,
+        path_rules=git_settings.exclude,
+        gitattributes=git_settings.gitattributes,
+    )
+
+
+def create_container(
+    use_cache: bool = True,
+    cwd: Path | None = None,
+    terminal: Terminal | None = None,
+    config: ConfigPort | None = None,
+    validator: EnvironmentValidator | None = None,
+) -> Container:
+    terminal = terminal or Terminal()
+    config = config or TomlConfigAdapter()
+    validator = validator or EnvironmentValidator(terminal)
+
+    validator.validate_core_dependencies()
+
+    adapter_classes = _providers(config, validator)
+    cache = _response_cache(config, use_cache)
+
+    ai_service = _ai_service(terminal, adapter_classes, cache)
+    git_repository = _git_repository(terminal, config, cwd=cwd)
+    pr_repository = GitHubCLIAdapter(terminal, cwd=cwd)
 
     pr_generation_service = PRGenerationService(
         ai_service=ai_service,
         git_repository=git_repository,
         pr_repository=pr_repository,
         config=config,
+        context_collector=ConcurrentGitContextCollector(git_repository),
     )
 
     return Container(
@@ -68,3 +174,100 @@ def create_container() -> Container:
         config=config,
         pr_generation_service=pr_generation_service,
     )
+
+
+@dataclass(frozen=True)
+class _WarmRepository:
+    container: Container
+    adapter_classes: "dict[ProviderType, type[AIAdapter]]"
+    cache: ResponseCache | None
+
+
+def create_container_factory(max_containers: int = 16) -> Callable[[Path, bool], Container]:
+    """Builds a container per request for a long-lived process.
+
+    The terminal, config and dependency checks are shared. The git and gh
+    adapters of each repository are reused while the config is unchanged,
+    which keeps its parsed refs and fetch stamps warm between requests. The
+    AI adapter and the services keep per-call state (generation stats, git
+    timings), so every request gets its own.
+    """
+    terminal = Terminal()
+    config = TomlConfigAdapter()
+    validator = EnvironmentValidator(terminal)
+    containers: OrderedDict[tuple[object, ...], _WarmRepository] = OrderedDict()
+    lock = threading.Lock()
+
+    def container_for(cwd: Path, use_cache: bool = True) -> Container:
+        key = (
+            cwd,
+            use_cache,
+            config.get_ai_config(),
+            config.get_git_config(),
+            config.get_cache_config(),
+        )
+
+        with lock:
+            warm = containers.get(key)
+            if warm is not None:
+                containers.move_to_end(key)
+
+        if warm is None:
+            warm = _WarmRepository(
+                create_container(use_cache, cwd, terminal, config, validator),
+                _providers(config, validator),
+                _response_cache(config, use_cache),
+            )
+            with lock:
+                containers[key] = warm
+                while len(containers) > max_containers:
+                    containers.popitem(last=False)
+
+        ai_service = _ai_service(terminal, warm.adapter_classes, warm.cache)
+        base = warm.container
+        return replace(
+            base,
+            ai_service=ai_service,
+            pr_generation_service=PRGenerationService(
+                ai_service=ai_service,
+                git_repository=base.git_repository,
+                pr_repository=base.pr_repository,
+                config=config,
+                context_collector=ConcurrentGitContextCollector(base.git_repository),
+            ),
+        )
+
+    return container_for
+
+
+def create_batch_service(
+    jobs: int = 4,
+    dry_run: bool = False,
+    fresh: bool = False,
+    use_cache: bool = True,
+) -> BatchPRService:
+    terminal = Terminal()
+    config = TomlConfigAdapter()
+    validator = EnvironmentValidator(terminal)
+
+    validator.validate_core_dependencies()
+
+    adapter_classes = _providers(config, validator)
+    cache = _response_cache(config, use_cache)
+
+    def service_for(item: BatchItem) -> PRGenerationService:
+        if GitRefReader(root=item.repo).is_repo() is False:
+            raise InvalidConfigException(f"{item.repo} is not a git repository.")
+
+        # Adapters keep per-run state (generation stats, cwd), so each item
+        # gets its own; the terminal, config and cache are shared.
+        git_repository = _git_repository(terminal, config, cwd=item.repo, head=item.head)
+
+        return PRGenerationService(
+            ai_service=_ai_service(terminal, adapter_classes, cache),
+            git_repository=git_repository,
+            pr_repository=GitHubCLIAdapter(terminal, cwd=item.repo),
+            config=config,
+        )
+
+    return BatchPRService(service_for, max_workers=jobs, dry_run=dry_run, fresh=fresh)
@@ -1,15 +1,20 @@
 """Domain layer - Core business logic."""
 
-from floyd.domain.entities.git_context import GitContext
-from floyd.domain.entities.pull_request import PullRequest
-from floyd.domain.exceptions import (
-    BranchNotFoundException,
-    DomainException,
-    InvalidBranchException,
-    PRAlreadyExistsException,
-    PRGenerationException,
-)
-from floyd.domain.value_objects.branch import Branch
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.domain.entities.git_context import GitContext
+    from floyd.domain.entities.pull_request import PullRequest
+    from floyd.domain.exceptions import (
+        BranchNotFoundException,
+        DomainException,
+        InvalidBranchException,
+        PRAlreadyExistsException,
+        PRGenerationException,
+    )
+    from floyd.domain.value_objects.branch import Branch
 
 __all__ = [
     "Branch",
@@ -21,3 +26,17 @@ __all__ = [
     "PRGenerationException",
     "PullRequest",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Branch": "floyd.domain.value_objects.branch",
+        "BranchNotFoundException": "floyd.domain.exceptions",
+        "DomainException": "floyd.domain.exceptions",
+        "GitContext": "floyd.domain.entities.git_context",
+        "InvalidBranchException": "floyd.domain.exceptions",
+        "PRAlreadyExistsException": "floyd.domain.exceptions",
+        "PRGenerationException": "floyd.domain.exceptions",
+        "PullRequest": "floyd.domain.entities.pull_request",
+    },
+)
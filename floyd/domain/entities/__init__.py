@@ -1,6 +1,19 @@
 """Domain entities."""
 
-from floyd.domain.entities.git_context import GitContext
-from floyd.domain.entities.pull_request import PullRequest
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.domain.entities.git_context import GitContext
+    from floyd.domain.entities.pull_request import PullRequest
 
 __all__ = ["GitContext", "PullRequest"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GitContext": "floyd.domain.entities.git_context",
+        "PullRequest": "floyd.domain.entities.pull_request",
+    },
+)
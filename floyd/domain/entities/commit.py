@@ -1,19 +1,13 @@
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
 
+from floyd.domain.entities.title_rules import validate_title
 
-class Commit(BaseModel):
-    title: str = Field(..., min_length=1, max_length=256)
-    body: str = Field(default="")
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("Title cannot be empty")
-        return v
+@dataclass(frozen=True, slots=True)
+class Commit:
+    title: str
+    body: str = ""
 
-    @field_validator("body")
-    @classmethod
-    def validate_body(cls, v: str) -> str:
-        return v.strip()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title", validate_title(self.title))
+        object.__setattr__(self, "body", self.body.strip())
@@ -1,14 +1,17 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 from floyd.domain.value_objects.branch import Branch
 
 
-class GitContext(BaseModel):
+@dataclass(frozen=True, slots=True)
+class GitContext:
+    # No per-field validation: the diff can be megabytes and the branches
+    # are already validated value objects.
     current_branch: Branch
     target_branch: Branch
-    commits: str = Field(default="")
-    diff: str = Field(default="")
-    diff_stat: str = Field(default="")
+    commits: str = ""
+    diff: str = ""
+    diff_stat: str = ""
 
     def has_changes(self) -> bool:
         return bool(self.diff.strip())
@@ -1,27 +1,21 @@
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
 
+from floyd.domain.entities.title_rules import validate_title
 
-class PullRequest(BaseModel):
-    title: str = Field(..., min_length=1, max_length=256)
-    body: str = Field(default="")
-    head_branch: str = Field(..., min_length=1)
 
-    @field_validator("title")
-    @classmethod
-    def validate_title(cls, v: str) -> str:
-        v = v.strip()
-        if not v:
-            raise ValueError("Title cannot be empty")
-        return v
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PullRequest:
+    title: str
+    body: str = ""
+    head_branch: str
 
-    @field_validator("body")
-    @classmethod
-    def validate_body(cls, v: str) -> str:
-        return v.strip()
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "title", validate_title(self.title))
+        object.__setattr__(self, "body", self.body.strip())
+        object.__setattr__(self, "head_branch", self.validate_head_branch(self.head_branch))
 
-    @field_validator("head_branch")
-    @classmethod
-    def validate_head_branch(cls, v: str) -> str:
+    @staticmethod
+    def validate_head_branch(v: str) -> str:
         v = v.strip()
         if not v:
             raise ValueError("Head branch cannot be empty")
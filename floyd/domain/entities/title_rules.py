@@ -0,0 +1,10 @@
+TITLE_MAX_LENGTH = 256
+
+
+def validate_title(v: str) -> str:
+    v = v.strip()
+    if not v:
+        raise ValueError("Title cannot be empty")
+    if len(v) > TITLE_MAX_LENGTH:
+        raise ValueError(f"Title cannot be longer than {TITLE_MAX_LENGTH} characters")
+    return v
@@ -15,13 +15,23 @@ from floyd.domain.exceptions.pr.pr_already_exist_exception import (
     PRAlreadyExistsException,
 )
 from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+from floyd.domain.exceptions.terminal.command_timeout_exception import (
+    CommandTimeoutException,
+)
 from floyd.domain.exceptions.terminal.missing_dependency_exception import (
     MissingDependencyException,
 )
+from floyd.domain.exceptions.terminal.operation_cancelled_exception import (
+    OperationCancelledException,
+)
 from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
+from floyd.domain.exceptions.terminal.workflow_timeout_exception import (
+    WorkflowTimeoutException,
+)
 
 __all__ = [
     "BranchNotFoundException",
+    "CommandTimeoutException",
     "DomainException",
     "InvalidBranchException",
     "PRAlreadyExistsException",
@@ -29,5 +39,7 @@ __all__ = [
     "InvalidConfigException",
     "InvalidProviderException",
     "MissingDependencyException",
+    "OperationCancelledException",
     "UnexpectedException",
+    "WorkflowTimeoutException",
 ]
@@ -0,0 +1,8 @@
+from floyd.domain.exceptions.domain_exception import DomainException
+
+
+class CommandTimeoutException(DomainException):
+    def __init__(self, command: str, timeout: float) -> None:
+        super().__init__(f"'{command}' did not finish within {timeout:g}s and was stopped.")
+        self.command = command
+        self.timeout = timeout
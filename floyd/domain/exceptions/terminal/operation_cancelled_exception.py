@@ -0,0 +1,6 @@
+from floyd.domain.exceptions.domain_exception import DomainException
+
+
+class OperationCancelledException(DomainException):
+    def __init__(self, message: str = "Operation cancelled") -> None:
+        super().__init__(message)
@@ -0,0 +1,7 @@
+from floyd.domain.exceptions.domain_exception import DomainException
+
+
+class WorkflowTimeoutException(DomainException):
+    def __init__(self, timeout: float) -> None:
+        super().__init__(f"The workflow did not finish within {timeout:g}s and was stopped.")
+        self.timeout = timeout
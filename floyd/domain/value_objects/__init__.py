@@ -1,5 +1,17 @@
 """Domain value objects."""
 
-from floyd.domain.value_objects.branch import Branch
+from typing import TYPE_CHECKING
+
+from floyd.lazy_import import lazy_exports
+
+if TYPE_CHECKING:
+    from floyd.domain.value_objects.branch import Branch
 
 __all__ = ["Branch"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Branch": "floyd.domain.value_objects.branch",
+    },
+)
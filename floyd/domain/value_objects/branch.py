@@ -1,14 +1,15 @@
-from pydantic import BaseModel, field_validator
+from dataclasses import dataclass
 
 
-class Branch(BaseModel):
+@dataclass(frozen=True, slots=True, eq=False)
+class Branch:
     name: str
 
-    model_config = {"frozen": True}
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", self.validate_name(self.name))
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
+    @staticmethod
+    def validate_name(v: str) -> str:
         if not v or not v.strip():
             raise ValueError("Branch name cannot be empty")
         v = v.strip()
@@ -0,0 +1,27 @@
+from importlib import import_module
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Builds ``__getattr__`` and ``__dir__`` for a package that re-exports names.
+
+    Each name maps to the module defining it, which is only imported when the
+    name is first looked up, so importing one submodule doesn't drag in the
+    whole package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(import_module(module), name)
+        setattr(import_module(package), name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted([*vars(import_module(package)), *exports])
+
+    return __getattr__, __dir__
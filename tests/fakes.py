@@ -0,0 +1,203 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from typing import Callable, Iterator
+
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.cache_config import CacheConfig
+from floyd.application.dto.git_config import GitConfig
+from floyd.application.dto.refinement import Refinement
+from floyd.application.dto.timeout_config import TimeoutConfig
+from floyd.application.ports.outbound.ai_service_port import AIServicePort, PartialCallback
+from floyd.application.ports.outbound.config_port import ConfigPort
+from floyd.application.ports.outbound.git_repository_port import GitRepositoryPort
+from floyd.application.ports.outbound.pr_repository_port import PRRepositoryPort
+from floyd.application.services.cancellation import current_cancellation
+from floyd.domain.entities.commit import Commit
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.entities.pull_request import PullRequest
+from floyd.domain.exceptions.terminal.operation_cancelled_exception import (
+    OperationCancelledException,
+)
+from floyd.domain.value_objects.ai_provider import ProviderType
+
+FAKE_CLIS = Path(__file__).resolve().parent.parent / "benchmarks" / "fakes"
+DIFF = "diff --git a/app.py b/app.py\n--- a/app.py\n+++ b/app.py\n@@ -1 +1 @@\n-old\n+new\n"
+
+
+def use_fake_clis(test: unittest.TestCase) -> Path:
+    """Puts benchmarks/fakes first on PATH until the test ends.
+
+    Returns the file the fake `claude` logs its requests to. Variables the
+    test sets later, such as FAKE_CLAUDE_FAIL, are undone as well.
+    """
+    saved = dict(os.environ)
+    log = Path(tempfile.mkdtemp(prefix="floyd-test-")) / "claude.log"
+    os.environ["PATH"] = f"{FAKE_CLIS}{os.pathsep}{os.environ['PATH']}"
+    os.environ["FAKE_CLAUDE_LOG"] = str(log)
+
+    def restore() -> None:
+        os.environ.clear()
+        os.environ.update(saved)
+
+    test.addCleanup(restore)
+    return log
+
+
+class FakeTerminal(Terminal):
+    """Answers every command with `answer` instead of running it, and records the prompts."""
+
+    def __init__(self, answer: str) -> None:
+        super().__init__()
+        self.answer = answer
+        self.commands: list[list[str]] = []
+        self.prompts: list[str] = []
+
+    def run(
+        self,
+        command: list[str] | str,
+        input_data: str | None = None,
+        error_msg: str = "Command Failed",
+        cwd: Path | None = None,
+        timeout: float | None = None,
+    ) -> str:
+        self.commands.append(command if isinstance(command, list) else [command])
+        self.prompts.append(input_data or "")
+        return self.answer
+
+    def stream(
+        self,
+        command: list[str] | str,
+        input_data: str | None = None,
+        error_msg: str = "Command Failed",
+        cwd: Path | None = None,
+        timeout: float | None = None,
+    ) -> Iterator[str]:
+        yield self.run(command, input_data, error_msg, cwd, timeout)
+
+
+class FakeGitRepository(GitRepositoryPort):
+    """An in-memory repository that records the calls made to it, in order."""
+
+    def __init__(self, branch: str = "feature", diff: str = DIFF, branches: tuple[str, ...] = ("main",)) -> None:
+        self.branch = branch
+        self.diff = diff
+        self.branches = branches
+        self.calls: list[str] = []
+        self.committed: list[Commit] = []
+        self._lock = threading.Lock()
+
+    def _record(self, call: str) -> None:
+        with self._lock:
+            self.calls.append(call)
+
+    def fetch(self, base_branch: str | None = None, force: bool = False) -> None:
+        self._record(f"fetch {base_branch} force={force}")
+
+    def is_git_repo(self) -> bool:
+        return True
+
+    def branch_exists(self, branch_name: str) -> bool:
+        self._record(f"branch_exists {branch_name}")
+        return branch_name in self.branches
+
+    def get_current_branch(self) -> str:
+        self._record("get_current_branch")
+        return self.branch
+
+    def get_commits(self, base_branch: str) -> str:
+        self._record("get_commits")
+        return "abc1234 Change app" if self.diff else ""
+
+    def get_diff(self, base_branch: str) -> str:
+        self._record("get_diff")
+        return self.diff
+
+    def get_diff_stat(self, base_branch: str) -> str:
+        self._record("get_diff_stat")
+        return " app.py | 2 +-" if self.diff else ""
+
+    def get_staged_diff(self) -> str:
+        return self.diff
+
+    def commit(self, commit: Commit) -> str:
+        self.committed.append(commit)
+        return "committed"
+
+
+class FakePRRepository(PRRepositoryPort):
+
+    def __init__(self, exists: bool = False, before_answer: Callable[[], None] | None = None) -> None:
+        self.exists = exists
+        self.before_answer = before_answer
+        self.created: list[PullRequest] = []
+
+    def pr_exists(self, head_branch: str, base_branch: str) -> bool:
+        if self.before_answer:
+            self.before_answer()
+        return self.exists
+
+    def create_pr(self, pr: PullRequest, base_branch: str) -> str:
+        self.created.append(pr)
+        return f"https://example.com/pull/{len(self.created)}"
+
+
+class FakeAIService(AIServicePort):
+    """Answers with fixed drafts; `block` holds each call until it is cancelled."""
+
+    def __init__(self, block: bool = False) -> None:
+        self.block = block
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+        self.contexts: list[GitContext] = []
+
+    def generate_pr(
+        self,
+        context: GitContext,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> PullRequest:
+        self.contexts.append(context)
+        self.started.set()
+
+        if self.block:
+            token = current_cancellation.get()
+            assert token is not None, "the AI call does not run under a cancellation token"
+            token.on_cancel(self.cancelled.set)
+            if not self.cancelled.wait(5):
+                raise AssertionError("the speculative draft was never cancelled")
+            raise OperationCancelledException()
+
+        return PullRequest(title="Change app", body="Body", head_branch=context.current_branch.name)
+
+    def generate_commit(
+        self,
+        diff: str,
+        config: AIConfig,
+        refinement: Refinement | None = None,
+        on_partial: PartialCallback | None = None,
+    ) -> Commit:
+        return Commit(title="Change app")
+
+
+class FakeConfig(ConfigPort):
+
+    def __init__(self, ai: AIConfig | None = None, timeouts: TimeoutConfig | None = None) -> None:
+        self.ai = ai or AIConfig(provider=ProviderType.CLAUDE)
+        self.timeouts = timeouts or TimeoutConfig()
+
+    def get_ai_config(self) -> AIConfig:
+        return self.ai
+
+    def get_git_config(self) -> GitConfig:
+        return GitConfig()
+
+    def get_cache_config(self) -> CacheConfig:
+        return CacheConfig(enabled=False)
+
+    def get_timeout_config(self) -> TimeoutConfig:
+        return self.timeouts
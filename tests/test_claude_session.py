@@ -0,0 +1,140 @@
+import json
+import os
+import time
+import unittest
+from dataclasses import replace
+from unittest import mock
+
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.ai.claude_session_adapter import ClaudeSessionAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.refinement import Refinement
+from floyd.application.dto.timeout_config import TimeoutConfig
+from floyd.application.services.deadline import deadline_scope
+from floyd.application.services.pr_generation_service import PRGenerationService
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+from floyd.domain.exceptions.terminal.command_timeout_exception import (
+    CommandTimeoutException,
+)
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+from tests.fakes import DIFF, FakeConfig, FakeGitRepository, FakePRRepository, use_fake_clis
+
+CONFIG = AIConfig(provider=ProviderType.CLAUDE, session=True)
+CONTEXT = GitContext(
+    current_branch=Branch(name="feature"),
+    target_branch=Branch(name="main"),
+    commits="abc1234 Change app",
+    diff=DIFF,
+    diff_stat=" app.py | 2 +-",
+)
+# Long enough for map-reduce to split it into several parts.
+MAP_CONTEXT = replace(CONTEXT, diff=DIFF * 40)
+
+
+class ClaudeSessionAdapterTest(unittest.TestCase):
+    """Runs the adapter against the stream-json mode of benchmarks/fakes/claude."""
+
+    def setUp(self) -> None:
+        self.log = use_fake_clis(self)
+        self.adapter = ClaudeSessionAdapter(Terminal())
+        self.addCleanup(self.adapter.close)
+
+    def _requests(self) -> list[dict[str, object]]:
+        return [json.loads(line) for line in self.log.read_text().splitlines()]
+
+    def _modes(self) -> list[object]:
+        return [request["mode"] for request in self._requests()]
+
+    def test_refinement_is_a_follow_up_turn_in_the_same_process(self) -> None:
+        draft = self.adapter.generate_pr(CONTEXT, CONFIG)
+        refinement = Refinement(title=draft.title, body=draft.body, feedback=("Shorter, please.",))
+        refined = self.adapter.generate_pr(CONTEXT, CONFIG, refinement)
+
+        self.assertEqual(draft.title, "feat: update feature")
+        self.assertEqual(refined.title, "feat: update feature (revision 1)")
+        first, second = self._requests()
+        self.assertEqual(first["pid"], second["pid"])
+        self.assertEqual(second["turn"], 1)
+        # The follow-up carries the feedback, not the diff again.
+        self.assertLess(second["chars"], first["chars"])
+
+    def test_refinement_turn_builds_the_one_shot_prompt(self) -> None:
+        for full_refine in (False, True):
+            with self.subTest(full_refine=full_refine):
+                config = CONFIG.model_copy(
+                    update={"map_reduce": True, "chunk_size": 1000, "full_refine": full_refine}
+                )
+                self.log.unlink(missing_ok=True)
+                adapter = ClaudeSessionAdapter(Terminal())
+                self.addCleanup(adapter.close)
+                draft = adapter.generate_pr(MAP_CONTEXT, config)
+                summaries = self._modes().count("summary")
+                refinement = Refinement(title=draft.title, body=draft.body, feedback=("Shorter.",))
+
+                session = self._refine(adapter, config, refinement)
+                modes = self._modes()
+                one_shot = ClaudeAdapter(Terminal())
+                expected = self._refine(one_shot, config, refinement)
+
+                self.assertGreater(summaries, 1)
+                self.assertEqual(modes.count("summary"), summaries)
+                self.assertEqual(modes.count("stream-json"), 2)
+                self.assertEqual(session, expected)
+                self.assertEqual(
+                    adapter.last_generation_stats().map_parts,
+                    one_shot.last_generation_stats().map_parts,
+                )
+
+    def _refine(self, adapter: ClaudeAdapter, config: AIConfig, refinement: Refinement) -> str:
+        """Refines a draft on MAP_CONTEXT and returns the prompt it was built from."""
+        with mock.patch.object(adapter, "_complete", wraps=adapter._complete) as complete:
+            adapter.generate_pr(MAP_CONTEXT, config, refinement)
+        return complete.call_args.args[1]
+
+    def test_close_ends_the_session(self) -> None:
+        self.adapter.generate_pr(CONTEXT, CONFIG)
+        session = self.adapter._session
+        assert session is not None
+        self.assertTrue(session.alive)
+
+        self.adapter.close()
+
+        self.assertFalse(session.alive)
+        self.assertIsNone(self.adapter._session)
+
+    def test_closing_the_service_closes_the_session(self) -> None:
+        git = FakeGitRepository()
+        service = PRGenerationService(self.adapter, git, FakePRRepository(), FakeConfig(ai=CONFIG))
+        service.generate_pr_draft(CONTEXT)
+        session = self.adapter._session
+        assert session is not None
+
+        service.close()
+
+        self.assertFalse(session.alive)
+
+    def test_error_result_raises_and_drops_the_session(self) -> None:
+        os.environ["FAKE_CLAUDE_FAIL"] = "1"
+
+        with self.assertRaisesRegex(PRGenerationException, "fake failure"):
+            self.adapter.generate_pr(CONTEXT, CONFIG)
+        self.assertIsNone(self.adapter._session)
+
+    def test_timeout_covers_the_whole_turn(self) -> None:
+        # Every chunk arrives well within the limit; the turn as a whole doesn't.
+        os.environ["FAKE_CLAUDE_DELAY"] = "0.1"
+        timeouts = TimeoutConfig(workflow=0, tools=(("claude", 0.5),))
+
+        start = time.monotonic()
+        with deadline_scope(timeouts), self.assertRaises(CommandTimeoutException):
+            self.adapter.generate_pr(CONTEXT, CONFIG)
+
+        self.assertLess(time.monotonic() - start, 1.5)
+        self.assertIsNone(self.adapter._session)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from floyd.adapters.inbound.daemon.client import (
+    DaemonClient,
+    RemoteGitRepository,
+    RemotePRGenerationService,
+    connect_daemon,
+)
+from floyd.adapters.inbound.daemon.protocol import check_private_dir, peer_uid
+from floyd.adapters.inbound.daemon.server import FloydDaemon
+from floyd.application.dto.task_progress import TaskProgress, TaskState
+from floyd.application.services.pr_generation_service import PRGenerationService
+from floyd.container import Container
+from floyd.domain.exceptions.pr.pr_already_exist_exception import PRAlreadyExistsException
+from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
+from tests.fakes import FakeAIService, FakeConfig, FakeGitRepository, FakePRRepository
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "needs Unix domain sockets")
+class DaemonProtocolTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # mkdtemp creates the directory with mode 0700.
+        self.directory = Path(tempfile.mkdtemp(prefix="floyd-test-"))
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.socket_path = self.directory / "daemon.sock"
+        self.git = FakeGitRepository()
+        self.pr_exists = False
+        self.requests: list[Path] = []
+
+        self.daemon = FloydDaemon(self.socket_path, self._container_for, idle_timeout=30)
+        thread = threading.Thread(target=self.daemon.serve, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(self.daemon.stop)
+
+        self.client = DaemonClient(self.socket_path, self.directory)
+        for _ in range(200):
+            if self.socket_path.exists():
+                break
+            threading.Event().wait(0.01)
+
+    def _container_for(self, cwd: Path, use_cache: bool) -> Container:
+        self.requests.append(cwd)
+        ai = FakeAIService()
+        prs = FakePRRepository(exists=self.pr_exists)
+        config = FakeConfig()
+        return Container(
+            ai_service=ai,
+            git_repository=self.git,
+            pr_repository=prs,
+            config=config,
+            pr_generation_service=PRGenerationService(ai, self.git, prs, config),
+        )
+
+    def test_ping(self) -> None:
+        self.assertIn(f"pid={os.getpid()}", self.client.call("daemon", "ping"))
+
+    def test_prepare_pr_streams_progress_and_returns_its_stats(self) -> None:
+        service = RemotePRGenerationService(self.client)
+        progress: list[TaskProgress] = []
+
+        preparation = service.prepare_pr("main", True, progress.append)
+
+        assert preparation.draft is not None
+        self.assertEqual(preparation.draft.title, "Change app")
+        self.assertEqual(preparation.context.current_branch.name, "feature")
+        self.assertIn(("generate", TaskState.DONE), [(p.name, p.state) for p in progress])
+        timings = {timing.name for timing in service.get_context_timings()}
+        self.assertEqual(timings, {"fetch", "current_branch", "commits", "diff"})
+        self.assertEqual(self.requests, [self.directory])
+
+    def test_domain_errors_keep_their_type(self) -> None:
+        self.pr_exists = True
+
+        with self.assertRaises(PRAlreadyExistsException) as raised:
+            RemotePRGenerationService(self.client).prepare_pr("main")
+        self.assertEqual(raised.exception.base_branch, "main")
+
+    def test_fetch_is_forwarded(self) -> None:
+        RemoteGitRepository(self.client).fetch("main", force=True)
+
+        self.assertEqual(self.git.calls, ["fetch main force=True"])
+
+    def test_rejects_methods_outside_the_allowed_list(self) -> None:
+        with self.assertRaises(UnexpectedException):
+            self.client.call("git", "__init__")
+        with self.assertRaises(UnexpectedException):
+            self.client.call("pr", "last_generation_stats")
+
+    def test_connect_only_through_a_private_directory(self) -> None:
+        os.environ["FLOYD_SOCKET"] = str(self.socket_path)
+        self.addCleanup(os.environ.pop, "FLOYD_SOCKET")
+        self.assertIsNotNone(connect_daemon(self.directory))
+
+        os.chmod(self.directory, 0o755)
+        self.addCleanup(os.chmod, self.directory, 0o700)
+        with self.assertRaises(PermissionError):
+            check_private_dir(self.directory)
+        self.assertIsNone(connect_daemon(self.directory))
+
+    @unittest.skipUnless(hasattr(socket, "SO_PEERCRED"), "needs SO_PEERCRED")
+    def test_reports_the_peer_uid(self) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(self.socket_path))
+            self.assertEqual(peer_uid(conn), os.getuid())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from floyd.adapters.outbound.ai.diff_budget import allocate_diff, estimate_tokens
+
+
+def _file_diff(path: str, lines: int = 3, hunks: int = 1) -> str:
+    header = (
+        f"diff --git a/{path} b/{path}\nindex 1111111..2222222 100644\n"
+        f"--- a/{path}\n+++ b/{path}\n"
+    )
+    body = "".join(
+        f"@@ -{number * 10},1 +{number * 10},{lines} @@\n context\n"
+        + "".join(f"+{path} line {line}\n" for line in range(lines))
+        for number in range(1, hunks + 1)
+    )
+    return header + body
+
+
+class AllocateDiffTest(unittest.TestCase):
+    def test_diff_within_budget_is_unchanged(self) -> None:
+        diff = _file_diff("app.py")
+
+        self.assertEqual(allocate_diff(diff, estimate_tokens(diff)), diff)
+
+    def test_dropped_hunks_leave_a_marker(self) -> None:
+        diff = _file_diff("big.py", lines=40, hunks=4) + _file_diff("small.py")
+
+        fitted = allocate_diff(diff, 400)
+
+        self.assertIn("+small.py line 2", fitted)
+        self.assertRegex(fitted, r"\[\.\.\. \d+ hunks? omitted \(\+\d+ -0\) \.\.\.\]")
+        self.assertNotIn("index 1111111", fitted)
+
+    def test_every_file_stays_listed(self) -> None:
+        paths = [f"src/module_{number}.py" for number in range(200)]
+        diff = "".join(_file_diff(path) for path in paths)
+
+        fitted = allocate_diff(diff, 3000)
+
+        for path in paths:
+            self.assertIn(path, fitted)
+        self.assertIn("diff --git a/src/module_0.py b/src/module_0.py\n", fitted)
+        self.assertTrue(fitted.endswith("\nsrc/module_199.py | +3 -0"))
+        self.assertRegex(fitted, r"\[\.\.\. \d+ more files, hunks omitted \.\.\.\]")
+        self.assertLess(estimate_tokens(fitted), 3000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+from floyd.adapters.outbound.ai.diff_minimizer import CollapseRenames, render_diff, split_diff
+from floyd.application.dto.ai_config import AIConfig
+from floyd.domain.value_objects.ai_provider import ProviderType
+
+MOVED = (
+    "diff --git a/old.txt b/old.txt\n"
+    "deleted file mode 100644\n"
+    "index 3b18e51..0000000\n"
+    "--- a/old.txt\n"
+    "+++ /dev/null\n"
+    "@@ -1 +0,0 @@\n"
+    "-hello\n"
+    "diff --git a/renamed.txt b/renamed.txt\n"
+    "new file mode 100644\n"
+    "index 0000000..3b18e51\n"
+    "--- /dev/null\n"
+    "+++ b/renamed.txt\n"
+    "@@ -0,0 +1 @@\n"
+    "+hello\n"
+)
+EMPTY = (
+    "diff --git a/gone.txt b/gone.txt\n"
+    "deleted file mode 100644\n"
+    "index e69de29..0000000\n"
+    "diff --git a/added.txt b/added.txt\n"
+    "new file mode 100644\n"
+    "index 0000000..e69de29\n"
+)
+
+
+def collapse(diff: str) -> str:
+    preamble, files = split_diff(diff)
+    return render_diff(preamble, CollapseRenames().apply(files))
+
+
+class CollapseRenamesTest(unittest.TestCase):
+    def test_names_of_different_lengths(self) -> None:
+        self.assertEqual(
+            collapse(MOVED),
+            "diff --git a/old.txt b/renamed.txt\nrename from old.txt\nrename to renamed.txt\n",
+        )
+
+    def test_empty_files_are_not_paired(self) -> None:
+        self.assertEqual(collapse(EMPTY), EMPTY)
+
+    def test_whitespace_is_opt_in(self) -> None:
+        self.assertNotIn("whitespace", AIConfig(provider=ProviderType.CLAUDE).minimize)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from floyd.adapters.outbound.git.diff_stat import format_stat, parse_patch_stat
+from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+
+QUOTED = (
+    'diff --git "a/caf\\303\\251 menu.txt" "b/caf\\303\\251 menu.txt"\n'
+    "--- \"a/caf\\303\\251 menu.txt\"\n"
+    "+++ \"b/caf\\303\\251 menu.txt\"\n"
+    "@@ -1,2 +1,2 @@\n"
+    " espresso\n"
+    "-latte\n"
+    "+flat white\n"
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=floyd", "-c", "user.email=floyd@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+class ParsePatchStatTest(unittest.TestCase):
+    def test_quoted_path_is_unquoted_and_counted(self) -> None:
+        (entry,) = parse_patch_stat(QUOTED)
+
+        self.assertEqual((entry.insertions, entry.deletions), (1, 1))
+        self.assertEqual(entry.path, '"caf\\303\\251 menu.txt"')
+
+    def test_lines_starting_like_headers_inside_a_hunk_are_counted(self) -> None:
+        diff = (
+            "diff --git a/notes.md b/notes.md\n"
+            "--- a/notes.md\n"
+            "+++ b/notes.md\n"
+            "@@ -1 +1,2 @@\n"
+            "--- a/old\n"
+            "+++ b/new\n"
+            "+diff --git a/x b/x\n"
+        )
+
+        (entry,) = parse_patch_stat(diff)
+
+        self.assertEqual((entry.path, entry.insertions, entry.deletions), ("notes.md", 2, 1))
+
+    def test_empty_diff_has_no_stat(self) -> None:
+        self.assertEqual(format_stat(parse_patch_stat("")), "")
+
+
+class SinglePassStatTest(unittest.TestCase):
+    """Checks the stat derived from the diff against `git diff --stat`."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.repo = Path(directory.name)
+
+        _git(self.repo, "init", "-b", "main")
+        (self.repo / "src").mkdir()
+        (self.repo / "src" / "app.py").write_text("".join(f"line {n}\n" for n in range(40)))
+        (self.repo / "src" / "old_name.py").write_text("".join(f"keep {n}\n" for n in range(20)))
+        (self.repo / "gone.txt").write_text("bye\n")
+        (self.repo / "logo.bin").write_bytes(bytes(range(256)))
+        _git(self.repo, "add", "-A")
+        _git(self.repo, "commit", "-m", "base")
+        _git(self.repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+
+        app = self.repo / "src" / "app.py"
+        app.write_text(app.read_text().replace("line 3\n", "line three\n") + "line 40\n")
+        _git(self.repo, "mv", "src/old_name.py", "src/new_name.py")
+        (self.repo / "src" / "new_name.py").write_text(
+            (self.repo / "src" / "new_name.py").read_text() + "added\n"
+        )
+        _git(self.repo, "rm", "-q", "gone.txt")
+        (self.repo / "logo.bin").write_bytes(bytes(range(255, -1, -1)) * 2)
+        (self.repo / "café menu.txt").write_text("espresso\n")
+        (self.repo / ("deeply/" * 8)).mkdir(parents=True)
+        (self.repo / ("deeply/" * 8) / "nested_module_with_a_long_name.py").write_text("x = 1\n")
+        _git(self.repo, "add", "-A")
+        _git(self.repo, "commit", "-m", "change")
+
+    def test_matches_git_diff_stat(self) -> None:
+        adapter = GitCLIAdapter(Terminal(), cwd=self.repo, path_rules=(), gitattributes=False)
+
+        _, stat = adapter.get_diff_with_stat("main")
+
+        expected = _git(self.repo, "diff", "--stat=80", "origin/main..HEAD").strip()
+        self.assertEqual(stat, expected)
+        self.assertIn("src/{old_name.py => new_name.py}", stat)
+        self.assertIn("Bin 256 -> 512 bytes", stat)
+
+
+if __name__ == "__main__":
+    unittest.main()
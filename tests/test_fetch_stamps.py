@@ -0,0 +1,120 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from floyd.adapters.outbound.git.fetch_stamps import STAMP_FILE, FetchStamps
+from floyd.adapters.outbound.git.git_cli_adapter import GitCLIAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+
+CLOCK = "floyd.adapters.outbound.git.fetch_stamps.time.time"
+REFS = ["refs/remotes/origin/main", "refs/remotes/origin/feature"]
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=floyd", "-c", "user.email=floyd@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+class FetchStampsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / STAMP_FILE
+
+    def test_touched_refs_are_fresh_until_the_ttl_passes(self) -> None:
+        stamps = FetchStamps(self.path)
+        self.assertEqual(stamps.stale(REFS, 60), REFS)
+
+        with mock.patch(CLOCK, return_value=1000.0):
+            stamps.touch(REFS[:1])
+            self.assertEqual(stamps.stale(REFS, 60), REFS[1:])
+        with mock.patch(CLOCK, return_value=1060.0):
+            self.assertEqual(stamps.stale(REFS, 60), REFS)
+
+    def test_no_ttl_means_always_stale(self) -> None:
+        stamps = FetchStamps(self.path)
+        stamps.touch(REFS)
+
+        self.assertEqual(stamps.stale(REFS, 0), REFS)
+
+    def test_unreadable_file_means_stale(self) -> None:
+        self.path.write_text("not json")
+        stamps = FetchStamps(self.path)
+
+        self.assertEqual(stamps.stale(REFS, 60), REFS)
+        stamps.touch(REFS)
+        self.assertEqual(stamps.stale(REFS, 60), [])
+        self.assertEqual([path.name for path in self.path.parent.iterdir()], [STAMP_FILE])
+
+
+class TargetedFetchTest(unittest.TestCase):
+    """Fetches from a local origin with a real git."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        root = Path(directory.name)
+        self.origin = root / "origin.git"
+        self.work = root / "work"
+        self.origin.mkdir()
+        self.work.mkdir()
+
+        _git(self.origin, "init", "--bare", "-b", "main")
+        _git(self.work, "init", "-b", "main")
+        _git(self.work, "commit", "--allow-empty", "-m", "init")
+        _git(self.work, "remote", "add", "origin", str(self.origin))
+        _git(self.work, "push", "origin", "main", "main:feature")
+        _git(self.work, "fetch", "origin")
+        _git(self.work, "checkout", "-b", "feature", "--track", "origin/feature")
+
+        self.terminal = Terminal()
+
+    def _fetches(self, adapter: GitCLIAdapter, **kwargs: object) -> list[list[str]]:
+        with mock.patch.object(self.terminal, "run", wraps=self.terminal.run) as run:
+            adapter.fetch("main", **kwargs)
+        return [call.args[0] for call in run.call_args_list if call.args[0][1] == "fetch"]
+
+    def test_fetches_the_base_and_upstream_branches_once_per_ttl(self) -> None:
+        adapter = GitCLIAdapter(self.terminal, fetch_ttl=60, cwd=self.work)
+
+        first = self._fetches(adapter)
+        second = self._fetches(adapter)
+        forced = self._fetches(adapter, force=True)
+
+        self.assertEqual(
+            first,
+            [
+                [
+                    "git",
+                    "fetch",
+                    "origin",
+                    "--no-tags",
+                    "+refs/heads/main:refs/remotes/origin/main",
+                    "+refs/heads/feature:refs/remotes/origin/feature",
+                ]
+            ],
+        )
+        self.assertEqual(second, [])
+        self.assertEqual(forced, first)
+        self.assertTrue((self.work / ".git" / STAMP_FILE).exists())
+
+    def test_deleted_upstream_does_not_block_the_base_branch(self) -> None:
+        _git(self.origin, "branch", "-D", "feature")
+        adapter = GitCLIAdapter(self.terminal, fetch_ttl=60, cwd=self.work)
+
+        fetches = self._fetches(adapter)
+
+        self.assertEqual(len(fetches), 2)
+        self.assertEqual(fetches[1][4:], ["+refs/heads/main:refs/remotes/origin/main"])
+        stamps = FetchStamps(self.work / ".git" / STAMP_FILE)
+        self.assertEqual(stamps.stale(REFS, 60), REFS[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import json
+import os
+import unittest
+
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.application.dto.refinement import Refinement
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.exceptions.domain_exception import DomainException
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+from tests.fakes import use_fake_clis
+
+FILES = [f"src/module_{number}.py" for number in range(12)]
+CONFIG = AIConfig(provider=ProviderType.CLAUDE, map_reduce=True, chunk_size=2000, map_jobs=3)
+
+
+def _file_diff(path: str) -> str:
+    added = "".join(f"+value_{line} = {line}\n" for line in range(20))
+    return f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n@@ -0,0 +1,20 @@\n{added}"
+
+
+CONTEXT = GitContext(
+    current_branch=Branch(name="feature"),
+    target_branch=Branch(name="main"),
+    commits="abc1234 Add modules",
+    diff="".join(_file_diff(path) for path in FILES),
+    diff_stat=f" {len(FILES)} files changed",
+)
+
+
+class MapReduceTest(unittest.TestCase):
+    """Runs map-reduce generation against the one-shot mode of benchmarks/fakes/claude."""
+
+    def setUp(self) -> None:
+        self.log = use_fake_clis(self)
+        self.adapter = ClaudeAdapter(Terminal())
+
+    def _modes(self) -> list[str]:
+        if not self.log.exists():
+            return []
+        return [json.loads(line)["mode"] for line in self.log.read_text().splitlines()]
+
+    def test_draft_is_written_from_the_part_summaries(self) -> None:
+        pr = self.adapter.generate_pr(CONTEXT, CONFIG)
+
+        stats = self.adapter.last_generation_stats()
+        self.assertGreater(stats.map_parts, 1)
+        self.assertEqual(self._modes().count("summary"), stats.map_parts)
+        for path in FILES:
+            self.assertIn(f"- {path}", pr.body)
+
+    def test_full_refinement_reuses_the_summaries(self) -> None:
+        config = CONFIG.model_copy(update={"full_refine": True})
+        draft = self.adapter.generate_pr(CONTEXT, config)
+        summaries = self._modes().count("summary")
+
+        refinement = Refinement(title=draft.title, body=draft.body, feedback=("Shorter.",))
+        self.adapter.generate_pr(CONTEXT, config, refinement)
+
+        self.assertEqual(self._modes().count("summary"), summaries)
+        self.assertEqual(self._modes().count("print"), 2)
+
+    def test_excerpt_refinement_skips_the_map_step(self) -> None:
+        draft = self.adapter.generate_pr(CONTEXT, CONFIG)
+        refinement = Refinement(title=draft.title, body=draft.body, feedback=("Shorter.",))
+        self.adapter.generate_pr(CONTEXT, CONFIG, refinement)
+
+        self.assertEqual(self.adapter.last_generation_stats().map_parts, 0)
+
+    def test_failing_part_fails_the_generation(self) -> None:
+        os.environ["FAKE_CLAUDE_FAIL_PART"] = "2"
+
+        with self.assertRaises(DomainException):
+            self.adapter.generate_pr(CONTEXT, CONFIG)
+        self.assertNotIn("print", self._modes())
+
+
+if __name__ == "__main__":
+    unittest.main()
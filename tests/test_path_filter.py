@@ -0,0 +1,63 @@
+import unittest
+
+from floyd.adapters.outbound.git.diff_stat import format_stat, parse_numstat, parse_patch_stat
+from floyd.adapters.outbound.git.path_classifier import DiffPathFilter, PathClassifier
+
+RENAMED = (
+    "diff --git a/foo.txt b/vendor/barbaz.txt\n"
+    "similarity index 80%\n"
+    "rename from foo.txt\n"
+    "rename to vendor/barbaz.txt\n"
+    "index 9495... 1234...\n"
+    "--- a/foo.txt\n"
+    "+++ b/vendor/barbaz.txt\n"
+    "@@ -1,2 +1,3 @@\n"
+    " a\n"
+    " b\n"
+    "+c\n"
+    "diff --git a/app.py b/app.py\n"
+    "--- a/app.py\n"
+    "+++ b/app.py\n"
+    "@@ -1 +1 @@\n"
+    "-old\n"
+    "+new\n"
+)
+# `git diff --raw --numstat -z` for the same change, plus an excluded lock file.
+NUMSTAT = (
+    ":100644 100644 9495... 1234... R080\0foo.txt\0vendor/barbaz.txt\0"
+    ":100644 100644 aaaa... bbbb... M\0app.py\0"
+    ":100644 100644 cccc... dddd... M\0yarn.lock\0"
+    "1\t0\t\0foo.txt\0vendor/barbaz.txt\0"
+    "1\t1\tapp.py\0"
+    "1\t0\tyarn.lock\0"
+)
+
+
+class DiffPathFilterTest(unittest.TestCase):
+    def test_renamed_file_is_classified_by_its_new_path(self) -> None:
+        path_filter = DiffPathFilter(PathClassifier(["vendor/"]))
+
+        chunks = (chunk for chunk in (RENAMED[:100], RENAMED[100:]))
+        diff = "".join(path_filter.filter(chunks))
+
+        self.assertIn("rename to vendor/barbaz.txt\n", diff)
+        self.assertNotIn("+c\n", diff)
+        self.assertIn("+new\n", diff)
+        self.assertEqual(path_filter.omitted, 1)
+        entries = parse_patch_stat(diff)
+        self.assertEqual([entry.omitted for entry in entries], ["excluded", ""])
+
+    def test_numstat_marks_omitted_files(self) -> None:
+        classifier = PathClassifier(["vendor/", "*.lock"])
+
+        entries = parse_numstat(NUMSTAT, classifier.classify)
+
+        self.assertEqual(
+            [(entry.path, entry.omitted) for entry in entries],
+            [("foo.txt => vendor/barbaz.txt", "excluded"), ("app.py", ""), ("yarn.lock", "excluded")],
+        )
+        self.assertIn("yarn.lock                    | 1 + (excluded, not in diff)", format_stat(entries))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+
+from floyd.application.dto.task_progress import TaskProgress, TaskState
+from floyd.application.services.git_context_collector import (
+    ConcurrentGitContextCollector,
+    SequentialGitContextCollector,
+)
+from floyd.application.services.pr_generation_service import PRGenerationService
+from floyd.application.services.task_graph import TaskGraph
+from floyd.domain.exceptions.git.invalid_branch_exception import InvalidBranchException
+from floyd.domain.exceptions.pr.pr_already_exist_exception import PRAlreadyExistsException
+from tests.fakes import FakeAIService, FakeConfig, FakeGitRepository, FakePRRepository
+
+
+def _service(
+    git: FakeGitRepository,
+    prs: FakePRRepository | None = None,
+    ai: FakeAIService | None = None,
+    speculative: bool = True,
+) -> PRGenerationService:
+    return PRGenerationService(
+        ai_service=ai or FakeAIService(),
+        git_repository=git,
+        pr_repository=prs or FakePRRepository(),
+        config=FakeConfig(),
+        context_collector=ConcurrentGitContextCollector(git),
+        speculative_generation=speculative,
+    )
+
+
+class TaskGraphTest(unittest.TestCase):
+
+    def test_runs_tasks_after_their_dependencies(self) -> None:
+        graph = TaskGraph(max_workers=1)
+        order: list[str] = []
+        graph.add("b", lambda r: order.append("b") or r["a"] + 1, ("a",))
+        graph.add("a", lambda _: order.append("a") or 1)
+
+        results = graph.run()
+
+        self.assertEqual(order, ["a", "b"])
+        self.assertEqual(results["b"], 2)
+
+    def test_first_failure_skips_dependents(self) -> None:
+        graph = TaskGraph()
+        graph.add("fail", lambda _: 1 / 0)
+        graph.add("after", lambda _: None, ("fail",))
+        states: dict[str, TaskState] = {}
+
+        def on_progress(progress: TaskProgress) -> None:
+            states[progress.name] = progress.state
+
+        with self.assertRaises(ZeroDivisionError):
+            graph.run(on_progress)
+        self.assertEqual(states, {"fail": TaskState.FAILED, "after": TaskState.SKIPPED})
+
+    def test_rejects_cycles_and_unknown_dependencies(self) -> None:
+        cycle = TaskGraph()
+        cycle.add("a", lambda _: None, ("b",))
+        cycle.add("b", lambda _: None, ("a",))
+        with self.assertRaisesRegex(ValueError, "cycle"):
+            cycle.run()
+
+        unknown = TaskGraph()
+        unknown.add("a", lambda _: None, ("missing",))
+        with self.assertRaisesRegex(ValueError, "unknown task"):
+            unknown.run()
+
+
+class PreparePRTest(unittest.TestCase):
+
+    def test_builds_context_and_draft(self) -> None:
+        git = FakeGitRepository()
+        preparation = _service(git).prepare_pr("main", fresh=True)
+
+        self.assertEqual(preparation.context.current_branch.name, "feature")
+        self.assertEqual(preparation.context.diff_stat, " app.py | 2 +-")
+        self.assertIsNotNone(preparation.draft)
+        assert preparation.draft is not None
+        self.assertEqual(preparation.draft.head_branch, "feature")
+        self.assertIn("fetch main force=True", git.calls)
+        # The fetch waits for branch validation; the diff waits for the fetch.
+        self.assertLess(git.calls.index("branch_exists main"), git.calls.index("fetch main force=True"))
+        self.assertLess(git.calls.index("fetch main force=True"), git.calls.index("get_diff"))
+
+    def test_reports_git_timings_through_the_collector(self) -> None:
+        git = FakeGitRepository()
+        service = _service(git)
+        service.prepare_pr("main")
+
+        names = sorted(timing.name for timing in service.get_context_timings())
+        self.assertEqual(names, ["commits", "current_branch", "diff", "fetch"])
+
+    def test_same_branch_fails_before_fetching(self) -> None:
+        git = FakeGitRepository(branch="main")
+
+        with self.assertRaises(InvalidBranchException):
+            _service(git).prepare_pr("main")
+        self.assertFalse(any(call.startswith("fetch") for call in git.calls))
+
+    def test_open_pr_cancels_the_speculative_draft(self) -> None:
+        ai = FakeAIService(block=True)
+        # `gh pr list` answers only once the draft is being generated.
+        prs = FakePRRepository(exists=True, before_answer=lambda: ai.started.wait(5))
+
+        with self.assertRaises(PRAlreadyExistsException):
+            _service(FakeGitRepository(), prs, ai).prepare_pr("main")
+        self.assertTrue(ai.cancelled.is_set())
+
+    def test_without_speculation_the_draft_waits_for_the_pr_check(self) -> None:
+        ai = FakeAIService()
+
+        with self.assertRaises(PRAlreadyExistsException):
+            _service(FakeGitRepository(), FakePRRepository(exists=True), ai, speculative=False).prepare_pr("main")
+        self.assertEqual(ai.contexts, [])
+
+    def test_no_changes_skips_generation(self) -> None:
+        ai = FakeAIService()
+        preparation = _service(FakeGitRepository(diff=""), ai=ai).prepare_pr("main")
+
+        self.assertFalse(preparation.context.has_changes())
+        self.assertIsNone(preparation.draft)
+        self.assertEqual(ai.contexts, [])
+
+    def test_sequential_collector_gives_the_same_context(self) -> None:
+        git = FakeGitRepository()
+        context = SequentialGitContextCollector(git).collect("main")
+        prepared = _service(FakeGitRepository()).prepare_pr("main").context
+
+        self.assertEqual(context, prepared)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import time
+import unittest
+
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.ai.gemini_adapter import GeminiAdapter
+from floyd.adapters.outbound.ai.racing_adapter import RacingAIAdapter
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.ai_config import AIConfig
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+from tests.fakes import DIFF, use_fake_clis
+
+CONFIG = AIConfig(
+    provider=ProviderType.CLAUDE,
+    model="opus",
+    race=(ProviderType.CLAUDE, ProviderType.GEMINI),
+)
+CONTEXT = GitContext(
+    current_branch=Branch(name="feature"),
+    target_branch=Branch(name="main"),
+    commits="abc1234 Change app",
+    diff=DIFF,
+    diff_stat=" app.py | 2 +-",
+)
+
+
+class RacingAIAdapterTest(unittest.TestCase):
+    """Races the fake `claude` and `gemini` from benchmarks/fakes."""
+
+    def setUp(self) -> None:
+        use_fake_clis(self)
+        terminal = Terminal()
+        self.adapter = RacingAIAdapter(
+            {
+                ProviderType.CLAUDE: ClaudeAdapter(terminal),
+                ProviderType.GEMINI: GeminiAdapter(terminal),
+            }
+        )
+
+    def _attempts(self) -> dict[str, tuple[bool, bool]]:
+        return {
+            attempt.name: (attempt.failed, attempt.cancelled)
+            for attempt in self.adapter.last_generation_stats().attempts
+        }
+
+    def test_first_draft_wins_and_the_slower_provider_is_cancelled(self) -> None:
+        os.environ["FAKE_GEMINI_STARTUP"] = "10"
+
+        start = time.monotonic()
+        pr = self.adapter.generate_pr(CONTEXT, CONFIG)
+
+        self.assertLess(time.monotonic() - start, 5)
+        self.assertEqual(pr.head_branch, "feature")
+        self.assertEqual(self.adapter.last_generation_stats().provider, "claude")
+        self.assertEqual(self._attempts(), {"claude": (False, False), "gemini": (False, True)})
+
+    def test_failed_provider_leaves_the_race_to_the_others(self) -> None:
+        os.environ["FAKE_CLAUDE_FAIL"] = "1"
+
+        self.adapter.generate_commit(DIFF, CONFIG)
+
+        self.assertEqual(self.adapter.last_generation_stats().provider, "gemini")
+        self.assertEqual(self._attempts(), {"claude": (True, False), "gemini": (False, False)})
+
+    def test_all_providers_failing_raises_every_error(self) -> None:
+        os.environ["FAKE_CLAUDE_FAIL"] = "1"
+        os.environ["FAKE_GEMINI_FAIL"] = "1"
+
+        with self.assertRaisesRegex(PRGenerationException, "All providers failed") as raised:
+            self.adapter.generate_pr(CONTEXT, CONFIG)
+        self.assertIn("claude: Claude Code: fake failure", raised.exception.message)
+        self.assertIn("gemini: Gemini CLI: fake failure", raised.exception.message)
+        self.assertEqual(self.adapter.last_generation_stats().provider, "")
+
+    def test_only_the_primary_provider_keeps_the_model(self) -> None:
+        configs = {
+            provider: self.adapter._provider_config(CONFIG, provider)
+            for provider in (ProviderType.CLAUDE, ProviderType.GEMINI)
+        }
+
+        self.assertEqual(configs[ProviderType.CLAUDE].model, "opus")
+        self.assertEqual(configs[ProviderType.GEMINI].model, "")
+        self.assertEqual(configs[ProviderType.GEMINI].race, ())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from floyd.adapters.outbound.git.ref_reader import GitRefReader
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=floyd", "-c", "user.email=floyd@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class GitRefReaderTest(unittest.TestCase):
+    """Compares the reader's answers with git's on real repositories."""
+
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = Path(directory.name).resolve()
+        self.repo = self.root / "repo"
+        self.repo.mkdir()
+
+        _git(self.repo, "init", "-b", "main")
+        _git(self.repo, "commit", "--allow-empty", "-m", "init")
+        _git(self.repo, "update-ref", "refs/remotes/origin/main", "HEAD")
+        _git(self.repo, "branch", "feature")
+
+    def test_branch_and_loose_refs(self) -> None:
+        reader = GitRefReader(self.repo)
+
+        self.assertIs(reader.is_repo(), True)
+        self.assertEqual(reader.current_branch(), "main")
+        self.assertIs(reader.ref_exists("refs/heads/feature"), True)
+        self.assertIs(reader.ref_exists("refs/remotes/origin/main"), True)
+        self.assertIs(reader.ref_exists("refs/heads/missing"), False)
+
+    def test_packed_refs(self) -> None:
+        _git(self.repo, "pack-refs", "--all")
+        reader = GitRefReader(self.repo)
+
+        self.assertFalse((self.repo / ".git" / "refs" / "heads" / "feature").exists())
+        self.assertIs(reader.ref_exists("refs/heads/feature"), True)
+
+        _git(self.repo, "branch", "-D", "feature")
+        self.assertIs(reader.ref_exists("refs/heads/feature"), False)
+
+    def test_detached_head_has_no_branch(self) -> None:
+        _git(self.repo, "checkout", "--detach")
+
+        self.assertEqual(GitRefReader(self.repo).current_branch(), "")
+
+    def test_linked_worktree_shares_the_common_dir(self) -> None:
+        worktree = self.root / "worktree"
+        _git(self.repo, "worktree", "add", str(worktree), "feature")
+        (worktree / "sub").mkdir()
+        reader = GitRefReader(worktree / "sub")
+
+        self.assertEqual(reader.current_branch(), "feature")
+        self.assertEqual(reader.work_tree(), worktree)
+        self.assertEqual(
+            reader.common_dir(), Path(_git(worktree, "rev-parse", "--git-common-dir")).resolve()
+        )
+        self.assertIs(reader.ref_exists("refs/remotes/origin/main"), True)
+
+    def test_outside_a_repository(self) -> None:
+        outside = self.root / "outside"
+        outside.mkdir()
+
+        self.assertIs(GitRefReader(outside).is_repo(), False)
+
+    def test_defers_to_git_when_unsure(self) -> None:
+        reader = GitRefReader(self.repo)
+
+        self.assertIsNone(reader.ref_exists("refs/heads/../../config"))
+        with mock.patch.dict(os.environ, {"GIT_DIR": str(self.repo / ".git")}):
+            self.assertIsNone(reader.is_repo())
+            self.assertIsNone(reader.current_branch())
+
+        _git(self.repo, "config", "extensions.refStorage", "reftable")
+        self.assertIsNone(GitRefReader(self.repo).current_branch())
+
+
+if __name__ == "__main__":
+    unittest.main()
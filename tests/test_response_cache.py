@@ -0,0 +1,134 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from floyd.adapters.outbound.ai.claude_adapter import ClaudeAdapter
+from floyd.adapters.outbound.ai.response_cache import ResponseCache
+from floyd.application.dto.ai_config import AIConfig
+from floyd.domain.entities.git_context import GitContext
+from floyd.domain.exceptions.pr.pr_generation_exception import PRGenerationException
+from floyd.domain.value_objects.ai_provider import ProviderType
+from floyd.domain.value_objects.branch import Branch
+from tests.fakes import DIFF, FakeTerminal
+
+CONFIG = AIConfig(provider=ProviderType.CLAUDE)
+CONTEXT = GitContext(
+    current_branch=Branch(name="feature"),
+    target_branch=Branch(name="main"),
+    commits="abc1234 Change app",
+    diff=DIFF,
+    diff_stat=" app.py | 2 +-",
+)
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = Path(tempfile.mkdtemp(prefix="floyd-test-"))
+
+    def _files(self) -> list[str]:
+        return sorted(path.name for path in (self.directory / "responses").iterdir())
+
+    def test_round_trip(self) -> None:
+        cache = ResponseCache(self.directory)
+        key = cache.key("claude", "", "prompt")
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "TITLE: t\nBODY: b")
+
+        self.assertEqual(cache.get(key), "TITLE: t\nBODY: b")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_key_depends_on_provider_model_and_prompt(self) -> None:
+        cache = ResponseCache(self.directory)
+        keys = {
+            cache.key("claude", "", "prompt"),
+            cache.key("gemini", "", "prompt"),
+            cache.key("claude", "opus", "prompt"),
+            cache.key("claude", "", "other"),
+        }
+        self.assertEqual(len(keys), 4)
+
+    def test_expired_entry_is_a_miss_and_removed(self) -> None:
+        cache = ResponseCache(self.directory, ttl=60)
+        key = cache.key("claude", "", "prompt")
+        with mock.patch("floyd.adapters.outbound.ai.response_cache.time.time", return_value=0.0):
+            cache.put(key, "answer")
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(self._files(), [])
+
+    def test_oldest_entries_are_evicted_past_the_size_limit(self) -> None:
+        cache = ResponseCache(self.directory, max_bytes=400)
+        keys = [cache.key("claude", "", str(number)) for number in range(3)]
+        for number, key in enumerate(keys):
+            cache.put(key, os.urandom(150).hex())
+            path = self.directory / "responses" / f"{key}.z"
+            os.utime(path, (number, number))
+
+        cache.put(cache.key("claude", "", "last"), os.urandom(150).hex())
+
+        self.assertIsNone(cache.get(keys[0]))
+        self.assertLessEqual(
+            sum(path.stat().st_size for path in (self.directory / "responses").iterdir()), 400
+        )
+
+    def test_bypass_reads_nothing_but_still_writes(self) -> None:
+        key = ResponseCache(self.directory).key("claude", "", "prompt")
+        ResponseCache(self.directory, bypass=True).put(key, "answer")
+
+        self.assertIsNone(ResponseCache(self.directory, bypass=True).get(key))
+        self.assertEqual(ResponseCache(self.directory).get(key), "answer")
+
+    def test_concurrent_writers_leave_no_temp_files(self) -> None:
+        cache = ResponseCache(self.directory)
+        key = cache.key("claude", "", "prompt")
+        answers = [f"answer {number} " * 1000 for number in range(8)]
+
+        threads = [threading.Thread(target=cache.put, args=(key, answer)) for answer in answers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertIn(cache.get(key), answers)
+        self.assertEqual(self._files(), [f"{key}.z"])
+
+
+class CachedGenerationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache = ResponseCache(Path(tempfile.mkdtemp(prefix="floyd-test-")))
+
+    def test_second_generation_is_served_from_the_cache(self) -> None:
+        terminal = FakeTerminal("TITLE: feat: change app\nBODY: Changes app.py.")
+        adapter = ClaudeAdapter(terminal, self.cache)
+
+        first = adapter.generate_pr(CONTEXT, CONFIG)
+        second = adapter.generate_pr(CONTEXT, CONFIG)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(terminal.prompts), 1)
+        self.assertTrue(adapter.last_generation_stats().cached)
+
+    def test_draft_with_an_invalid_title_is_not_cached(self) -> None:
+        terminal = FakeTerminal(f"TITLE: {'x' * 300}\nBODY: Too long.")
+        adapter = ClaudeAdapter(terminal, self.cache)
+
+        for _ in range(2):
+            with self.assertRaisesRegex(PRGenerationException, "longer than 256"):
+                adapter.generate_pr(CONTEXT, CONFIG)
+
+        self.assertEqual(len(terminal.prompts), 2)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_empty_title_is_a_generation_error(self) -> None:
+        adapter = ClaudeAdapter(FakeTerminal("TITLE:\nBODY: No title."), self.cache)
+
+        with self.assertRaisesRegex(PRGenerationException, "cannot be empty"):
+            adapter.generate_commit(DIFF, CONFIG)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.dto.timeout_config import TimeoutConfig
+from floyd.application.services.deadline import deadline_scope
+from floyd.domain.exceptions.terminal.command_timeout_exception import (
+    CommandTimeoutException,
+)
+
+TIMEOUTS = TimeoutConfig(command=0.3, workflow=0)
+
+
+def _running(pid: int) -> bool:
+    # A killed child of an exited shell may linger as a zombie until reaped.
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return False
+    return stat.rsplit(")", 1)[1].split()[0] != "Z"
+
+
+@unittest.skipUnless(hasattr(os, "killpg") and Path("/proc/self").exists(), "needs process groups")
+class TerminalTimeoutTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.pid_file = Path(directory.name) / "pid"
+        # The shell waits on a background child, which must die with it.
+        self.command = ["sh", "-c", f"sleep 30 >/dev/null 2>&1 & echo $! > {self.pid_file}; wait"]
+
+    def _child(self) -> int:
+        return int(self.pid_file.read_text())
+
+    def _assert_killed(self, start: float) -> None:
+        self.assertLess(time.monotonic() - start, 5)
+        deadline = time.monotonic() + 2
+        while _running(self._child()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(_running(self._child()))
+
+    def test_run_kills_the_whole_process_group(self) -> None:
+        start = time.monotonic()
+        with deadline_scope(TIMEOUTS), self.assertRaises(CommandTimeoutException):
+            Terminal().run(self.command)
+
+        self._assert_killed(start)
+
+    def test_stream_kills_the_whole_process_group(self) -> None:
+        start = time.monotonic()
+        with deadline_scope(TIMEOUTS), self.assertRaises(CommandTimeoutException):
+            for _ in Terminal().stream(self.command):
+                pass
+
+        self._assert_killed(start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import json
+import threading
+import unittest
+from pathlib import Path
+
+from floyd.adapters.outbound.utils.terminal import Terminal
+from floyd.application.services.tracing import (
+    Tracer,
+    process_span,
+    trace_span,
+    tracing_scope,
+)
+from floyd.domain.exceptions.terminal.unexpected_exception import UnexpectedException
+
+
+class TracingTest(unittest.TestCase):
+    def test_spans_are_no_ops_without_a_tracer(self) -> None:
+        with trace_span("phase") as span:
+            self.assertFalse(span)
+            span.set(ignored=True)
+
+        self.assertFalse(process_span(["git", "diff"]))
+
+    def test_process_spans_are_named_after_the_command(self) -> None:
+        tracer = Tracer()
+        with tracing_scope(tracer):
+            for argv in (["git", "diff", "--stat"], ["/usr/bin/gh", "pr", "list"], ["claude", "-p"]):
+                with process_span(argv):
+                    pass
+            with process_span("sleep 0.1"):
+                pass
+
+        self.assertEqual(
+            [span.name for span in tracer.spans], ["git diff", "gh pr", "claude", "sleep"]
+        )
+        self.assertEqual(tracer.spans[-1].args["argv"], ["sleep", "0.1"])
+
+    def test_summary_groups_spans_and_counts_failures(self) -> None:
+        tracer = Tracer()
+        with tracing_scope(tracer):
+            with trace_span("read", "task"):
+                pass
+            with self.assertRaises(ValueError), trace_span("read", "task"):
+                raise ValueError
+            with trace_span("prepare_pr"):
+                pass
+
+        rows = [(row.category, row.name, row.calls, row.failures) for row in tracer.summary()]
+
+        self.assertEqual(rows, [("phase", "prepare_pr", 1, 0), ("task", "read", 2, 1)])
+        self.assertEqual(tracer.spans[1].args["error"], "ValueError")
+
+    def test_terminal_records_exit_code_and_byte_counts(self) -> None:
+        tracer = Tracer()
+        with tracing_scope(tracer):
+            Terminal().run(["cat"], input_data="hello")
+            with self.assertRaises(UnexpectedException):
+                Terminal().run(["sh", "-c", "echo oops >&2; exit 3"])
+
+        ok, failed = tracer.spans
+        self.assertEqual(
+            {key: ok.args[key] for key in ("exit_code", "stdin_bytes", "stdout_bytes")},
+            {"exit_code": 0, "stdin_bytes": 5, "stdout_bytes": 5},
+        )
+        self.assertEqual((failed.args["exit_code"], failed.args["stderr_bytes"]), (3, 5))
+        self.assertEqual(failed.args["error"], "UnexpectedException")
+
+    def test_chrome_trace_puts_each_thread_on_its_own_track(self) -> None:
+        tracer = Tracer()
+
+        def work() -> None:
+            with tracing_scope(tracer), trace_span("worker", "task", path=Path("a")):
+                pass
+
+        with tracing_scope(tracer), trace_span("main"):
+            thread = threading.Thread(target=work, name="floyd-worker")
+            thread.start()
+            thread.join()
+
+        trace = json.loads(json.dumps(tracer.chrome_trace()))
+        slices = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+        names = {
+            event["tid"]: event["args"]["name"]
+            for event in trace["traceEvents"]
+            if event["name"] == "thread_name"
+        }
+
+        self.assertNotEqual(slices["main"]["tid"], slices["worker"]["tid"])
+        self.assertEqual(names[slices["worker"]["tid"]], "floyd-worker")
+        self.assertEqual(slices["worker"]["args"], {"path": "a"})
+        self.assertGreaterEqual(slices["main"]["dur"], slices["worker"]["dur"])
+
+
+if __name__ == "__main__":
+    unittest.main()